@@ -0,0 +1,81 @@
+"""
+메트릭 수렴 판정 (조기 종료)
+
+공정성/nice 테스트는 모든 스레드가 끝나기 전 구간을 측정하므로
+고정된 tick 예산 대신 주요 메트릭이 안정되면 멈출 수 있음.
+Simulator.run(stop=ConvergenceCriterion(...))으로 사용:
+확인 지점마다 추적하는 메트릭 하나만 계산하고 (calculate_metric, 필요한 열만 읽음),
+최근 window tick 동안의 값이
+모두 상대 오차 tolerance 안에 있으면 수렴으로 판정.
+"""
+
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from analysis.insights import calculate_metric
+from scheduler.thread import Thread
+
+# 수렴 판정을 지원하는 메트릭 (스레드가 끝나기 전에도 안정값이 있는 비율/지수)
+CONVERGENCE_METRICS = ('cpu_time_ratio', 'fairness', 'cv_wait')
+
+# 기본 판정 기준: 최근 2000 tick 동안 값의 변동폭이 1% 이내
+DEFAULT_TOLERANCE = 0.01
+DEFAULT_WINDOW = 2000
+
+
+class ConvergenceCriterion:
+    """
+    주요 메트릭 수렴 조건 (StopCondition)
+
+    실행마다 새로 만들어 사용 (지금까지 본 값을 기억함).
+    """
+
+    def __init__(self, metric: str, tolerance: float = DEFAULT_TOLERANCE,
+                 window: int = DEFAULT_WINDOW, min_ticks: int = 0):
+        """
+        Args:
+            metric: 추적할 메트릭 (CONVERGENCE_METRICS)
+            tolerance: 허용 상대 변동폭 ((최대 - 최소) / max(|최대|, |최소|))
+            window: 변동폭을 보는 최근 구간 길이 (ticks)
+            min_ticks: 이 tick 전에는 수렴으로 판정하지 않음
+        """
+        if metric not in CONVERGENCE_METRICS:
+            raise ValueError(f"Unsupported convergence metric: {metric}")
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be >= 0: {tolerance}")
+        if window < 1:
+            raise ValueError(f"window must be >= 1: {window}")
+        self.metric = metric
+        self.tolerance = tolerance
+        self.window = window
+        self.min_ticks = min_ticks
+        self.converged_at: Optional[int] = None
+        # (tick, 값): 가장 오래된 항목은 window 시작 이전의 마지막 값
+        self._samples: Deque[Tuple[int, float]] = deque()
+
+    @property
+    def settings(self) -> Tuple[str, float, int, int]:
+        """판정 기준 (metric, tolerance, window, min_ticks), 결과 캐시 키에 사용"""
+        return self.metric, self.tolerance, self.window, self.min_ticks
+
+    def __call__(self, threads: List[Thread], tick: int) -> bool:
+        """tick 직전까지 정산된 스레드로 메트릭 값을 추가하고 수렴 여부 반환"""
+        value = calculate_metric(threads, self.metric)
+        if value is None:
+            # 아직 값이 없음 (예: 한쪽 nice 그룹이 도착 전) → 처음부터 다시
+            self._samples.clear()
+            return False
+
+        samples = self._samples
+        samples.append((tick, float(value)))
+        start = tick - self.window
+        while len(samples) >= 2 and samples[1][0] <= start:
+            samples.popleft()
+        if tick < self.min_ticks or samples[0][0] > start:
+            return False
+
+        values = [v for _, v in samples]
+        high, low = max(values), min(values)
+        if high - low > self.tolerance * max(abs(high), abs(low)):
+            return False
+        self.converged_at = tick
+        return True
@@ -20,11 +20,32 @@
     - fairness: Jain's Fairness Index (높을수록 좋음)
     - starvation_pct: 실행 안된 스레드 비율 (낮을수록 좋음)
 """
-from typing import List, Dict
+from operator import mul
+from typing import List, Dict, Optional, Union
 import numpy as np
 from scipy import stats
 from scheduler.thread import Thread
-from scheduler.cfs import CFSScheduler
+from scheduler.cfs import PRIO_TO_WEIGHT
+from scheduler.thread_table import ThreadTable, thread_columns
+
+# 메트릭 분류 (cpu_time_ratio는 단순 비교 불가, 측정용 메트릭)
+LOWER_IS_BETTER_METRICS = ['avg_wait', 'avg_turnaround', 'context_switches',
+                           'cv_wait', 'p99_wait', 'worst_ratio', 'starvation_pct']
+HIGHER_IS_BETTER_METRICS = ['fairness']
+
+# nice + 20 → CFS weight (CFSScheduler.get_weight와 동일)
+NICE_WEIGHTS = np.array(PRIO_TO_WEIGHT, dtype=np.int64)
+
+# 메트릭 하나만 계산할 때(calculate_metric) 필요한 스레드 필드
+TRACKED_METRIC_FIELDS = {
+    'cv_wait': ('wait_time',),
+    'fairness': ('burst_time', 'remaining_time', 'runnable_time', 'weight', 'nice'),
+    'cpu_time_ratio': ('burst_time', 'remaining_time', 'nice'),
+}
+
+# 메트릭 계산에 쓰는 스레드 필드 (context_switches는 첫 스레드 값만 읽음)
+METRIC_FIELDS = ('wait_time', 'finish_time', 'arrival_time', 'burst_time', 'remaining_time',
+                 'runnable_time', 'weight', 'nice')
 
 
 def calculate_jains_index(values: List[float]) -> float:
@@ -43,7 +64,7 @@ def calculate_jains_index(values: List[float]) -> float:
         return 0.0
     n = len(values)
     sum_x = sum(values)
-    sum_x2 = sum(x*x for x in values)
+    sum_x2 = sum(map(mul, values, values))  # x*x를 같은 순서로 합산
     return (sum_x ** 2) / (n * sum_x2) if sum_x2 > 0 else 0.0
 
 
@@ -107,10 +128,13 @@ def test_statistical_significance(values_a: List[float], values_b: List[float])
     }
 
 
-def calculate_scheduler_metrics(threads: List[Thread]) -> Dict:
+def calculate_scheduler_metrics(threads: Union[List[Thread], ThreadTable]) -> Dict:
     """
     스케줄러 메트릭 계산
 
+    열 배열로 계산: ThreadTable은 열을 그대로 읽고,
+    Thread 리스트는 METRIC_FIELDS 열만 배열로 만듦 (전체 테이블 변환 없음).
+
     Returns:
         [처리량 메트릭]
         avg_wait: 평균 대기 시간 (낮을수록 좋음)
@@ -130,115 +154,60 @@ def calculate_scheduler_metrics(threads: List[Thread]) -> Dict:
         context_switches: 컨텍스트 스위치 횟수
         has_starvation: Starvation 위험 여부
     """
-    if not threads:
+    if not len(threads):
         return {}
+    if isinstance(threads, ThreadTable):
+        table = threads.columns
+        context_switches = int(table['context_switches'][0])
+    else:
+        table = thread_columns(threads, METRIC_FIELDS)
+        context_switches = threads[0].context_switches
+    count = len(threads)
 
     # ========== 처리량 메트릭 ==========
-    wait_times = [t.wait_time for t in threads]
+    wait_times = table['wait_time']
 
     # 평균 대기 시간
-    avg_wait = sum(wait_times) / len(wait_times)
+    avg_wait = int(wait_times.sum()) / count
 
     # 완료된 스레드들의 반환 시간
-    completed = [t for t in threads if t.finish_time >= 0]
+    completed = table['finish_time'] >= 0
+    completed_count = int(completed.sum())
     avg_turnaround = (
-        sum(t.finish_time - t.arrival_time for t in completed) / len(completed)
-        if completed else None
+        int((table['finish_time'][completed] - table['arrival_time'][completed]).sum())
+        / completed_count
+        if completed_count else None
     )
 
     # ========== 일관성 메트릭 (CFS 장점) ==========
     # 변동계수 (Coefficient of Variation) - 낮을수록 일관적
-    std_wait = np.std(wait_times) if len(wait_times) > 1 else 0
-    cv_wait = (std_wait / avg_wait * 100) if avg_wait > 0 else 0
+    cv_wait = _cv_wait(wait_times, avg_wait)
 
     # 99 퍼센타일 대기 시간 (테일 레이턴시)
-    p99_wait = np.percentile(wait_times, 99) if wait_times else 0
+    p99_wait = np.percentile(wait_times, 99)
 
     # 최악/평균 비율 - 낮을수록 좋음
-    max_wait = max(wait_times) if wait_times else 0
+    max_wait = int(wait_times.max())
     worst_ratio = (max_wait / avg_wait) if avg_wait > 0 else 0
 
     # ========== 공정성 메트릭 (CFS 장점) ==========
     # Starvation 비율 - 실행 안된 스레드 %
-    cpu_times_all = [t.burst_time - t.remaining_time for t in threads]
-    starved_count = sum(1 for cpu in cpu_times_all if cpu <= 0)
-    starvation_pct = (starved_count / len(threads) * 100) if threads else 0
+    cpu_times_all = table['burst_time'] - table['remaining_time']
+    starved_count = int((cpu_times_all <= 0).sum())
+    starvation_pct = starved_count / count * 100
 
     # 공정성 지수 (runnable 시간 대비 가중치 비율 기반)
-    wait_times = [t.wait_time for t in threads]
-    cpu_times = []
-    entitlements = []
-    for t in threads:
-        if t.burst_time <= 0:
-            continue
-        cpu_used = max(0, t.burst_time - t.remaining_time)
-        runnable_time = getattr(t, "runnable_time", 0)
-        if runnable_time <= 0:
-            continue
-        cpu_times.append(cpu_used)
-        # CFS weight 테이블을 공통 entitlement로 사용 (nice 기반 가중치)
-        weight = getattr(t, "weight", None)
-        if weight is None or weight <= 0:
-            weight = CFSScheduler.get_weight(t.nice)
-        entitlements.append(runnable_time * weight)
-
-    if cpu_times and entitlements:
-        total_cpu = sum(cpu_times)
-        total_weight = sum(entitlements)
-        if total_cpu > 0 and total_weight > 0:
-            # 실측 비중 / 기대 비중이 모두 동일하면 완전 공정(=1.0)
-            share_ratios = [
-                (cpu / total_cpu) / (weight / total_weight)
-                for cpu, weight in zip(cpu_times, entitlements)
-                if weight > 0
-            ]
-            fairness = calculate_jains_index(share_ratios) if share_ratios else 0.0
-        else:
-            fairness = 0.0
-    else:
-        fairness = 0.0
-    fairness = round(fairness, 4)
+    fairness = _fairness(table, cpu_times_all)
 
     # Starvation 감지
     # - 공정성 지수가 높으면 (≥0.85) starvation 없음
     # - 평균 대기 시간의 15배 이상인 스레드가 있는 경우
     has_starvation = False
     if fairness < 0.85 and avg_wait > 0:
-        max_wait = max(wait_times) if wait_times else 0
         has_starvation = (max_wait > avg_wait * 15)
 
     # CPU time ratio (nice 효과 측정)
-    # Nice가 다른 그룹 간 CPU 시간 비율 계산
-    cpu_time_ratio = None
-    nice_values = set(t.nice for t in threads)
-    if len(nice_values) >= 2:
-        # Nice 값으로 그룹화
-        nice_groups = {}
-        for t in threads:
-            if t.nice not in nice_groups:
-                nice_groups[t.nice] = []
-            # CPU time = burst_time - remaining_time
-            cpu_time = t.burst_time - t.remaining_time
-            nice_groups[t.nice].append(cpu_time)
-
-        # 가장 높은 우선순위(가장 낮은 nice)와 가장 낮은 우선순위(가장 높은 nice) 비교
-        sorted_nices = sorted(nice_groups.keys())
-        high_priority_nice = sorted_nices[0]  # 가장 낮은 nice (높은 우선순위)
-        low_priority_nice = sorted_nices[-1]  # 가장 높은 nice (낮은 우선순위)
-
-        high_priority_cpu = sum(nice_groups[high_priority_nice])
-        low_priority_cpu = sum(nice_groups[low_priority_nice])
-
-        if low_priority_cpu > 0:
-            cpu_time_ratio = high_priority_cpu / low_priority_cpu
-        elif high_priority_cpu > 0:
-            # 낮은 우선순위가 한 번도 실행되지 않은 경우: 과도한 비율 대신 사용된 CPU 시간으로 대체
-            cpu_time_ratio = float(high_priority_cpu)
-        else:
-            cpu_time_ratio = 1.0
-
-    # 컨텍스트 스위치 수 (스케일 테스트용)
-    context_switches = threads[0].context_switches if hasattr(threads[0], "context_switches") else 0
+    cpu_time_ratio = _cpu_time_ratio(table['nice'], cpu_times_all)
 
     return {
         # 처리량 메트릭 (낮을수록 좋음) - MLFQS/Basic 유리
@@ -246,7 +215,7 @@ def calculate_scheduler_metrics(threads: List[Thread]) -> Dict:
         'avg_turnaround': round(avg_turnaround, 2) if avg_turnaround else None,
 
         # 일관성 메트릭 (낮을수록 좋음) - CFS 유리
-        'cv_wait': round(cv_wait, 2),           # 변동계수 %
+        'cv_wait': cv_wait,                     # 변동계수 %
         'p99_wait': round(p99_wait, 2),         # 99 퍼센타일
         'worst_ratio': round(worst_ratio, 2),   # 최악/평균 비율
 
@@ -257,10 +226,79 @@ def calculate_scheduler_metrics(threads: List[Thread]) -> Dict:
         # 기타
         'has_starvation': has_starvation,
         'cpu_time_ratio': cpu_time_ratio,
-        'context_switches': context_switches
+        'context_switches': context_switches  # 스케일 테스트용
     }
 
 
+def _cv_wait(wait_times: np.ndarray, avg_wait: float) -> float:
+    """대기 시간 변동계수 % (소수 둘째 자리)"""
+    std_wait = np.std(wait_times) if len(wait_times) > 1 else 0
+    return round((std_wait / avg_wait * 100) if avg_wait > 0 else 0, 2)
+
+
+def _fairness(table: Dict[str, np.ndarray], cpu_times_all: np.ndarray) -> float:
+    """Jain's Fairness Index (runnable 시간 × 가중치 대비 CPU 시간 비중, 소수 넷째 자리)"""
+    # burst_time, runnable 시간이 있는 스레드만
+    measured = (table['burst_time'] > 0) & (table['runnable_time'] > 0)
+    cpu_times = np.maximum(0, cpu_times_all[measured])
+    # CFS weight 테이블을 공통 entitlement로 사용 (nice 기반 가중치)
+    weights = table['weight'][measured]
+    nice_weights = NICE_WEIGHTS[np.clip(table['nice'][measured], -20, 19) + 20]
+    weights = np.where(weights > 0, weights, nice_weights)
+    entitlements = table['runnable_time'][measured] * weights
+
+    fairness = 0.0
+    if len(cpu_times):
+        total_cpu = int(cpu_times.sum())
+        total_weight = int(entitlements.sum())
+        if total_cpu > 0 and total_weight > 0:
+            # 실측 비중 / 기대 비중이 모두 동일하면 완전 공정(=1.0)
+            share_ratios = (cpu_times / total_cpu) / (entitlements / total_weight)
+            fairness = calculate_jains_index(share_ratios.tolist())
+    return round(fairness, 4)
+
+
+def _cpu_time_ratio(nice: np.ndarray, cpu_times_all: np.ndarray) -> Optional[float]:
+    """
+    Nice가 다른 그룹 간 CPU 시간 비율 (nice가 한 종류면 None)
+
+    가장 높은 우선순위(가장 낮은 nice)와 가장 낮은 우선순위(가장 높은 nice) 비교
+    """
+    low, high = nice.min(), nice.max()
+    if low == high:
+        return None
+    high_priority_cpu = int(cpu_times_all[nice == low].sum())
+    low_priority_cpu = int(cpu_times_all[nice == high].sum())
+
+    if low_priority_cpu > 0:
+        return high_priority_cpu / low_priority_cpu
+    if high_priority_cpu > 0:
+        # 낮은 우선순위가 한 번도 실행되지 않은 경우: 과도한 비율 대신 사용된 CPU 시간으로 대체
+        return float(high_priority_cpu)
+    return 1.0
+
+
+def calculate_metric(threads: Union[List[Thread], ThreadTable], metric: str) -> Optional[float]:
+    """
+    메트릭 하나만 계산 (calculate_scheduler_metrics(threads)[metric]과 같은 값)
+
+    TRACKED_METRIC_FIELDS의 메트릭만 지원, 그 메트릭에 필요한 열만 읽음 (수렴 판정용).
+    """
+    names = TRACKED_METRIC_FIELDS.get(metric)
+    if names is None:
+        raise ValueError(f"Unsupported metric: {metric}")
+    if not len(threads):
+        return None
+    table = threads.columns if isinstance(threads, ThreadTable) else thread_columns(threads, names)
+    if metric == 'cv_wait':
+        wait_times = table['wait_time']
+        return _cv_wait(wait_times, int(wait_times.sum()) / len(threads))
+    cpu_times_all = table['burst_time'] - table['remaining_time']
+    if metric == 'fairness':
+        return _fairness(table, cpu_times_all)
+    return _cpu_time_ratio(table['nice'], cpu_times_all)
+
+
 def generate_3way_comparison_report(
     basic_threads: List[Thread],
     mlfqs_threads: List[Thread],
@@ -304,10 +342,8 @@ def generate_comparison_report(
     improvements = {}
 
     # 메트릭 분류 (공통으로 사용)
-    lower_is_better_metrics = ['avg_wait', 'avg_turnaround', 'context_switches',
-                               'cv_wait', 'p99_wait', 'worst_ratio', 'starvation_pct']
-    higher_is_better_metrics = ['fairness']
-    # cpu_time_ratio는 단순 비교 불가 (측정용 메트릭)
+    lower_is_better_metrics = LOWER_IS_BETTER_METRICS
+    higher_is_better_metrics = HIGHER_IS_BETTER_METRICS
 
     for name, sched_metrics in metrics.items():
         if name == baseline_name:
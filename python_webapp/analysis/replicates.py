@@ -0,0 +1,90 @@
+"""
+반복 측정 리포트
+
+여러 seed로 반복 실행한 스케줄러별 메트릭을 모아
+평균/표준편차/95% 신뢰구간과 t-test로 승자를 결정.
+단일 표본 비교(generate_comparison_report)와 달리 최선 스케줄러가
+나머지 모두보다 유의하게(p < 0.05) 좋을 때만 승자, 아니면 "tie".
+"""
+
+from typing import Dict, List
+from analysis.metrics import calculate_statistics, test_significance, cohens_d
+from analysis.insights import LOWER_IS_BETTER_METRICS, HIGHER_IS_BETTER_METRICS
+
+
+def generate_replicate_report(
+    replicate_metrics: Dict[str, List[Dict]],
+    primary_metric: str = 'avg_wait'
+) -> Dict:
+    """
+    반복 측정 비교 리포트 생성
+
+    Args:
+        replicate_metrics: {'scheduler_name': [seed별 calculate_scheduler_metrics 결과]}
+        primary_metric: 주요 비교 메트릭
+
+    Returns:
+        winner: 유의하게 가장 좋은 스케줄러 (없으면 "tie")
+        statistics: 스케줄러별 primary_metric 통계량 (calculate_statistics)
+        values: 스케줄러별 primary_metric 표본 (None 제외)
+        comparisons: "{winner 후보}_vs_{name}" → t-test 결과 + cohens_d
+        best: 평균 기준 최선 스케줄러
+    """
+    values = {
+        name: [m[primary_metric] for m in runs if m.get(primary_metric) is not None]
+        for name, runs in replicate_metrics.items()
+    }
+    statistics = {
+        name: calculate_statistics(samples) if len(samples) >= 2 else {}
+        for name, samples in values.items()
+    }
+
+    # 표본이 2개 이상인 스케줄러만 비교, 평균 기아율 10% 이상은 후보에서 제외
+    candidates = [name for name, s in statistics.items() if s]
+    valid_candidates = [
+        name for name in candidates
+        if _mean(replicate_metrics[name], 'starvation_pct') < 10
+    ] or candidates
+
+    report = {
+        'winner': "tie",
+        'best': None,
+        'statistics': statistics,
+        'values': values,
+        'comparisons': {},
+        'primary_metric': primary_metric,
+        'num_replicates': max((len(runs) for runs in replicate_metrics.values()), default=0),
+    }
+    if not valid_candidates:
+        return report
+
+    # cpu_time_ratio: 단일 비교와 같이 (기아율 필터 후) 높은 쪽
+    means = {name: statistics[name]['mean'] for name in valid_candidates}
+    if primary_metric in LOWER_IS_BETTER_METRICS:
+        best = min(means, key=means.get)
+    elif primary_metric in HIGHER_IS_BETTER_METRICS or primary_metric == 'cpu_time_ratio':
+        best = max(means, key=means.get)
+    else:
+        report['best'] = report['winner'] = valid_candidates[0]
+        return report
+
+    significant = True
+    for name in valid_candidates:
+        if name == best:
+            continue
+        result = test_significance(values[best], values[name])
+        result['significant'] = bool(result['significant'])
+        result['cohens_d'] = cohens_d(values[best], values[name])
+        report['comparisons'][f"{best}_vs_{name}"] = result
+        significant = significant and result['significant']
+
+    report['best'] = best
+    report['winner'] = best if significant else "tie"
+    return report
+
+
+def _mean(runs: List[Dict], metric: str) -> float:
+    """None을 0으로 보는 seed 평균"""
+    if not runs:
+        return 0.0
+    return sum(m.get(metric) or 0 for m in runs) / len(runs)
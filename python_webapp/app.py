@@ -6,18 +6,16 @@
   - 각 테스트마다 비교할 스케줄러 명시
   - 공정한 비교만 수행
 """
+import threading
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from copy import deepcopy
 
-from scheduler.basic_priority import BasicPriorityScheduler
-from scheduler.mlfqs import MLFQSScheduler
-from scheduler.cfs import CFSScheduler
-from workload.generator import generate_workload
-from simulator.simulator import Simulator
+from workload.generator import generate_workload_spec
+from benchmark.runner import run_schedulers, warm_cache
+from benchmark.cache import ResultCache
 from analysis.insights import generate_comparison_report
 from benchmark.tests import TEST_CATEGORIES, get_test_by_id, ALL_TESTS
 
@@ -73,6 +71,26 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+
+@st.cache_resource
+def start_cache_warmup():
+    """
+    모든 기본 테스트 결과를 백그라운드에서 미리 계산 (서버 프로세스당 한 번)
+
+    cache_resource라 서버를 다시 시작해야 다시 예열함:
+    실행 중에 코드를 고치면 캐시 키가 달라져 예열 결과를 쓰지 못하고, 재시작 시 바뀐 결과만 다시 계산.
+    워커는 fork 없이 시작 (runner.MP_START_METHOD), 코어 절반을 낮은 우선순위로 사용.
+    기본 설정으로 실행하면 캐시에서 바로 읽고, max_ticks 등을 바꾼 경우만 시뮬레이션.
+    """
+    thread = threading.Thread(target=warm_cache, args=(ALL_TESTS, ResultCache()),
+                              kwargs={"low_priority": True},
+                              name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+start_cache_warmup()
+
 # 헤더 시작 마커
 st.markdown('<div id="header-start"></div>', unsafe_allow_html=True)
 
@@ -347,44 +365,41 @@ if run_clicked:
     # 워크로드 생성
     with st.spinner(f"📦 워크로드 생성 중... ({selected_test.workload_type}, {selected_test.thread_count} 스레드)"):
         status_text.text(f"워크로드 생성 중... ({selected_test.workload_type}, {selected_test.thread_count} 스레드)")
-        base_threads = generate_workload(selected_test.workload_type, selected_test.thread_count, seed=42)
+        workload = generate_workload_spec(selected_test.workload_type, selected_test.thread_count, seed=42)
         progress_bar.progress(5)
 
     # 시뮬레이션 시간 (테스트별 최적값이 이미 기본 설정됨)
     actual_max_ticks = max_ticks
 
-    # 스케줄러 실행
-    scheduler_results = {}
-    dataframes = {}
-
+    # 스케줄러 실행 (스케줄러별 별도 프로세스에서 병렬)
     total_schedulers = len(selected_test.schedulers)
-
-    for idx, scheduler_name in enumerate(selected_test.schedulers):
-        with st.spinner(f"⚙️ {idx+1}/{total_schedulers}: {scheduler_name.upper()} 시뮬레이션 실행 중..."):
-            status_text.text(f"{idx+1}/{total_schedulers}: {scheduler_name.upper()} 시뮬레이션...")
-
-            threads = deepcopy(base_threads)
-
-            # 스케줄러 생성
-            if scheduler_name == "basic":
-                scheduler = BasicPriorityScheduler(enable_aging=False)
-            elif scheduler_name == "mlfqs":
-                scheduler = MLFQSScheduler()
-            elif scheduler_name == "cfs":
-                scheduler = CFSScheduler()
-            else:
-                st.error(f"Unknown scheduler: {scheduler_name}")
-                continue
-
-            # 시뮬레이션 실행
-            sim = Simulator(scheduler, threads)
-            df = sim.run(max_ticks=actual_max_ticks)
-
-            scheduler_results[scheduler_name] = threads
-            dataframes[scheduler_name] = df
-
-            # 진행 상황 업데이트 (5% 워크로드 생성 + 85% 시뮬레이션 + 10% 분석)
-            progress_bar.progress(int(5 + (idx + 1) / total_schedulers * 85))
+    completed_schedulers = []
+    scheduler_progress = {name: 0.0 for name in selected_test.schedulers}
+
+    def update_progress_bar():
+        """5% 워크로드 생성 + 85% 시뮬레이션 (스케줄러별 진행률 평균) + 10% 분석"""
+        done = sum(scheduler_progress.values()) / total_schedulers
+        progress_bar.progress(int(5 + done * 85))
+
+    def on_scheduler_progress(scheduler_name, tick, total):
+        """시뮬레이션 도중 진행 상황 업데이트 (Stop 버튼을 누르면 여기서 중단되어 시뮬레이션도 멈춤)"""
+        scheduler_progress[scheduler_name] = tick / total
+        update_progress_bar()
+
+    def on_scheduler_complete(scheduler_name):
+        """스케줄러 하나 완료 시 진행 상황 업데이트"""
+        completed_schedulers.append(scheduler_name)
+        scheduler_progress[scheduler_name] = 1.0
+        status_text.text(f"{len(completed_schedulers)}/{total_schedulers}: {scheduler_name.upper()} 시뮬레이션 완료")
+        update_progress_bar()
+
+    with st.spinner(f"⚙️ {', '.join(s.upper() for s in selected_test.schedulers)} 시뮬레이션 병렬 실행 중..."):
+        status_text.text(f"{total_schedulers}개 스케줄러 시뮬레이션 병렬 실행 중...")
+        scheduler_results, dataframes = run_schedulers(
+            selected_test.schedulers, workload, actual_max_ticks,
+            history="full", on_complete=on_scheduler_complete,
+            cache=ResultCache(), on_progress=on_scheduler_progress,
+        )
 
     # Insight 생성
     with st.spinner("📊 결과 분석 중..."):
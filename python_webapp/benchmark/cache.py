@@ -0,0 +1,435 @@
+"""
+시뮬레이션 결과 캐시 (디스크, 내용 주소 기반)
+
+같은 입력과 같은 코드의 시뮬레이션은 항상 같은 결과이므로
+키 = hash(워크로드 명세, 스케줄러 이름/파라미터, time_slice, max_ticks,
+          CPU 수, 히스토리 수준, 조기 종료 기준, 시뮬레이션 코드 소스)
+로 결과를 저장해 두고 재실행 대신 읽어 옴.
+  - 저장 형식: 키별 .npz 파일 하나 (스레드 최종 상태 열 배열 + 메트릭 JSON + 히스토리 열, 압축)
+    pickle을 쓰지 않으므로 캐시 파일을 읽을 때 코드가 실행되지 않음
+  - 크기 제한: 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    전체 크기는 처음 한 번만 디렉토리를 훑어 구하고 이후 쓸 때마다 더해 가다가
+    상한을 넘을 때만 다시 훑어 max_bytes * EVICT_RATIO까지 줄임 (다른 프로세스가 쓴 항목은 그때 반영)
+  - 코드가 바뀌면 소스 해시가 달라져 기존 항목은 자연히 사용되지 않다가 LRU로 정리됨
+  - 스냅샷: max_ticks를 뺀 키별로 가장 긴 실행의 Simulator.snapshot()을 보관해
+    max_ticks를 늘린 실행은 처음부터가 아니라 저장된 tick부터 이어서 실행
+    (히스토리는 빼고 저장, 이전 히스토리는 같은 tick의 결과 항목에서 가져옴)
+
+신뢰 경계: 스냅샷은 pickle이므로 캐시 디렉토리에 쓸 수 있으면 코드를 실행시킬 수 있음.
+그래서 스냅샷마다 비밀 키로 HMAC을 붙여 저장하고, 읽을 때 검증에 실패하면 버림
+(restore 전에 확인). 키는 프로젝트 밖 사용자별 파일
+(SCHED_SNAPSHOT_KEY_FILE, 기본 ~/.config/scheduler_benchmark/snapshot.key, 0600)이며
+앱 사용자만 쓸 수 있는 곳이어야 함. 믿을 수 있는 키가 없으면 스냅샷을 쓰지 않음
+(항상 처음부터 실행). 결과 항목은 pickle 없이 읽으므로 키가 필요 없음.
+
+seed는 명세에 이미 반영되어 있으므로 키에 따로 넣지 않음
+(같은 명세를 만드는 실행끼리는 결과도 같음).
+"""
+
+import glob
+import hashlib
+import hmac
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from analysis.convergence import ConvergenceCriterion
+from scheduler.thread import Thread
+from scheduler.thread_table import ThreadTable, TABLE_FIELDS
+from workload.spec import WorkloadSpec
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기본 캐시 위치/크기 (SCHED_CACHE_DIR 환경 변수로 위치 변경)
+DEFAULT_CACHE_DIR = os.environ.get("SCHED_CACHE_DIR", os.path.join(_ROOT, ".cache", "results"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# 상한을 넘으면 이 비율까지 줄여 둠 (가득 찬 캐시에서도 쓸 때마다 디렉토리를 훑지 않도록)
+EVICT_RATIO = 0.8
+
+
+def _default_snapshot_key_file() -> Optional[str]:
+    """사용자별 설정 디렉토리의 키 파일 (프로젝트/캐시 디렉토리 밖, 홈이 없으면 None)"""
+    config = os.environ.get("XDG_CONFIG_HOME")
+    if not config:
+        home = os.path.expanduser("~")
+        if home == "~":
+            return None
+        config = os.path.join(home, ".config")
+    return os.path.join(config, "scheduler_benchmark", "snapshot.key")
+
+
+# 스냅샷 서명 키 파일 (사용자별 설정 디렉토리, 없으면 만듦)
+DEFAULT_SNAPSHOT_KEY_FILE = (os.environ.get("SCHED_SNAPSHOT_KEY_FILE")
+                             or _default_snapshot_key_file())
+
+# 저장 형식 버전 (형식이 바뀌면 키가 달라져 이전 항목은 읽지 않음)
+CACHE_FORMAT = 2
+
+# 결과에 영향을 주는 코드 (스케줄러, 시뮬레이터, 워크로드 명세, 메트릭,
+# 스케줄러 생성/선택 - scheduler_factory, VECTORIZED_MLFQS_MIN_THREADS)
+SOURCE_PATTERNS = ("scheduler/*.py", "simulator/*.py", "workload/spec.py", "analysis/insights.py",
+                   "analysis/convergence.py", "benchmark/runner.py")
+
+
+@dataclass
+class CachedResult:
+    """캐시 항목 하나"""
+    threads: List[Thread]  # 시뮬레이션 후 스레드 상태
+    metrics: Dict  # calculate_scheduler_metrics 결과
+    history: pd.DataFrame  # 시뮬레이션 히스토리 (history="none"이면 빈 DataFrame)
+
+
+@lru_cache(maxsize=None)
+def source_hash() -> str:
+    """시뮬레이션 코드 소스 해시 (프로세스당 한 번 계산)"""
+    digest = hashlib.sha256()
+    for pattern in SOURCE_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(_ROOT, pattern))):
+            digest.update(os.path.relpath(path, _ROOT).encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def describe_factory(factory: Any) -> str:
+    """스케줄러 생성 함수 → 이름과 파라미터 문자열 (partial의 인자 포함)"""
+    if isinstance(factory, partial):
+        args = [repr(a) for a in factory.args]
+        args += [f"{k}={v!r}" for k, v in sorted(factory.keywords.items())]
+        return f"{describe_factory(factory.func)}({', '.join(args)})"
+    return f"{factory.__module__}.{factory.__qualname__}"
+
+
+class ResultCache:
+    """디스크 결과 캐시 (LRU 크기 제한)"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 snapshot_key: Optional[bytes] = None):
+        """
+        Args:
+            directory: 캐시 파일 디렉토리 (없으면 생성)
+            max_bytes: 전체 크기 상한 (넘으면 오래된 항목부터 삭제)
+            snapshot_key: 스냅샷 HMAC 키 (None이면 DEFAULT_SNAPSHOT_KEY_FILE에서 읽거나 만듦,
+                          믿을 수 있는 키가 없으면 스냅샷을 저장/사용하지 않음)
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1: {max_bytes}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._known_bytes: Optional[int] = None  # 마지막으로 훑은 크기 + 이후 이 객체가 쓴 크기
+        os.makedirs(directory, exist_ok=True)
+        if snapshot_key is None:
+            snapshot_key = _load_snapshot_key(DEFAULT_SNAPSHOT_KEY_FILE, directory)
+        self._snapshot_key = snapshot_key
+
+    @staticmethod
+    def key(spec: WorkloadSpec, scheduler: str, factory: Any, max_ticks: Optional[int],
+            num_cpus: int = 1, history: str = "none", time_slice: int = 4,
+            converge: Optional[str] = None) -> str:
+        """
+        캐시 키 (입력과 코드가 같으면 같은 키)
+
+        Args:
+            spec: 워크로드 명세
+            scheduler: 스케줄러 이름
+            factory: 스케줄러 생성 함수 (파라미터 포함, describe_factory)
+            max_ticks: 시뮬레이션 시간 (None이면 스냅샷 키)
+            num_cpus: CPU 수
+            history: 히스토리 기록 수준
+            time_slice: 시간 조각 (Simulator 기본값 4)
+            converge: 수렴 조기 종료 메트릭 (None이면 max_ticks까지 실행),
+                      키에는 이 메트릭의 ConvergenceCriterion 기준 전체가 들어감
+        """
+        criterion = None if converge is None else list(ConvergenceCriterion(converge).settings)
+        payload = json.dumps([
+            [list(column) for column in (spec.tids, spec.names, spec.arrival_times,
+                                         spec.burst_times, spec.io_frequencies,
+                                         spec.io_durations, spec.nices)],
+            scheduler, describe_factory(factory), time_slice, max_ticks, num_cpus,
+            history, criterion, CACHE_FORMAT, source_hash(),
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """저장된 결과 (없거나 읽을 수 없으면 None), 읽으면 최근 사용으로 갱신"""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                result = _decode(data)
+            _touch(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return result
+
+    def put(self, key: str, threads: List[Thread], metrics: Dict,
+            history: Optional[pd.DataFrame] = None) -> bool:
+        """
+        결과 저장 (같은 키는 덮어씀) 후 크기 제한 적용
+
+        캐시는 보조 수단이므로 디스크 오류는 무시 (저장 여부 반환).
+        """
+        return self._write(self._path(key), _pack(_encode(threads, metrics, history)))
+
+    def _write(self, path: str, payload: bytes) -> bool:
+        """임시 파일에 쓴 뒤 교체 (여러 프로세스가 같은 캐시를 써도 반쯤 쓴 파일을 읽지 않음)"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            _touch(path)
+        except OSError:
+            _remove(tmp_path)
+            return False
+        if self._known_bytes is None:
+            self._known_bytes = self.size()
+        else:
+            self._known_bytes += len(payload) - old_size
+        if self._known_bytes > self.max_bytes:
+            self._evict()
+        return True
+
+    def get_snapshot(self, key: str) -> Optional[Tuple[int, bytes]]:
+        """
+        저장된 스냅샷 (tick, Simulator.snapshot() 바이트), 없거나 서명이 맞지 않으면 None
+
+        서명이 맞는 바이트만 반환하므로 Simulator.restore()에 그대로 넘겨도 됨.
+        """
+        if self._snapshot_key is None:
+            return None
+        path = self._snapshot_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                tick, snapshot = int(data["tick"]), data["snapshot"].tobytes()
+                mac = data["mac"].tobytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        if not hmac.compare_digest(mac, self._sign(key, tick, snapshot)):
+            return None
+        _touch(path)
+        return tick, snapshot
+
+    def put_snapshot(self, key: str, tick: int, snapshot: bytes) -> bool:
+        """tick까지 실행한 스냅샷 저장 (이미 더 긴 스냅샷이 있거나 서명 키가 없으면 저장 안 함)"""
+        if self._snapshot_key is None:
+            return False
+        stored = self.get_snapshot(key)
+        if stored is not None and stored[0] >= tick:
+            return False
+        # 스냅샷은 이미 압축되어 있으므로 그대로 저장
+        arrays = {
+            "tick": np.array(tick),
+            "snapshot": np.frombuffer(snapshot, dtype=np.uint8),
+            "mac": np.frombuffer(self._sign(key, tick, snapshot), dtype=np.uint8),
+        }
+        return self._write(self._snapshot_path(key), _pack(arrays, compress=False))
+
+    @property
+    def snapshots_enabled(self) -> bool:
+        """믿을 수 있는 서명 키가 있어 스냅샷을 쓰는지"""
+        return self._snapshot_key is not None
+
+    def _sign(self, key: str, tick: int, snapshot: bytes) -> bytes:
+        """스냅샷 HMAC (키와 tick 포함: 다른 항목으로 복사한 스냅샷도 거부)"""
+        message = f"{key}:{tick}:".encode() + snapshot
+        return hmac.new(self._snapshot_key, message, hashlib.sha256).digest()
+
+    def _snapshot_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.snapshot.npz")
+
+    def size(self) -> int:
+        """전체 캐시 크기 (bytes)"""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """모든 항목 삭제"""
+        for path, _, _ in self._entries():
+            _remove(path)
+        self._known_bytes = 0
+
+    def _entries(self):
+        """(경로, 크기, 마지막 사용 시각) 리스트"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "*.npz")):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self):
+        """max_bytes * EVICT_RATIO 이하가 될 때까지 오래 사용하지 않은 항목 삭제 (디렉토리를 다시 훑음)"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * EVICT_RATIO
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= limit:
+                break
+            _remove(path)
+            total -= size
+        self._known_bytes = total
+
+
+def _inside(path: str, directory: str) -> bool:
+    path, directory = os.path.realpath(path), os.path.realpath(directory)
+    return os.path.commonpath([path, directory]) == directory
+
+
+def _load_snapshot_key(path: Optional[str], cache_dir: str) -> Optional[bytes]:
+    """
+    스냅샷 서명 키 (없으면 새 키를 앱 사용자만 읽고 쓸 수 있게 만듦)
+
+    키를 믿을 수 없으면 None (스냅샷 사용 안 함):
+      - 키 파일 위치가 없음 (홈 디렉토리 없음, SCHED_SNAPSHOT_KEY_FILE 미설정)
+      - 프로젝트나 캐시 디렉토리 안 (스냅샷을 심을 수 있으면 키도 바꿀 수 있음)
+      - 다른 사용자 소유이거나 그룹/다른 사용자 권한이 있음, 읽거나 만들 수 없음
+    """
+    if path is None or _inside(path, _ROOT) or _inside(path, cache_dir):
+        return None
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        if not os.path.exists(path):
+            # 임시 파일에 다 쓴 뒤 link로 생성 (다른 프로세스가 빈 키를 읽지 않음)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(os.urandom(32))
+                os.link(tmp_path, path)
+            except FileExistsError:
+                pass  # 다른 프로세스가 먼저 만듦
+            finally:
+                _remove(tmp_path)
+        stat = os.stat(path)
+        if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o077):
+            return None
+        with open(path, "rb") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def _touch(path: str):
+    """마지막 사용 시각 갱신 (파일 시스템 시각은 ms 단위로 거칠어서 직접 ns 시각 기록)"""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# ========== 인코딩 ==========
+
+def _pack(arrays: Dict[str, np.ndarray], compress: bool = True) -> bytes:
+    """
+    배열 → .npz 바이트 (np.load로 읽음)
+
+    np.savez_compressed는 zlib 기본 수준(6)이라 큰 히스토리에서 느리므로
+    가장 빠른 수준(1)으로 직접 씀 (크기 차이는 작음).
+    """
+    buffer = io.BytesIO()
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(buffer, "w", compression=method, compresslevel=1) as archive:
+        for name, array in arrays.items():
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asanyarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _encode(threads: List[Thread], metrics: Dict,
+            history: Optional[pd.DataFrame]) -> Dict[str, np.ndarray]:
+    """결과 → npz 배열 (allow_pickle=False로 읽을 수 있는 형식)"""
+    table = ThreadTable.from_threads(threads)
+    arrays = {f"thread/{name}": table[name] for name in TABLE_FIELDS}
+    arrays["thread_names"] = np.array(table.names, dtype=str)
+    arrays["metrics"] = np.array(_metrics_json(metrics))
+
+    if history is None:
+        history = pd.DataFrame()
+    columns = []
+    for i, name in enumerate(history.columns):
+        values = history[name].to_numpy()
+        kind = "array"
+        if values.dtype == object:
+            # 문자열 열(name/status)은 고유값 + 코드로, 전부 None인 열(CFS priority)은 표시만
+            if pd.api.types.infer_dtype(values, skipna=False) == "string":
+                codes, uniques = pd.factorize(values)
+                kind, values = "str", codes.astype(np.int32)
+                arrays[f"history/{i}/values"] = np.asarray(uniques, dtype=str)
+            elif pd.api.types.infer_dtype(values, skipna=True) == "empty":
+                kind, values = "none", np.empty(0, dtype=np.int8)
+            else:
+                raise TypeError(f"Unsupported history column: {name}")
+        arrays[f"history/{i}"] = values
+        columns.append([name, kind])
+    arrays["history_columns"] = np.array(json.dumps(columns))
+    arrays["history_rows"] = np.array(len(history))
+    return arrays
+
+
+def _metrics_json(metrics: Dict) -> str:
+    """
+    메트릭 → JSON (pickle 없이 읽을 수 있도록)
+
+    값은 float/int/bool/None (None → null). NumPy 스칼라(np.float64 등)는
+    Python 값과 dtype 이름을 함께 저장해 읽을 때 같은 타입으로 복원.
+    """
+    values, dtypes = {}, {}
+    for name, value in metrics.items():
+        if isinstance(value, np.generic):
+            dtypes[name] = value.dtype.str
+            value = value.item()
+        if value is not None and not isinstance(value, (bool, int, float)):
+            raise TypeError(f"Unsupported metric value: {name}={value!r}")
+        values[name] = value
+    return json.dumps({"values": values, "dtypes": dtypes})
+
+
+def _metrics_from_json(text: str) -> Dict:
+    """_metrics_json 결과 → 메트릭 (NumPy 스칼라 타입 복원)"""
+    payload = json.loads(text)
+    metrics = payload["values"]
+    for name, dtype in payload["dtypes"].items():
+        metrics[name] = np.dtype(dtype).type(metrics[name])
+    return metrics
+
+
+def _decode(data) -> CachedResult:
+    """npz 배열 → 결과"""
+    columns = {name: data[f"thread/{name}"] for name in TABLE_FIELDS}
+    table = ThreadTable(columns, [str(name) for name in data["thread_names"]])
+    metrics = _metrics_from_json(str(data["metrics"]))
+
+    rows = int(data["history_rows"])
+    history = {}
+    for i, (name, kind) in enumerate(json.loads(str(data["history_columns"]))):
+        values = data[f"history/{i}"]
+        if kind == "none":
+            values = np.full(rows, None, dtype=object)
+        elif kind == "str":
+            values = data[f"history/{i}/values"].astype(object)[values]
+        history[name] = values
+    history = pd.DataFrame(history) if history else pd.DataFrame()
+    return CachedResult(threads=table.to_threads(), metrics=metrics, history=history)
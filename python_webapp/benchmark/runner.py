@@ -0,0 +1,719 @@
+"""
+벤치마크 실행기
+
+같은 워크로드에 대한 스케줄러별 시뮬레이션은 서로 독립이므로
+ProcessPoolExecutor로 병렬 실행하고 결과 스레드를 모아 반환.
+  - run_schedulers: 테스트 하나 (3-way 테스트 시간 ≈ 가장 느린 스케줄러 하나의 시간)
+  - run_suite: 여러 테스트의 (테스트, 스케줄러) 작업 전체를 한 프로세스 풀에서 실행
+  - run_replicates: 테스트 하나를 여러 seed로 반복 실행 (통계적 비교용)
+  - warm_cache: 테스트별 기본 설정 결과를 결과 캐시에 미리 계산 (앱 시작 시)
+"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import pandas as pd
+
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.mlfqs_vectorized import VectorizedMLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from scheduler.thread import Thread
+from simulator.simulator import Simulator
+from simulator.smp import SMPSimulator
+from simulator.batch import BatchSimulator, BATCH_SCHEDULERS
+from workload.generator import generate_workload, generate_workload_spec
+from workload.spec import WorkloadSpec
+from analysis.insights import generate_comparison_report, calculate_scheduler_metrics
+from analysis.convergence import ConvergenceCriterion, CONVERGENCE_METRICS
+from analysis.replicates import generate_replicate_report
+from benchmark.tests import BenchmarkTest
+from benchmark.cache import ResultCache
+
+# 스케줄러 이름 → 생성 함수 (워커 프로세스에서도 이름으로 생성)
+SCHEDULER_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "basic": partial(BasicPriorityScheduler, enable_aging=False),
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+# 이 스레드 수 이상이면 "mlfqs"는 배열 연산 변형으로 실행 (결과 동일, 큰 워크로드에서 빠름)
+VECTORIZED_MLFQS_MIN_THREADS = 200
+
+# 진행 상황 보고 최소 간격 (밀리초) / 병렬 실행 시 부모 프로세스의 확인 간격 (초)
+PROGRESS_MS = 100
+POLL_SECONDS = 0.1
+
+# 워커 프로세스 시작 방식: 스레드가 있는 프로세스(Streamlit 서버)에서 fork하면
+# 자식이 다른 스레드가 잡고 있던 락을 물려받아 멈출 수 있으므로 fork를 쓰지 않음
+MP_START_METHOD = ("forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                   else "spawn")
+
+# 워커 프로세스의 진행 보고 큐 / 취소 이벤트 (_init_worker_control에서 설정)
+_worker_queue = None
+_worker_cancel = None
+
+
+def _mp_context():
+    """워커 프로세스용 multiprocessing 컨텍스트 (MP_START_METHOD)"""
+    return multiprocessing.get_context(MP_START_METHOD)
+
+
+def _process_pool(workers: int, **kwargs) -> ProcessPoolExecutor:
+    """워커 프로세스 풀 (모든 병렬 실행이 같은 시작 방식을 사용)"""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context(), **kwargs)
+
+
+def create_scheduler(scheduler_name: str) -> Any:
+    """스케줄러 이름으로 인스턴스 생성"""
+    factory = SCHEDULER_FACTORIES.get(scheduler_name)
+    if factory is None:
+        raise ValueError(f"Unknown scheduler: {scheduler_name}")
+    return factory()
+
+
+def scheduler_factory(scheduler_name: str, thread_count: int) -> Callable[[], Any]:
+    """
+    실행용 스케줄러 생성 함수
+
+    스레드가 많은 "mlfqs"는 VectorizedMLFQSScheduler (MLFQSScheduler와 결과가 같으므로
+    캐시 키는 SCHEDULER_FACTORIES 기준 그대로).
+    """
+    if scheduler_name not in SCHEDULER_FACTORIES:
+        raise ValueError(f"Unknown scheduler: {scheduler_name}")
+    if scheduler_name == "mlfqs" and thread_count >= VECTORIZED_MLFQS_MIN_THREADS:
+        return VectorizedMLFQSScheduler
+    return SCHEDULER_FACTORIES[scheduler_name]
+
+
+def simulate_scheduler(scheduler_name: str, threads: Union[List[Thread], WorkloadSpec],
+                       max_ticks: int, history: str = "none", num_cpus: int = 1,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       cancel: Optional[Any] = None,
+                       snapshots: Optional[ResultCache] = None,
+                       converge: Optional[str] = None
+                       ) -> Tuple[List[Thread], pd.DataFrame]:
+    """
+    스케줄러 하나로 시뮬레이션 (워커 프로세스 진입점)
+
+    Args:
+        scheduler_name: "basic", "mlfqs", "cfs"
+        threads: 시뮬레이션할 스레드 (이 리스트가 변경됨), WorkloadSpec이면 여기서 새로 생성
+        max_ticks: 최대 시뮬레이션 시간
+        history: 히스토리 기록 수준
+        num_cpus: CPU 수 (2 이상이면 SMPSimulator)
+        progress: 진행 상황 콜백 (진행한 tick 수, max_ticks), PROGRESS_MS 간격
+        cancel: 취소 토큰 (is_set()), 설정되면 SimulationCancelled
+        snapshots: 스냅샷 저장소 (단일 CPU + WorkloadSpec일 때, 저장된 더 짧은 실행에서 이어서 실행)
+        converge: 이 메트릭(CONVERGENCE_METRICS)이 수렴하면 max_ticks 전에 멈춤
+                  (조기 종료한 실행은 스냅샷을 쓰지 않음)
+
+    Returns:
+        (시뮬레이션 후 스레드, 히스토리 DataFrame)
+    """
+    stop = None if converge is None else ConvergenceCriterion(converge)
+    if (snapshots is not None and stop is None and num_cpus == 1
+            and isinstance(threads, WorkloadSpec)):
+        return _simulate_incremental(scheduler_name, threads, max_ticks, history,
+                                     progress, cancel, snapshots)
+    if isinstance(threads, WorkloadSpec):
+        threads = threads.instantiate()
+    factory = scheduler_factory(scheduler_name, len(threads))
+    if num_cpus > 1:
+        sim = SMPSimulator(factory, threads, num_cpus=num_cpus, history=history)
+    else:
+        sim = Simulator(factory(), threads, engine="event", history=history)
+    df = sim.run(max_ticks=max_ticks, progress=progress, cancel=cancel, progress_ms=PROGRESS_MS,
+                 stop=stop)
+    return threads, df
+
+
+def _simulate_incremental(scheduler_name: str, spec: WorkloadSpec, max_ticks: int,
+                          history: str, progress: Optional[Callable[[int, int], None]],
+                          cancel: Optional[Any], snapshots: ResultCache
+                          ) -> Tuple[List[Thread], pd.DataFrame]:
+    """
+    저장된 스냅샷(max_ticks 이하)에서 이어서 실행하고, 더 긴 실행이면 스냅샷 갱신
+
+    결과는 처음부터 실행한 것과 같음 (Simulator.run의 이어서 실행).
+    스냅샷은 히스토리 없이 저장하므로 이전 히스토리는 스냅샷 tick의 결과 항목에서 가져오고,
+    그 항목이 없으면 처음부터 실행.
+    """
+    factory = SCHEDULER_FACTORIES[scheduler_name]
+    key = ResultCache.key(spec, scheduler_name, factory, None, 1, history)
+    stored = snapshots.get_snapshot(key)
+    sim = None
+    if stored is not None and stored[0] <= max_ticks:
+        prior = None
+        if history != "none":
+            prior = snapshots.get(ResultCache.key(spec, scheduler_name, factory,
+                                                  stored[0], 1, history))
+        if history == "none" or prior is not None:
+            sim = Simulator.restore(stored[1])
+            if prior is not None:
+                sim.recorder.load_dataframe(prior.history)
+    if sim is None:
+        sim = Simulator(scheduler_factory(scheduler_name, len(spec))(), spec.instantiate(),
+                        engine="event", history=history)
+    df = sim.run(max_ticks=max_ticks, progress=progress, cancel=cancel, progress_ms=PROGRESS_MS)
+    if stored is None or stored[0] < max_ticks:
+        snapshots.put_snapshot(key, max_ticks, sim.snapshot(with_history=False))
+    return sim.threads, df
+
+
+def _init_worker_control(progress_queue, cancel):
+    """워커 프로세스 초기화: 진행 보고 큐와 취소 이벤트 (프로세스 시작 시 한 번 전달)"""
+    global _worker_queue, _worker_cancel
+    _worker_queue = progress_queue
+    _worker_cancel = cancel
+
+
+def _simulate_in_worker(scheduler_name: str, workload: WorkloadSpec, max_ticks: int,
+                        history: str, num_cpus: int, snapshots: Optional[ResultCache] = None,
+                        converge: Optional[str] = None
+                        ) -> Tuple[List[Thread], pd.DataFrame]:
+    """진행 상황을 큐로 보내고 취소 이벤트를 확인하며 시뮬레이션 (워커 프로세스 진입점)"""
+    progress = None
+    if _worker_queue is not None:
+        def progress(tick, total):
+            _worker_queue.put((scheduler_name, tick, total))
+    return simulate_scheduler(scheduler_name, workload, max_ticks, history, num_cpus,
+                              progress=progress, cancel=_worker_cancel, snapshots=snapshots,
+                              converge=converge)
+
+
+def run_schedulers(scheduler_names: List[str], workload: Union[List[Thread], WorkloadSpec],
+                   max_ticks: int,
+                   history: str = "none", num_cpus: int = 1, parallel: bool = True,
+                   max_workers: Optional[int] = None,
+                   on_complete: Optional[Callable[[str], None]] = None,
+                   cache: Optional[ResultCache] = None,
+                   on_progress: Optional[Callable[[str, int, int], None]] = None,
+                   cancel: Optional[Any] = None,
+                   converge: Optional[str] = None
+                   ) -> Tuple[Dict[str, List[Thread]], Dict[str, pd.DataFrame]]:
+    """
+    여러 스케줄러로 같은 워크로드 시뮬레이션
+
+    Args:
+        scheduler_names: 비교할 스케줄러 리스트
+        workload: 워크로드 명세 또는 초기 상태 스레드 리스트 (변경되지 않음)
+        max_ticks: 최대 시뮬레이션 시간
+        history: 히스토리 기록 수준
+        num_cpus: CPU 수
+        parallel: True면 스케줄러별로 별도 프로세스에서 실행
+        max_workers: 프로세스 수 (None이면 min(스케줄러 수, CPU 코어 수), 1이면 순차 실행)
+        on_complete: 스케줄러 하나가 끝날 때마다 호출 (진행 표시용)
+        cache: 결과 캐시 (있으면 저장된 결과를 쓰고 새로 실행한 결과는 저장,
+               max_ticks만 바뀐 실행은 저장된 스냅샷에서 이어서 실행)
+        on_progress: 시뮬레이션 중 (scheduler_name, 진행한 tick 수, max_ticks)로 호출
+        cancel: 취소 토큰 (threading.Event 등), 설정되면 실행 중인 시뮬레이션을 모두 중단
+        converge: 수렴 조기 종료 메트릭 (스케줄러마다 이 메트릭이 안정되면 max_ticks 전에 멈춤)
+
+    Returns:
+        (스케줄러별 결과 스레드, 스케줄러별 히스토리) - scheduler_names 순서
+
+    Raises:
+        SimulationCancelled: cancel이 설정됨
+    """
+    for scheduler_name in scheduler_names:
+        if scheduler_name not in SCHEDULER_FACTORIES:
+            raise ValueError(f"Unknown scheduler: {scheduler_name}")
+    if converge is not None and converge not in CONVERGENCE_METRICS:
+        raise ValueError(f"Unsupported convergence metric: {converge}")
+
+    # 스케줄러마다 명세에서 새 스레드 생성 (워커에는 작은 명세만 pickle)
+    if not isinstance(workload, WorkloadSpec):
+        workload = WorkloadSpec.from_threads(workload)
+
+    results: Dict[str, Tuple[List[Thread], pd.DataFrame]] = {}
+    keys: Dict[str, str] = {}
+    pending = list(scheduler_names)
+    if cache is not None:
+        pending = []
+        for scheduler_name in scheduler_names:
+            keys[scheduler_name] = ResultCache.key(
+                workload, scheduler_name, SCHEDULER_FACTORIES[scheduler_name],
+                max_ticks, num_cpus, history, converge=converge,
+            )
+            cached = cache.get(keys[scheduler_name])
+            if cached is None:
+                pending.append(scheduler_name)
+                continue
+            results[scheduler_name] = (cached.threads, cached.history)
+            if on_complete is not None:
+                on_complete(scheduler_name)
+
+    def finish(scheduler_name, result):
+        results[scheduler_name] = result
+        if cache is not None:
+            threads, df = result
+            cache.put(keys[scheduler_name], threads, calculate_scheduler_metrics(threads), df)
+        if on_complete is not None:
+            on_complete(scheduler_name)
+
+    workers = max_workers or min(len(pending), os.cpu_count() or 1)
+    if not parallel or workers <= 1 or len(pending) <= 1:
+        for scheduler_name in pending:
+            progress = None
+            if on_progress is not None:
+                progress = partial(on_progress, scheduler_name)
+            finish(scheduler_name, simulate_scheduler(
+                scheduler_name, workload, max_ticks, history, num_cpus,
+                progress=progress, cancel=cancel, snapshots=cache, converge=converge,
+            ))
+    else:
+        _run_parallel(pending, workload, max_ticks, history, num_cpus, workers,
+                      finish, on_progress, cancel, cache, converge)
+
+    scheduler_results = {name: results[name][0] for name in scheduler_names}
+    dataframes = {name: results[name][1] for name in scheduler_names}
+    return scheduler_results, dataframes
+
+
+def _run_parallel(scheduler_names: List[str], workload: WorkloadSpec, max_ticks: int,
+                  history: str, num_cpus: int, workers: int,
+                  finish: Callable[[str, Tuple[List[Thread], pd.DataFrame]], None],
+                  on_progress: Optional[Callable[[str, int, int], None]],
+                  cancel: Optional[Any], snapshots: Optional[ResultCache],
+                  converge: Optional[str] = None):
+    """
+    스케줄러별 워커 프로세스 실행
+
+    진행 보고는 워커 → 큐 → 부모에서 on_progress 호출.
+    부모는 POLL_SECONDS마다 cancel을 확인해 워커 공용 취소 이벤트로 전달하고,
+    부모 쪽 예외(예: 진행 콜백에서 발생한 중단)도 워커를 멈추게 함.
+    """
+    context = _mp_context()
+    progress_queue = context.Queue() if on_progress is not None else None
+    worker_cancel = context.Event()
+    finished = set()
+
+    def drain():
+        # 큐는 비동기로 전달되므로 끝난 스케줄러의 늦게 도착한 보고는 버림
+        if progress_queue is None:
+            return
+        while True:
+            try:
+                message = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            if message[0] not in finished:
+                on_progress(*message)
+
+    with _process_pool(workers, initializer=_init_worker_control,
+                       initargs=(progress_queue, worker_cancel)) as executor:
+        futures = {
+            executor.submit(_simulate_in_worker, scheduler_name, workload,
+                            max_ticks, history, num_cpus, snapshots, converge): scheduler_name
+            for scheduler_name in scheduler_names
+        }
+        try:
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(not_done, timeout=POLL_SECONDS,
+                                      return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.is_set():
+                    worker_cancel.set()
+                drain()
+                for future in done:
+                    scheduler_name = futures[future]
+                    result = future.result()
+                    finished.add(scheduler_name)
+                    if on_progress is not None:
+                        on_progress(scheduler_name, max_ticks, max_ticks)
+                    finish(scheduler_name, result)
+        except BaseException:
+            worker_cancel.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+
+# ========== 테스트 스위트 실행 ==========
+
+@dataclass
+class SuiteResult:
+    """스위트 안의 테스트 하나 실행 결과"""
+    test: BenchmarkTest
+    max_ticks: int  # 실제 사용한 시뮬레이션 시간
+    report: Optional[Dict] = None  # generate_comparison_report 결과 (오류 시 None)
+    scheduler_results: Dict[str, List[Thread]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)  # 스케줄러 → 오류 메시지
+
+
+class JobTimeoutError(Exception):
+    """작업 하나가 제한 시간을 넘김"""
+
+
+def suggest_max_ticks(test: BenchmarkTest, workload: Union[List[Thread], WorkloadSpec],
+                      max_ticks: int) -> int:
+    """
+    테스트별 시뮬레이션 시간 조정
+
+    공정성/nice 테스트는 모든 스레드가 끝나기 전 구간을 측정해야 하므로
+    총 작업량의 일부로 제한.
+    """
+    if isinstance(workload, WorkloadSpec):
+        total_work = workload.total_burst
+    else:
+        total_work = sum(t.burst_time for t in workload)
+    if test.test_id == "nice_effect":
+        return min(max_ticks, int(total_work * 0.2))
+    if test.test_id == "fairness_extreme_nice":
+        return min(max_ticks, int(total_work * 0.3))
+    if test.test_id in ["fairness_cpu", "fairness_mixed"]:
+        return min(max_ticks, int(total_work * 0.5))
+    return max_ticks
+
+
+def convergence_metric(test: BenchmarkTest) -> Optional[str]:
+    """수렴 조기 종료에 쓸 메트릭 (주요 메트릭이 CONVERGENCE_METRICS가 아니면 None)"""
+    return test.primary_metric if test.primary_metric in CONVERGENCE_METRICS else None
+
+
+def estimate_job_cost(test: BenchmarkTest, max_ticks: int) -> int:
+    """작업 비용 추정 (스레드 수 × tick, 긴 작업부터 배치하는 데 사용)"""
+    return test.thread_count * max_ticks
+
+
+def _raise_job_timeout(signum, frame):
+    raise JobTimeoutError("job timed out")
+
+
+def run_job(scheduler_name: str, threads: Union[List[Thread], WorkloadSpec], max_ticks: int,
+            num_cpus: int = 1, timeout: Optional[float] = None,
+            converge: Optional[str] = None) -> List[Thread]:
+    """
+    스위트 작업 하나 실행 (워커 프로세스 진입점)
+
+    timeout이 있으면 SIGALRM으로 제한 시간을 강제 (POSIX, 메인 스레드에서만).
+    """
+    armed = (timeout is not None and hasattr(signal, "SIGALRM")
+             and threading.current_thread() is threading.main_thread())
+    if armed:
+        previous = signal.signal(signal.SIGALRM, _raise_job_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        threads, _ = simulate_scheduler(scheduler_name, threads, max_ticks, num_cpus=num_cpus,
+                                        converge=converge)
+    finally:
+        if armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return threads
+
+
+def run_suite(tests: List[BenchmarkTest], max_ticks: int = 35000, num_cpus: int = 1,
+              seed: int = 42, max_workers: Optional[int] = None,
+              job_timeout: Optional[float] = None,
+              on_complete: Optional[Callable[[str, str], None]] = None,
+              cache: Optional[ResultCache] = None, converge: bool = False
+              ) -> Dict[str, SuiteResult]:
+    """
+    테스트 스위트 실행
+
+    모든 (테스트, 스케줄러) 쌍을 하나의 프로세스 풀에 비용이 큰 순서로 제출하고,
+    테스트별로 모아 generate_comparison_report로 리포트를 만든다.
+
+    Args:
+        tests: 실행할 BenchmarkTest 리스트 (예: ALL_TESTS)
+        max_ticks: 최대 시뮬레이션 시간 (테스트별로 suggest_max_ticks 적용)
+        num_cpus: CPU 수
+        seed: 워크로드 random seed
+        max_workers: 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 실행)
+        job_timeout: 작업 하나의 제한 시간 (초), 넘기면 해당 스케줄러는 오류 처리
+        on_complete: 작업 하나가 끝날 때마다 (test_id, scheduler_name)으로 호출
+        cache: 결과 캐시 (있으면 저장된 결과를 쓰고 새로 실행한 결과는 저장)
+        converge: True면 주요 메트릭이 수렴 판정 대상인 테스트(convergence_metric)는
+                  메트릭이 안정될 때 max_ticks 전에 멈춤
+
+    Returns:
+        test_id → SuiteResult (tests 순서)
+    """
+    results: Dict[str, SuiteResult] = {}
+    keys: Dict[Tuple[str, str], str] = {}
+    metrics: Dict[str, Optional[str]] = {}
+    jobs = []
+    for test in tests:
+        spec = generate_workload_spec(test.workload_type, test.thread_count, seed=seed)
+        test_ticks = suggest_max_ticks(test, spec, max_ticks)
+        results[test.test_id] = SuiteResult(test=test, max_ticks=test_ticks)
+        metrics[test.test_id] = convergence_metric(test) if converge else None
+        for scheduler_name in test.schedulers:
+            if cache is not None and scheduler_name in SCHEDULER_FACTORIES:
+                key = ResultCache.key(spec, scheduler_name, SCHEDULER_FACTORIES[scheduler_name],
+                                      test_ticks, num_cpus, converge=metrics[test.test_id])
+                cached = cache.get(key)
+                if cached is not None:
+                    results[test.test_id].scheduler_results[scheduler_name] = cached.threads
+                    if on_complete is not None:
+                        on_complete(test.test_id, scheduler_name)
+                    continue
+                keys[test.test_id, scheduler_name] = key
+            jobs.append((estimate_job_cost(test, test_ticks), test, scheduler_name, spec))
+
+    # 긴 작업부터 (정렬은 안정적이므로 비용이 같으면 원래 순서)
+    jobs.sort(key=lambda job: -job[0])
+
+    def collect(test, scheduler_name, get_threads):
+        try:
+            threads = get_threads()
+            results[test.test_id].scheduler_results[scheduler_name] = threads
+            key = keys.get((test.test_id, scheduler_name))
+            if key is not None:
+                cache.put(key, threads, calculate_scheduler_metrics(threads))
+        except Exception as e:
+            results[test.test_id].errors[scheduler_name] = f"{type(e).__name__}: {e}"
+        if on_complete is not None:
+            on_complete(test.test_id, scheduler_name)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1:
+        for _, test, scheduler_name, spec in jobs:
+            collect(test, scheduler_name, lambda: run_job(
+                scheduler_name, spec, results[test.test_id].max_ticks,
+                num_cpus, job_timeout, metrics[test.test_id]))
+    else:
+        with _process_pool(workers) as executor:
+            futures = {
+                executor.submit(run_job, scheduler_name, spec,
+                                results[test.test_id].max_ticks, num_cpus, job_timeout,
+                                metrics[test.test_id]):
+                    (test, scheduler_name)
+                for _, test, scheduler_name, spec in jobs
+            }
+            for future in as_completed(futures):
+                test, scheduler_name = futures[future]
+                collect(test, scheduler_name, future.result)
+
+    # 테스트별 리포트 (스케줄러 순서는 테스트 정의 순서)
+    for result in results.values():
+        result.scheduler_results = {
+            name: result.scheduler_results[name]
+            for name in result.test.schedulers if name in result.scheduler_results
+        }
+        if result.errors:
+            continue
+        try:
+            result.report = generate_comparison_report(
+                result.scheduler_results, primary_metric=result.test.primary_metric
+            )
+        except Exception as e:
+            result.errors["report"] = f"{type(e).__name__}: {e}"
+
+    return results
+
+
+# ========== 캐시 예열 ==========
+
+# 예열 워커 nice 값 (low_priority=True, 앱 요청 처리보다 뒤로)
+WARMUP_NICE = 10
+
+
+def _lower_priority():
+    """워커 프로세스 초기화: 예열 작업이 앱의 시뮬레이션보다 CPU를 덜 받도록 nice 올림"""
+    if hasattr(os, "nice"):
+        os.nice(WARMUP_NICE)
+
+
+def warm_job(cache: ResultCache, key: str, scheduler_name: str, spec: WorkloadSpec,
+             max_ticks: int, history: str, num_cpus: int) -> str:
+    """
+    예열 작업 하나 실행 (워커 프로세스 진입점)
+
+    결과는 워커가 캐시에 직접 저장 (큰 히스토리를 부모 프로세스로 보내지 않음).
+    """
+    threads, df = simulate_scheduler(scheduler_name, spec, max_ticks, history, num_cpus,
+                                     snapshots=cache)
+    cache.put(key, threads, calculate_scheduler_metrics(threads), df)
+    return key
+
+
+def warm_cache(tests: List[BenchmarkTest], cache: ResultCache, seed: int = 42,
+               history: str = "full", num_cpus: int = 1,
+               max_workers: Optional[int] = None,
+               on_complete: Optional[Callable[[str, str], None]] = None,
+               low_priority: bool = False) -> int:
+    """
+    테스트별 기본 설정(test.max_ticks, seed) 결과를 캐시에 미리 계산
+
+    앱의 "벤치마크 실행"과 같은 키를 쓰므로 이후 같은 설정의 실행은 캐시에서 바로 읽음.
+    이미 캐시에 있는 작업은 건너뛰고, 짧은 작업부터 실행해 먼저 준비되는 테스트를 늘림.
+
+    Args:
+        tests: 미리 계산할 테스트 (예: ALL_TESTS)
+        cache: 결과 캐시
+        seed: 워크로드 random seed (앱과 동일하게 42)
+        history: 히스토리 기록 수준 (앱과 동일하게 "full")
+        num_cpus: CPU 수
+        max_workers: 프로세스 수 (None이면 CPU 코어 수의 절반, 1이면 순차 실행)
+        on_complete: 작업 하나가 끝날 때마다 (test_id, scheduler_name)으로 호출
+        low_priority: 워커 프로세스를 낮은 우선순위(WARMUP_NICE)로 실행 (앱과 함께 돌 때)
+
+    Returns:
+        새로 계산한 작업 수
+    """
+    jobs = []
+    for test in tests:
+        spec = generate_workload_spec(test.workload_type, test.thread_count, seed=seed)
+        for scheduler_name in test.schedulers:
+            key = ResultCache.key(spec, scheduler_name, SCHEDULER_FACTORIES[scheduler_name],
+                                  test.max_ticks, num_cpus, history)
+            if key not in cache:
+                jobs.append((estimate_job_cost(test, test.max_ticks), test, scheduler_name, spec, key))
+    jobs.sort(key=lambda job: job[0])
+
+    # 앱 사용자의 실행과 함께 돌 수 있으므로 코어 절반만 사용
+    workers = max_workers or max(1, (os.cpu_count() or 1) // 2)
+    if workers <= 1:
+        for _, test, scheduler_name, spec, key in jobs:
+            warm_job(cache, key, scheduler_name, spec, test.max_ticks, history, num_cpus)
+            if on_complete is not None:
+                on_complete(test.test_id, scheduler_name)
+    else:
+        initializer = _lower_priority if low_priority else None
+        with _process_pool(workers, initializer=initializer) as executor:
+            futures = {
+                executor.submit(warm_job, cache, key, scheduler_name, spec,
+                                test.max_ticks, history, num_cpus): (test, scheduler_name)
+                for _, test, scheduler_name, spec, key in jobs
+            }
+            for future in as_completed(futures):
+                test, scheduler_name = futures[future]
+                future.result()
+                if on_complete is not None:
+                    on_complete(test.test_id, scheduler_name)
+    return len(jobs)
+
+
+# ========== 반복 측정 ==========
+
+# 기본 seed (10회 반복, 기존 단일 실행 seed=42부터)
+DEFAULT_SEEDS = tuple(range(42, 52))
+
+
+@dataclass
+class ReplicateResult:
+    """테스트 하나의 반복 측정 결과"""
+    test: BenchmarkTest
+    seeds: List[int]
+    max_ticks: Dict[int, int]  # seed → 실제 사용한 시뮬레이션 시간
+    metrics: Dict[str, List[Dict]]  # 스케줄러 → seed 순서의 메트릭
+    report: Dict  # generate_replicate_report 결과
+
+
+def run_replicate_job(test: BenchmarkTest, scheduler_name: str, seed: int,
+                      max_ticks: int, num_cpus: int = 1) -> Tuple[int, Dict]:
+    """
+    반복 측정 작업 하나 실행 (워커 프로세스 진입점)
+
+    워크로드는 워커에서 생성하고 메트릭만 돌려보냄.
+
+    Returns:
+        (실제 사용한 시뮬레이션 시간, calculate_scheduler_metrics 결과)
+    """
+    threads = generate_workload(test.workload_type, test.thread_count, seed=seed)
+    test_ticks = suggest_max_ticks(test, threads, max_ticks)
+    threads, _ = simulate_scheduler(scheduler_name, threads, test_ticks, num_cpus=num_cpus)
+    return test_ticks, calculate_scheduler_metrics(threads)
+
+
+def _run_replicate_single(test: BenchmarkTest, scheduler_name: str, seed: int,
+                          max_ticks: int, num_cpus: int) -> List[Tuple[int, Dict]]:
+    """run_replicate_job 결과를 배치 작업과 같은 리스트 형식으로"""
+    return [run_replicate_job(test, scheduler_name, seed, max_ticks, num_cpus)]
+
+
+def run_replicate_batch_job(test: BenchmarkTest, scheduler_name: str, seeds: List[int],
+                            max_ticks: int) -> List[Tuple[int, Dict]]:
+    """
+    여러 seed를 BatchSimulator 한 번으로 실행 (워커 프로세스 진입점, basic/cfs)
+
+    Returns:
+        seed 순서의 (실제 사용한 시뮬레이션 시간, calculate_scheduler_metrics 결과)
+    """
+    workloads = [generate_workload(test.workload_type, test.thread_count, seed=seed)
+                 for seed in seeds]
+    limits = [suggest_max_ticks(test, threads, max_ticks) for threads in workloads]
+    BatchSimulator(scheduler_name, workloads).run(limits)
+    return [(limit, calculate_scheduler_metrics(threads))
+            for limit, threads in zip(limits, workloads)]
+
+
+def run_replicates(test: BenchmarkTest, seeds: Optional[List[int]] = None,
+                   max_ticks: int = 35000, num_cpus: int = 1, batch: bool = True,
+                   max_workers: Optional[int] = None,
+                   on_complete: Optional[Callable[[int, str], None]] = None
+                   ) -> ReplicateResult:
+    """
+    테스트 하나를 여러 seed로 반복 실행
+
+    (seed, 스케줄러) 쌍을 프로세스 풀에서 실행하고
+    generate_replicate_report로 신뢰구간/p-value 기반 승자를 결정.
+    batch=True이고 단일 CPU면 basic/cfs는 스케줄러당 BatchSimulator 작업 하나로
+    모든 seed를 함께 실행 (결과는 seed별 실행과 동일).
+
+    Args:
+        test: BenchmarkTest
+        seeds: 워크로드 seed 리스트 (None이면 DEFAULT_SEEDS, 2개 이상)
+        max_ticks: 최대 시뮬레이션 시간 (seed별로 suggest_max_ticks 적용)
+        num_cpus: CPU 수
+        batch: basic/cfs를 BatchSimulator로 실행할지
+        max_workers: 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 실행)
+        on_complete: seed 하나의 결과가 나올 때마다 (seed, scheduler_name)으로 호출
+    """
+    seeds = list(DEFAULT_SEEDS if seeds is None else seeds)
+    if len(seeds) < 2:
+        raise ValueError(f"At least 2 seeds are required: {seeds}")
+    for scheduler_name in test.schedulers:
+        if scheduler_name not in SCHEDULER_FACTORIES:
+            raise ValueError(f"Unknown scheduler: {scheduler_name}")
+
+    # 작업: (함수, 인자, 결과 키 리스트) - 함수는 키 순서의 결과 리스트를 돌려줌
+    jobs = []
+    for scheduler_name in test.schedulers:
+        if batch and num_cpus == 1 and scheduler_name in BATCH_SCHEDULERS:
+            jobs.append((run_replicate_batch_job, (test, scheduler_name, seeds, max_ticks),
+                         [(seed, scheduler_name) for seed in seeds]))
+        else:
+            jobs.extend(
+                (_run_replicate_single, (test, scheduler_name, seed, max_ticks, num_cpus),
+                 [(seed, scheduler_name)])
+                for seed in seeds
+            )
+    results: Dict[Tuple[int, str], Tuple[int, Dict]] = {}
+
+    def collect(keys, outputs):
+        for key, output in zip(keys, outputs):
+            results[key] = output
+            if on_complete is not None:
+                on_complete(*key)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1:
+        for fn, args, keys in jobs:
+            collect(keys, fn(*args))
+    else:
+        with _process_pool(workers) as executor:
+            futures = {executor.submit(fn, *args): keys for fn, args, keys in jobs}
+            for future in as_completed(futures):
+                collect(futures[future], future.result())
+
+    metrics = {
+        scheduler_name: [results[seed, scheduler_name][1] for seed in seeds]
+        for scheduler_name in test.schedulers
+    }
+    return ReplicateResult(
+        test=test,
+        seeds=seeds,
+        max_ticks={seed: results[seed, test.schedulers[0]][0] for seed in seeds},
+        metrics=metrics,
+        report=generate_replicate_report(metrics, primary_metric=test.primary_metric),
+    )
@@ -18,11 +18,11 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from copy import deepcopy
 from scheduler.basic_priority import BasicPriorityScheduler
 from scheduler.mlfqs import MLFQSScheduler
 from scheduler.cfs import CFSScheduler
 from workload.generator import generate_extreme_nice
+from workload.spec import WorkloadSpec
 from simulator.simulator import Simulator
 
 def analyze_cpu_distribution():
@@ -42,6 +42,7 @@ def analyze_cpu_distribution():
 
     # 워크로드 생성 (25개 nice -20, 25개 nice 19)
     threads = generate_extreme_nice(50, seed=42)
+    workload = WorkloadSpec.from_threads(threads)
 
     nice_minus20_threads = [t for t in threads if t.nice == -20]
     nice_19_threads = [t for t in threads if t.nice == 19]
@@ -59,9 +60,9 @@ def analyze_cpu_distribution():
         print(f"[{scheduler_name} 분석]")
         print(f"{'='*70}")
 
-        test_threads = deepcopy(threads)
+        test_threads = workload.instantiate()
         scheduler = scheduler_class()
-        sim = Simulator(scheduler, test_threads)
+        sim = Simulator(scheduler, test_threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         # CPU 시간 계산
@@ -127,15 +128,15 @@ def analyze_fairness_calculation():
     from workload.generator import generate_extreme_nice_fairness
     from analysis.insights import calculate_scheduler_metrics
 
-    threads = generate_extreme_nice_fairness(30, seed=42)
+    workload = WorkloadSpec.from_threads(generate_extreme_nice_fairness(30, seed=42))
     max_ticks = 9000
 
     for scheduler_name, scheduler_class in [("MLFQS", MLFQSScheduler), ("CFS", CFSScheduler)]:
         print(f"\n[{scheduler_name}]")
 
-        test_threads = deepcopy(threads)
+        test_threads = workload.instantiate()
         scheduler = scheduler_class()
-        sim = Simulator(scheduler, test_threads)
+        sim = Simulator(scheduler, test_threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         metrics = calculate_scheduler_metrics(test_threads)
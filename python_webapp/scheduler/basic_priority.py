@@ -15,7 +15,7 @@ Basic Priority Scheduler
 """
 
 from typing import List, Optional
-from .thread import Thread, ThreadStatus
+from .thread import Thread, RUNNING, READY
 
 # Pintos 우선순위 범위
 PRI_MIN = 0
@@ -38,6 +38,11 @@ class BasicPriorityScheduler:
         # Aging 관련 (옵션)
         self.aging_threshold = 100  # 100 tick 대기 시 priority +1
 
+    @property
+    def uses_wait_time(self) -> bool:
+        """tick()에서 thread.wait_time을 읽고 쓰는지 (aging)"""
+        return self.enable_aging
+
     def add_thread(self, thread: Thread):
         """스레드 추가"""
         # 초기 우선순위 설정 (nice 기반)
@@ -49,7 +54,7 @@ class BasicPriorityScheduler:
         if thread not in self.all_threads:
             self.all_threads.append(thread)
 
-        if thread.status == ThreadStatus.READY and thread not in self.ready_queue:
+        if thread.status == READY and thread not in self.ready_queue:
             self.ready_queue.append(thread)
 
     def pick_next(self) -> Optional[Thread]:
@@ -64,7 +69,7 @@ class BasicPriorityScheduler:
         for thread in self.ready_queue:
             if thread.priority == max_priority:
                 self.ready_queue.remove(thread)
-                thread.status = ThreadStatus.RUNNING
+                thread.status = RUNNING
                 return thread
 
         return None
@@ -84,9 +89,20 @@ class BasicPriorityScheduler:
                     thread.priority = min(PRI_MAX, thread.priority + 1)
                     thread.wait_time = 0
 
+    def tick_many(self, start_tick: int, n: int, running: Optional[Thread]):
+        """tick()을 n번 호출한 것과 같은 일괄 처리 (aging이 없으면 할 일 없음)"""
+        if running is None or not self.enable_aging:
+            return
+
+        for tick in range(start_tick, start_tick + n):
+            self.tick(tick, running)
+
+    def account_cpu(self, thread: Thread, ticks: int = 1):
+        """실행 스레드에 CPU 사용 시간 반영 (정적 우선순위라 할 일 없음)"""
+
     def thread_yield(self, thread: Thread):
         """스레드 양보"""
-        thread.status = ThreadStatus.READY
+        thread.status = READY
         self.ready_queue.append(thread)
 
     def thread_exit(self, thread: Thread):
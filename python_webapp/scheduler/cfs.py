@@ -14,7 +14,7 @@ CFS 스케줄러 (검증됨, 개선됨)
 
 from typing import Optional
 from sortedcontainers import SortedList
-from .thread import Thread, ThreadStatus
+from .thread import Thread, RUNNING, READY
 
 # Nice 값별 가중치 테이블 (Linux 커널과 100% 동일)
 # 출처: kernel/sched/core.c:10958
@@ -30,12 +30,17 @@ PRIO_TO_WEIGHT = [
     29, 23, 18, 15                       # nice 16~19
 ]
 
+def _vruntime_key(thread: Thread) -> int:
+    """ready queue 정렬 키 (lambda 대신 모듈 함수: 스냅샷 pickle 가능)"""
+    return thread.vruntime
+
+
 class CFSScheduler:
     """Completely Fair Scheduler (검증됨)"""
 
     def __init__(self):
         # SortedList: vruntime으로 자동 정렬
-        self.ready_queue = SortedList(key=lambda t: t.vruntime)
+        self.ready_queue = SortedList(key=_vruntime_key)
         self.min_vruntime = 0
         self.all_threads = []
 
@@ -87,7 +92,7 @@ class CFSScheduler:
         if thread not in self.all_threads:
             self.all_threads.append(thread)
 
-        if thread.status == ThreadStatus.READY and thread not in self.ready_queue:
+        if thread.status == READY and thread not in self.ready_queue:
             self.ready_queue.add(thread)
 
     def tick(self, current_tick: int, running: Optional[Thread]):
@@ -103,18 +108,39 @@ class CFSScheduler:
         # min_vruntime 업데이트 (개선됨!)
         self.update_min_vruntime()
 
+    def tick_many(self, start_tick: int, n: int, running: Optional[Thread]):
+        """
+        tick()을 n번 호출한 것과 같은 일괄 처리
+
+        ready queue가 바뀌지 않는 구간에서만 호출되므로
+        vruntime은 n * delta_fair, min_vruntime 갱신은 한 번이면 충분.
+        """
+        if running is None or n <= 0:
+            return
+
+        self.account_cpu(running, n)
+
+    def account_cpu(self, thread: Thread, ticks: int = 1):
+        """
+        실행 스레드에 CPU 사용 시간 반영 (tick 경계 작업 없음)
+
+        SMP 공유 큐에서 두 번째 이후 CPU의 실행 스레드에 사용.
+        """
+        thread.vruntime += ticks * self.calc_delta_fair(1, thread.weight)
+        self.update_min_vruntime()
+
     def pick_next(self) -> Optional[Thread]:
         """최소 vruntime 스레드 선택"""
         if not self.ready_queue:
             return None
 
         next_thread = self.ready_queue.pop(0)  # leftmost
-        next_thread.status = ThreadStatus.RUNNING
+        next_thread.status = RUNNING
         return next_thread
 
     def thread_yield(self, thread: Thread):
         """스레드 양보"""
-        thread.status = ThreadStatus.READY
+        thread.status = READY
         self.ready_queue.add(thread)  # 자동 정렬
 
     def thread_exit(self, thread: Thread):
@@ -2,17 +2,22 @@
 
 ✅ 개선사항:
   - 64개 독립 큐 (진짜 Multi-Level!)
-  - O(1) pick_next (기존 O(n) → O(64) = O(1))
+  - O(1) pick_next: 비어 있지 않은 큐 비트맵의 최상위 비트 (FreeBSD runq의 rq_status)
   - O(1) thread_yield (기존 O(n log n) → O(1))
   - FreeBSD 구조와 정확히 일치
 
 핵심:
   - Priority 동적 계산: priority = PRI_MAX - (recent_cpu/4) - (nice*2)
   - Load average, Recent CPU 기반 (4.4BSD 공식)
+  - 큐 비트맵은 큐 점유 통계로도 사용 (occupancy, occupied_levels)
+  - load_avg의 ready 스레드 수는 실행 가능(READY/RUNNING) 스레드 집합으로 O(1)
+    (add_thread/thread_block/thread_exit에서 갱신, 계수는 모듈 상수)
+  - 4 tick 재계산은 증분: TIMER_FREQ 경계 사이에는 recent_cpu가 바뀐 스레드
+    (실행 스레드)만 다시 계산하고 priority가 바뀐 스레드만 큐 이동
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from collections import deque
-from .thread import Thread, ThreadStatus
+from .thread import Thread, RUNNING, READY, BLOCKED, TERMINATED
 from .fixed_point import FP
 
 PRI_MIN = 0
@@ -20,15 +25,32 @@ PRI_MAX = 63
 NUM_PRIORITIES = 64
 TIMER_FREQ = 100
 
+# load_avg 계수 (고정소수점 59/60, 1/60)
+LOAD_AVG_DECAY = FP.fp_div(FP.int_to_fp(59), FP.int_to_fp(60))
+LOAD_AVG_READY = FP.fp_div(FP.int_to_fp(1), FP.int_to_fp(60))
+
 class MLFQSScheduler:
     """Multi-Level Feedback Queue Scheduler (64-Queue 구현)"""
 
-    def __init__(self):
+    def __init__(self, incremental: bool = True):
+        """
+        Args:
+            incremental: True면 TIMER_FREQ 경계 사이의 재계산은 recent_cpu가 바뀐 스레드만
+                         (False면 4 tick마다 전체 재계산, 결과는 동일)
+        """
         # 64개 독립 큐 (FreeBSD 방식!)
         self.ready_queues: List[deque] = [deque() for _ in range(NUM_PRIORITIES)]
+        # 비어 있지 않은 큐 비트맵 (bit p = ready_queues[p]에 스레드가 있음)
+        self._occupied = 0
 
         self.load_avg = 0  # 고정소수점
         self.all_threads: List[Thread] = []
+        # all_threads 중 BLOCKED/TERMINATED가 아닌 스레드 (id)
+        self._runnable = set()
+
+        self.incremental = incremental
+        # 마지막 재계산 이후 recent_cpu가 바뀐 스레드 (중복 가능, 재계산 때 정리)
+        self._changed: List[Thread] = []
 
     def calculate_priority(self, thread: Thread):
         """priority = PRI_MAX - (recent_cpu/4) - (nice*2)"""
@@ -45,30 +67,46 @@ class MLFQSScheduler:
     def increment_recent_cpu(self, thread: Thread):
         """실행 중인 스레드 recent_cpu 증가"""
         thread.recent_cpu = FP.fp_add_int(thread.recent_cpu, 1)
+        self._mark_changed(thread)
+
+    def _mark_changed(self, thread: Thread):
+        """다음 증분 재계산 대상에 추가 (같은 스레드가 연속이면 한 번만)"""
+        changed = self._changed
+        if not changed or changed[-1] is not thread:
+            changed.append(thread)
+
+    @property
+    def nr_runnable(self) -> int:
+        """실행 가능(READY/RUNNING) 스레드 수"""
+        return len(self._runnable)
 
     def update_load_avg(self, running: Optional[Thread]):
-        """load_avg = (59/60)*load_avg + (1/60)*ready_threads"""
-        ready_count = sum(1 for t in self.all_threads
-                         if t.status != ThreadStatus.TERMINATED
-                         and t.status != ThreadStatus.BLOCKED)
+        """
+        load_avg = (59/60)*load_avg + (1/60)*ready_threads
+
+        ready_threads = 실행 가능 스레드 수 (실행 중 스레드 포함) + 실행 중 스레드 1
+        (실행 중 스레드를 두 번 세는 기존 계산 유지)
+        """
+        ready_count = len(self._runnable)
 
         if running is not None:
             ready_count += 1
 
-        coef_59_60 = FP.fp_div(FP.int_to_fp(59), FP.int_to_fp(60))
-        coef_1_60 = FP.fp_div(FP.int_to_fp(1), FP.int_to_fp(60))
-
-        term1 = FP.fp_mul(coef_59_60, self.load_avg)
-        term2 = FP.fp_mul_int(coef_1_60, ready_count)
+        term1 = FP.fp_mul(LOAD_AVG_DECAY, self.load_avg)
+        term2 = FP.fp_mul_int(LOAD_AVG_READY, ready_count)
         self.load_avg = FP.fp_add(term1, term2)
 
+    def recent_cpu_coef(self) -> int:
+        """recent_cpu 감쇠 계수 (2*load_avg)/(2*load_avg+1), 고정소수점"""
+        two_load = FP.fp_mul_int(self.load_avg, 2)
+        return FP.fp_div(two_load, FP.fp_add_int(two_load, 1))
+
     def update_recent_cpu_all(self):
         """recent_cpu = (2*load_avg)/(2*load_avg+1) * recent_cpu + nice"""
-        two_load = FP.fp_mul_int(self.load_avg, 2)
-        coef = FP.fp_div(two_load, FP.fp_add_int(two_load, 1))
+        coef = self.recent_cpu_coef()
 
         for thread in self.all_threads:
-            if thread.status != ThreadStatus.TERMINATED:
+            if thread.status != TERMINATED:
                 thread.recent_cpu = FP.fp_add_int(
                     FP.fp_mul(coef, thread.recent_cpu),
                     thread.nice
@@ -87,30 +125,105 @@ class MLFQSScheduler:
                 all_ready_threads.append(self.ready_queues[pri].popleft())
 
         # Priority 재계산
-        for thread in self.all_threads:
-            if thread.status != ThreadStatus.TERMINATED:
-                old_priority = thread.priority
-                self.calculate_priority(thread)
+        self.calculate_priority_all()
 
         # 새로운 priority에 맞게 재배치
+        occupied = 0
         for thread in all_ready_threads:
             self.ready_queues[thread.priority].append(thread)
+            occupied |= 1 << thread.priority
+        self._occupied = occupied
+        self._changed.clear()
+
+    def calculate_priority_all(self):
+        """모든 스레드 우선순위 계산 (큐 재배치 없음)"""
+        for thread in self.all_threads:
+            if thread.status != TERMINATED:
+                self.calculate_priority(thread)
+
+    def recalculate_priority_changed(self):
+        """
+        recent_cpu가 바뀐 스레드만 우선순위 재계산 (recalculate_priority_all과 같은 결과)
+
+        전체 재계산은 큐를 priority 낮은 순 → 큐 안 순서로 꺼내 다시 넣으므로
+        priority가 바뀐 READY 스레드는 새 큐에서
+          - 더 낮은 priority에서 올라온 스레드: 기존 스레드 앞
+          - 더 높은 priority에서 내려온 스레드: 기존 스레드 뒤
+        에 (이전 priority, 이전 큐 안 순서)대로 놓임. 바뀌지 않은 스레드의 순서는 그대로.
+        """
+        movers: Dict[int, Dict[int, Thread]] = {}  # 이전 priority → id → 스레드
+        seen = set()
+        for thread in self._changed:
+            if id(thread) in seen or thread.status == TERMINATED:
+                continue
+            seen.add(id(thread))
+            old_priority = thread.priority
+            self.calculate_priority(thread)
+            if thread.priority != old_priority and thread.status == READY:
+                movers.setdefault(old_priority, {})[id(thread)] = thread
+        self._changed.clear()
+        if not movers:
+            return
+
+        # 이전 큐에서 빼기 (이전 priority 낮은 순, 큐 안 순서 유지)
+        moved = []
+        for old_priority in sorted(movers):
+            leaving = movers[old_priority]
+            queue = self.ready_queues[old_priority]
+            moved.extend((old_priority, t) for t in queue if id(t) in leaving)
+            queue = deque(t for t in queue if id(t) not in leaving)
+            self.ready_queues[old_priority] = queue
+            if not queue:
+                self._occupied &= ~(1 << old_priority)
+
+        # priority가 오른 스레드는 새 큐 앞에, 내린 스레드는 뒤에
+        front: Dict[int, List[Thread]] = {}
+        for old_priority, thread in moved:
+            if old_priority < thread.priority:
+                front.setdefault(thread.priority, []).append(thread)
+            else:
+                self.ready_queues[thread.priority].append(thread)
+            self._occupied |= 1 << thread.priority
+        for priority, threads in front.items():
+            self.ready_queues[priority].extendleft(reversed(threads))
+
+    def _is_new(self, thread: Thread) -> bool:
+        """처음 추가되는 스레드인지"""
+        return thread not in self.all_threads
+
+    def _register(self, thread: Thread):
+        """처음 추가되는 스레드 등록 (recent_cpu 초기화)"""
+        thread.recent_cpu = 0
+        self.all_threads.append(thread)
 
     def add_thread(self, thread: Thread):
         """스레드 추가"""
-        is_new = thread not in self.all_threads
-
-        if is_new:
-            thread.recent_cpu = 0
-            self.all_threads.append(thread)
+        if self._is_new(thread):
+            self._register(thread)
+        if thread.status != BLOCKED and thread.status != TERMINATED:
+            self._runnable.add(id(thread))
 
         # priority는 최신 상태로 유지
         self.calculate_priority(thread)
 
-        if thread.status == ThreadStatus.READY:
+        if thread.status == READY:
             # 해당 priority 큐에 추가 (O(1)!)
             if thread not in self.ready_queues[thread.priority]:
                 self.ready_queues[thread.priority].append(thread)
+                self._occupied |= 1 << thread.priority
+
+    def add_migrated_thread(self, thread: Thread):
+        """
+        다른 CPU 스케줄러에서 옮겨 온 스레드 추가 (SMP idle steal)
+
+        새 스레드와 달리 이전 CPU에서 쌓은 recent_cpu를 유지.
+        """
+        if self._is_new(thread):
+            recent_cpu = thread.recent_cpu
+            self._register(thread)
+            thread.recent_cpu = recent_cpu
+            self._mark_changed(thread)
+        self.add_thread(thread)
 
     def tick(self, current_tick: int, running: Optional[Thread]):
         """매 틱마다 호출"""
@@ -122,21 +235,57 @@ class MLFQSScheduler:
             self.update_recent_cpu_all()
 
         if current_tick % 4 == 0:
-            self.recalculate_priority_all()
+            # recent_cpu 감쇠(TIMER_FREQ 경계) 직후는 모든 스레드가 바뀌므로 전체 재계산
+            if self.incremental and current_tick % TIMER_FREQ != 0:
+                self.recalculate_priority_changed()
+            else:
+                self.recalculate_priority_all()
 
-    def pick_next(self) -> Optional[Thread]:
+    def tick_many(self, start_tick: int, n: int, running: Optional[Thread]):
         """
-        최고 우선순위 스레드 선택 (O(64) = O(1))
+        tick()을 n번 호출한 것과 같은 일괄 처리
 
-        63 (highest) → 0 (lowest) 순서로 non-empty queue 찾기
+        4 tick / TIMER_FREQ 경계에서만 tick()을 호출하고,
+        그 사이 구간은 recent_cpu를 한 번에 증가.
         """
-        for pri in range(PRI_MAX, PRI_MIN - 1, -1):
-            if self.ready_queues[pri]:
-                next_thread = self.ready_queues[pri].popleft()
-                next_thread.status = ThreadStatus.RUNNING
-                return next_thread
+        tick = start_tick
+        end = start_tick + n
+        while tick < end:
+            boundary = min(tick + (-tick % 4), tick + (-tick % TIMER_FREQ), end)
+            if running is not None and boundary > tick:
+                running.recent_cpu = FP.fp_add_int(running.recent_cpu, boundary - tick)
+                self._mark_changed(running)
+            tick = boundary
+            if tick < end:
+                self.tick(tick, running)
+                tick += 1
+
+    def account_cpu(self, thread: Thread, ticks: int = 1):
+        """
+        실행 스레드에 CPU 사용 시간 반영 (tick 경계 작업 없음)
+
+        SMP 공유 큐에서 두 번째 이후 CPU의 실행 스레드에 사용.
+        """
+        thread.recent_cpu = FP.fp_add_int(thread.recent_cpu, ticks)
+        self._mark_changed(thread)
+
+    def pick_next(self) -> Optional[Thread]:
+        """
+        최고 우선순위 스레드 선택 (O(1))
 
-        return None
+        비어 있지 않은 큐 비트맵의 최상위 비트 = 가장 높은 non-empty queue
+        """
+        occupied = self._occupied
+        if not occupied:
+            return None
+
+        pri = occupied.bit_length() - 1
+        queue = self.ready_queues[pri]
+        next_thread = queue.popleft()
+        if not queue:
+            self._occupied = occupied & ~(1 << pri)
+        next_thread.status = RUNNING
+        return next_thread
 
     def thread_yield(self, thread: Thread):
         """
@@ -144,16 +293,59 @@ class MLFQSScheduler:
 
         해당 priority 큐의 맨 뒤에 추가 (FIFO)
         """
-        thread.status = ThreadStatus.READY
+        thread.status = READY
 
         # 현재 priority의 큐에 추가 (O(1)!)
         self.ready_queues[thread.priority].append(thread)
+        self._occupied |= 1 << thread.priority
+
+    def thread_block(self, thread: Thread):
+        """스레드 I/O 대기 (BLOCKED, 큐에는 없음) → 실행 가능 수에서 제외"""
+        self._runnable.discard(id(thread))
 
     def thread_exit(self, thread: Thread):
         """스레드 종료"""
+        self._runnable.discard(id(thread))
+
         # 해당 priority 큐에서 제거
-        if thread in self.ready_queues[thread.priority]:
-            self.ready_queues[thread.priority].remove(thread)
+        queue = self.ready_queues[thread.priority]
+        if thread in queue:
+            queue.remove(thread)
+            if not queue:
+                self._occupied &= ~(1 << thread.priority)
 
         if thread in self.all_threads:
             self.all_threads.remove(thread)
+
+    # ========== 큐 점유 통계 ==========
+
+    @property
+    def occupancy(self) -> int:
+        """비어 있지 않은 큐 비트맵 (bit p = priority p 큐에 READY 스레드가 있음)"""
+        return self._occupied
+
+    @property
+    def occupied_count(self) -> int:
+        """비어 있지 않은 큐 수"""
+        return bin(self._occupied).count("1")
+
+    def occupied_levels(self) -> List[int]:
+        """비어 있지 않은 큐의 priority (높은 순)"""
+        levels = []
+        occupied = self._occupied
+        while occupied:
+            pri = occupied.bit_length() - 1
+            levels.append(pri)
+            occupied &= ~(1 << pri)
+        return levels
+
+    def __getstate__(self):
+        # id() 기반 집합은 복원된 객체에서 의미가 없으므로 빼고 상태로 다시 만듦
+        state = self.__dict__.copy()
+        del state['_runnable']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._runnable = {id(t) for t in self.all_threads
+                          if t.status != BLOCKED and t.status != TERMINATED}
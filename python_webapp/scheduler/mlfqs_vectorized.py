@@ -0,0 +1,109 @@
+"""MLFQS 스케줄러 (NumPy 벡터화 변형)
+
+스레드 수가 많을 때 TIMER_FREQ마다 하는 전체 계산
+  - recent_cpu 감쇠: recent_cpu = coef * recent_cpu + nice
+  - priority 계산: priority = PRI_MAX - (recent_cpu/4) - (nice*2)
+을 스레드별 FP 메서드 호출 대신 int64 배열 연산으로 한 번에 수행.
+
+배열(슬롯 = 스케줄러에 추가된 순서)에 recent_cpu, nice, priority를 보관하고
+값이 바뀐 스레드에만 Thread 필드를 다시 씀 (히스토리/메트릭은 Thread 필드를 읽음).
+17.14 고정소수점 연산은 fixed_point.py와 같은 내림 나눗셈(//)이라
+결과는 MLFQSScheduler와 비트 단위로 동일 (int64 범위: |recent_cpu| < 2^63 / 2^14).
+큐, load_avg, 증분 재계산은 MLFQSScheduler 그대로 사용.
+"""
+from typing import Dict, List
+import numpy as np
+from .thread import Thread
+from .fixed_point import FP
+from .mlfqs import MLFQSScheduler, PRI_MIN, PRI_MAX
+
+_INITIAL_CAPACITY = 64
+
+
+class VectorizedMLFQSScheduler(MLFQSScheduler):
+    """recent_cpu 감쇠와 priority 전체 계산을 배열 연산으로 하는 MLFQS"""
+
+    def __init__(self, incremental: bool = True):
+        super().__init__(incremental=incremental)
+        self._threads: List[Thread] = []        # 슬롯 → 스레드
+        self._slot: Dict[int, int] = {}          # id(스레드) → 슬롯 (종료한 스레드는 제거)
+        self._alive = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._recent_cpu = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._nice = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._priority = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+    def _is_new(self, thread: Thread) -> bool:
+        """슬롯 조회로 판단 (all_threads 전체 비교 없음)"""
+        return id(thread) not in self._slot
+
+    def _register(self, thread: Thread):
+        """새 스레드 등록 + 슬롯 할당 (배열이 차면 두 배로 늘림)"""
+        super()._register(thread)
+        slot = len(self._threads)
+        if slot == len(self._alive):
+            for name in ('_alive', '_recent_cpu', '_nice', '_priority'):
+                arr = getattr(self, name)
+                grown = np.zeros(2 * len(arr), dtype=arr.dtype)
+                grown[:slot] = arr
+                setattr(self, name, grown)
+        self._threads.append(thread)
+        self._slot[id(thread)] = slot
+        self._alive[slot] = True
+        self._recent_cpu[slot] = thread.recent_cpu
+        self._nice[slot] = thread.nice
+
+    def thread_exit(self, thread: Thread):
+        """스레드 종료 (슬롯은 비활성으로 남김)"""
+        super().thread_exit(thread)
+        slot = self._slot.pop(id(thread), None)
+        if slot is not None:
+            self._alive[slot] = False
+
+    def calculate_priority(self, thread: Thread):
+        """스레드 하나 계산 (증분 재계산/추가 시), 배열도 갱신"""
+        super().calculate_priority(thread)
+        slot = self._slot.get(id(thread))
+        if slot is not None:
+            self._priority[slot] = thread.priority
+
+    def _mark_changed(self, thread: Thread):
+        """실행으로 바뀐 recent_cpu를 배열에 반영"""
+        super()._mark_changed(thread)
+        slot = self._slot.get(id(thread))
+        if slot is not None:
+            self._recent_cpu[slot] = thread.recent_cpu
+
+    def update_recent_cpu_all(self):
+        """recent_cpu = coef * recent_cpu + nice (살아 있는 모든 슬롯을 한 번에)"""
+        n = len(self._threads)
+        if not n:
+            return
+        coef = self.recent_cpu_coef()
+        recent_cpu = self._recent_cpu[:n]
+        # FP.fp_add_int(FP.fp_mul(coef, recent_cpu), nice)
+        decayed = (coef * recent_cpu) // FP.F + self._nice[:n] * FP.F
+        decayed = np.where(self._alive[:n], decayed, recent_cpu)
+        self._write_back(decayed, recent_cpu, 'recent_cpu')
+
+    def calculate_priority_all(self):
+        """priority = PRI_MAX - (recent_cpu/4) - (nice*2) (살아 있는 모든 슬롯을 한 번에)"""
+        n = len(self._threads)
+        if not n:
+            return
+        # FP.fp_to_int_trunc(int_to_fp(PRI_MAX) - fp_div_int(recent_cpu, 4) - int_to_fp(nice*2))
+        fp_priority = PRI_MAX * FP.F - self._recent_cpu[:n] // 4 - self._nice[:n] * 2 * FP.F
+        priority = np.clip(fp_priority // FP.F, PRI_MIN, PRI_MAX)
+        priority = np.where(self._alive[:n], priority, self._priority[:n])
+        self._write_back(priority, self._priority[:n], 'priority')
+
+    def _write_back(self, new: np.ndarray, current: np.ndarray, field: str):
+        """배열 갱신 후 값이 바뀐 슬롯의 스레드 필드에만 기록"""
+        changed = np.flatnonzero(new != current)
+        current[:] = new
+        threads = self._threads
+        for slot, value in zip(changed.tolist(), new[changed].tolist()):
+            setattr(threads[slot], field, value)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._slot = {id(t): slot for slot, t in enumerate(self._threads) if self._alive[slot]}
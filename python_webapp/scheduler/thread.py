@@ -1,17 +1,28 @@
 """스레드 시뮬레이션 (3개 스케줄러 공통)"""
-from enum import Enum
-from dataclasses import dataclass
+from enum import IntEnum
+from dataclasses import dataclass, fields
 from typing import Optional
 
-class ThreadStatus(Enum):
+class ThreadStatus(IntEnum):
     RUNNING = 0
     READY = 1
     BLOCKED = 2
     TERMINATED = 3
 
-@dataclass
+# 핫 패스용 상태 상수 (ThreadStatus.X 클래스 속성 조회 없이 작은 int로 비교)
+RUNNING = ThreadStatus.RUNNING
+READY = ThreadStatus.READY
+BLOCKED = ThreadStatus.BLOCKED
+TERMINATED = ThreadStatus.TERMINATED
+
+@dataclass(slots=True, eq=False)
 class Thread:
-    """시뮬레이션 스레드"""
+    """
+    시뮬레이션 스레드
+
+    __slots__로 인스턴스 dict 없이 저장 (스레드 수천 개 이상에서 메모리/속성 접근 절약).
+    비교(==)는 기존 dataclass와 같이 모든 필드를 비교하되 tid부터 확인.
+    """
     tid: int
     name: str
     status: ThreadStatus = ThreadStatus.READY
@@ -44,9 +55,25 @@ class Thread:
     wait_time: int = 0
     last_scheduled: int = -1
     runnable_time: int = 0  # READY or RUNNING 상태로 있었던 시간
+    state_since: int = 0  # 현재 상태에 들어온 tick (wait/runnable 지연 정산용)
     # 시뮬레이션 전체 컨텍스트 스위치 수 (메트릭 계산용)
     context_switches: int = 0
 
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # 대부분 tid가 달라 바로 끝남 (ready queue/all_threads 포함 여부 검사)
+        if self.tid != other.tid:
+            return False
+        return _field_values(self) == _field_values(other)
+
     def __repr__(self):
         return (f"Thread({self.tid}, pri={self.priority}, "
                 f"nice={self.nice}, vr={self.vruntime})")
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Thread))
+
+
+def _field_values(thread: Thread) -> tuple:
+    return tuple(getattr(thread, name) for name in _FIELD_NAMES)
@@ -0,0 +1,156 @@
+"""
+스레드 테이블 (struct-of-arrays 상태 저장소)
+
+스레드 필드를 객체별로 두는 대신 필드별 연속 NumPy 배열에 저장.
+  - 행 = 스레드 (입력 리스트 순서), tid 열과 tid → 행 조회 제공
+  - rows(): Thread와 같은 속성을 가진 행 뷰 (ThreadRow)
+    → Simulator와 세 스케줄러가 그대로 사용하고, 모든 읽기/쓰기는 배열로 감
+  - 메트릭은 열 배열을 바로 읽음 (calculate_scheduler_metrics)
+  - thread_columns(): Thread 리스트에서 필요한 열만 배열로 (테이블 전체 변환 없이)
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from .thread import Thread, ThreadStatus
+
+# priority가 None인 스레드 (CFS, 아직 도착하지 않은 Basic/MLFQS)
+NO_PRIORITY = -1
+
+# 테이블 열 (name 제외 Thread 필드 전체, 순서도 Thread와 동일)
+TABLE_FIELDS = tuple(f.name for f in fields(Thread) if f.name != 'name')
+_DTYPES = {name: np.int8 if name == 'status' else np.int64 for name in TABLE_FIELDS}
+_STATUS_BY_CODE = tuple(sorted(ThreadStatus))
+
+
+def thread_columns(threads: List[Thread], names: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Thread 리스트 → 지정한 열만 배열로 (필드 하나당 attrgetter 순회 한 번)
+
+    priority의 None은 NO_PRIORITY로 저장 (ThreadTable과 동일).
+    """
+    count = len(threads)
+    columns = {}
+    for name in names:
+        values = map(attrgetter(name), threads)
+        if name == 'priority':
+            values = (NO_PRIORITY if v is None else v for v in values)
+        columns[name] = np.fromiter(values, dtype=_DTYPES[name], count=count)
+    return columns
+
+
+class ThreadTable:
+    """필드별 NumPy 배열로 저장한 스레드 집합"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], names: List[str]):
+        """
+        Args:
+            columns: 필드 이름 → 배열 (TABLE_FIELDS 전부, 길이 동일)
+            names: 행별 스레드 이름
+        """
+        self.names = names
+        self._set_columns(columns)
+        self._rows: Optional[List['ThreadRow']] = None
+        self._row_of_tid: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def from_threads(cls, threads: List[Thread]) -> 'ThreadTable':
+        """Thread 리스트 → 테이블 (값 복사)"""
+        return cls(thread_columns(threads, TABLE_FIELDS), [t.name for t in threads])
+
+    def _set_columns(self, columns: Dict[str, np.ndarray]):
+        """열 배열과 행 뷰용 memoryview (원소 하나 읽기/쓰기가 NumPy 인덱싱보다 빠름)"""
+        self.columns = columns
+        # 배열 버퍼 형식('=q' 등)을 바이트를 거쳐 네이티브 형식 문자로 cast
+        self._views = {name: memoryview(arr).cast('B').cast(arr.dtype.char)
+                       for name, arr in columns.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """열 배열 (뷰, 수정하면 테이블이 바뀜)"""
+        return self.columns[name]
+
+    def row_of(self, tid: int) -> int:
+        """tid → 행 번호"""
+        if self._row_of_tid is None:
+            self._row_of_tid = {int(tid): idx for idx, tid in enumerate(self.columns['tid'])}
+        return self._row_of_tid[tid]
+
+    def rows(self) -> List['ThreadRow']:
+        """행 뷰 리스트 (같은 행은 항상 같은 객체)"""
+        if self._rows is None:
+            self._rows = [ThreadRow(self, idx) for idx in range(len(self))]
+        return self._rows
+
+    def to_threads(self) -> List[Thread]:
+        """테이블 → 새 Thread 리스트 (값 복사)"""
+        return [row.to_thread() for row in self.rows()]
+
+
+class ThreadRow:
+    """
+    ThreadTable 한 행의 뷰
+
+    Thread와 같은 속성 이름으로 읽고 쓰며 값은 테이블 배열에 저장.
+    읽은 값은 Python int (status는 ThreadStatus, 없는 priority는 None).
+    """
+
+    __slots__ = ('_table', '_idx')
+
+    def __init__(self, table: ThreadTable, idx: int):
+        self._table = table
+        self._idx = idx
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._idx]
+
+    @property
+    def status(self) -> ThreadStatus:
+        return _STATUS_BY_CODE[self._table._views['status'][self._idx]]
+
+    @status.setter
+    def status(self, value: ThreadStatus):
+        self._table._views['status'][self._idx] = value
+
+    @property
+    def priority(self) -> Optional[int]:
+        value = self._table._views['priority'][self._idx]
+        return None if value == NO_PRIORITY else value
+
+    @priority.setter
+    def priority(self, value: Optional[int]):
+        self._table._views['priority'][self._idx] = NO_PRIORITY if value is None else value
+
+    def to_thread(self) -> Thread:
+        """같은 값을 가진 독립 Thread"""
+        values = {name: getattr(self, name) for name in TABLE_FIELDS}
+        return Thread(name=self.name, **values)
+
+    def __eq__(self, other):
+        if other.__class__ is not ThreadRow:
+            return NotImplemented
+        return other._table is self._table and other._idx == self._idx
+
+    def __repr__(self):
+        return (f"Thread({self.tid}, pri={self.priority}, "
+                f"nice={self.nice}, vr={self.vruntime})")
+
+
+def _int_column(name: str) -> property:
+    """정수 열 하나를 읽고 쓰는 ThreadRow 속성"""
+    def fget(row: ThreadRow) -> int:
+        return row._table._views[name][row._idx]
+
+    def fset(row: ThreadRow, value: int):
+        row._table._views[name][row._idx] = value
+
+    return property(fget, fset)
+
+
+for _name in TABLE_FIELDS:
+    if _name not in ('status', 'priority'):
+        setattr(ThreadRow, _name, _int_column(_name))
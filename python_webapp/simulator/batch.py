@@ -0,0 +1,368 @@
+"""
+배치 시뮬레이션 엔진 (여러 seed 동시 실행)
+
+같은 테스트를 여러 seed로 반복할 때 seed별 Simulator 대신
+(seed × 스레드) NumPy 배열로 모든 seed를 함께 진행.
+  - seed마다 다음 이벤트 tick으로 바로 이동 (Simulator event 엔진과 같은 규칙)
+  - 스케줄링 결정: CFS는 vruntime argmin, Basic은 priority argmax (seed별 동시)
+  - 같은 키는 ready queue 삽입 순서 (seq)로 결정 → Simulator와 동일한 선택
+  - 결과는 seed별 스레드 리스트에 다시 기록 (calculate_scheduler_metrics 호환)
+
+지원 범위: 단일 CPU, 히스토리 없음, "basic"(aging 없음) / "cfs".
+seed별 결과는 Simulator(engine="tick" 또는 "event")와 동일.
+"""
+
+from typing import List, Sequence, Union
+import numpy as np
+from scheduler.thread import Thread, ThreadStatus, RUNNING, READY, BLOCKED, TERMINATED
+from scheduler.cfs import CFSScheduler
+from scheduler.basic_priority import PRI_MIN, PRI_DEFAULT, PRI_MAX
+from simulator.simulator import MIN_IO_DURATION, MAX_IO_DURATION
+
+BATCH_SCHEDULERS = ("basic", "cfs")
+
+_STATUS_BY_VALUE = {int(s): s for s in ThreadStatus}
+_NEVER = np.iinfo(np.int64).max
+
+
+class BatchSimulator:
+    """여러 워크로드(seed)를 동시에 실행하는 벡터화 시뮬레이터"""
+
+    def __init__(self, scheduler: str, workloads: List[List[Thread]], time_slice: int = 4):
+        """
+        Args:
+            scheduler: "basic" 또는 "cfs"
+            workloads: seed별 스레드 리스트 (스레드 수가 달라도 됨)
+            time_slice: 시간 조각 (ticks)
+        """
+        if scheduler not in BATCH_SCHEDULERS:
+            raise ValueError(f"Unsupported scheduler for batch simulation: {scheduler}")
+
+        self.scheduler = scheduler
+        self.workloads = workloads
+        self.time_slice = time_slice
+
+        S = len(workloads)
+        N = max((len(threads) for threads in workloads), default=0)
+        self._shape = (S, N)
+        # ready queue 삽입 순서: tick * _seq_stride + (도착 idx | N + I/O idx | 2N 양보)
+        self._seq_stride = 2 * N + 1
+
+        def field(getter, fill=0):
+            arr = np.full((S, N), fill, dtype=np.int64)
+            for s, threads in enumerate(workloads):
+                arr[s, :len(threads)] = [getter(t) for t in threads]
+            return arr
+
+        self.valid = np.zeros((S, N), dtype=bool)
+        for s, threads in enumerate(workloads):
+            self.valid[s, :len(threads)] = True
+        self.n_threads = np.array([len(threads) for threads in workloads], dtype=np.int64)
+
+        self.tid = field(lambda t: t.tid)
+        # 빈 칸과 arrival_time < 0 스레드는 도착하지 않음
+        self.arrival = np.where(self.valid, field(lambda t: t.arrival_time), -1)
+        self.remaining = field(lambda t: t.remaining_time)
+        self.io_frequency = field(lambda t: t.io_frequency)
+        io_duration = field(lambda t: t.io_duration)
+        self.has_io = (self.io_frequency > 0) & (io_duration > 0)
+        self.io_block = np.clip(io_duration, MIN_IO_DURATION, MAX_IO_DURATION)
+        self.vruntime = field(lambda t: t.vruntime)
+        self.weight = field(lambda t: t.weight)
+        self.start_time = field(lambda t: t.start_time)
+        self.finish_time = field(lambda t: t.finish_time)
+        self.wait_time = field(lambda t: t.wait_time)
+        self.runnable_time = field(lambda t: t.runnable_time)
+        self.last_scheduled = field(lambda t: t.last_scheduled)
+        self.state_since = field(lambda t: t.state_since)
+
+        if scheduler == "cfs":
+            weights = np.array([CFSScheduler.get_weight(n) for n in range(-20, 20)], dtype=np.int64)
+            nice = np.clip(field(lambda t: t.nice), -20, 19)
+            self.new_weight = weights[nice + 20]
+            self.delta_fair = (1024 * 1000) // np.maximum(self.new_weight, 1)
+        else:
+            # 정적 우선순위 (add_thread에서 한 번 정해지고 aging 없이는 변하지 않음)
+            self.priority_set = field(lambda t: t.priority is not None, fill=False).astype(bool)
+            default = np.clip(PRI_DEFAULT - field(lambda t: t.nice), PRI_MIN, PRI_MAX)
+            given = field(lambda t: 0 if t.priority is None else t.priority)
+            self.priority = np.where(self.priority_set, given, default)
+
+        # 실행 상태 (도착 전은 BLOCKED)
+        self.status = np.full((S, N), BLOCKED, dtype=np.int64)
+        self.arrived = np.zeros((S, N), dtype=bool)
+        self.seq = np.zeros((S, N), dtype=np.int64)
+        self.cpu_since_io = np.zeros((S, N), dtype=np.int64)
+        self.wake_tick = np.full((S, N), _NEVER, dtype=np.int64)
+        # ready queue 정렬 키 (CFS: vruntime, Basic: -priority), READY가 아니면 _NEVER
+        # READY인 동안에는 키가 바뀌지 않으므로 상태 전이 때만 갱신
+        self.ready_key = np.full((S, N), _NEVER, dtype=np.int64)
+
+        # seed별 도착 순서 (arrival_time, 리스트 순서), 도착하지 않는 칸은 _NEVER
+        # 마지막 열은 끝 표시 (_NEVER)
+        arrival_key = np.where(self.arrival >= 0, self.arrival, _NEVER)
+        self.arrival_order = np.argsort(arrival_key, axis=1, kind='stable')
+        self.arrival_sorted = np.full((S, N + 1), _NEVER, dtype=np.int64)
+        self.arrival_sorted[:, :N] = np.take_along_axis(arrival_key, self.arrival_order, axis=1)
+        self.next_arrival = np.zeros(S, dtype=np.int64)  # arrival_sorted 위치
+        self.next_wake = np.full(S, _NEVER, dtype=np.int64)
+
+        # seed별 CPU 상태
+        self.running = np.full(S, -1, dtype=np.int64)
+        self.slice_remaining = np.zeros(S, dtype=np.int64)
+        self.prev_running_tid = np.zeros(S, dtype=np.int64)
+        self.has_prev = np.zeros(S, dtype=bool)
+        self.context_switches = np.zeros(S, dtype=np.int64)
+        self.min_vruntime = np.zeros(S, dtype=np.int64)
+        self.terminated_count = np.zeros(S, dtype=np.int64)
+        self.current_tick = np.zeros(S, dtype=np.int64)
+        self.done = np.zeros(S, dtype=bool)
+        # 직전 조용한 구간에서 min_vruntime을 이미 갱신한 seed
+        self._forwarded = np.zeros(S, dtype=bool)
+
+    def run(self, max_ticks: Union[int, Sequence[int]] = 10000) -> List[List[Thread]]:
+        """
+        시뮬레이션 실행
+
+        seed는 서로 독립이므로 seed마다 자기 다음 이벤트 tick으로 바로 이동
+        (Simulator event 엔진과 같은 규칙, seed 간 시계는 다를 수 있음).
+
+        Args:
+            max_ticks: 최대 시뮬레이션 시간 (정수 또는 seed별 리스트)
+
+        Returns:
+            시뮬레이션 결과가 기록된 seed별 스레드 리스트 (입력 리스트와 동일 객체)
+        """
+        S, _ = self._shape
+        limits = np.broadcast_to(np.asarray(max_ticks, dtype=np.int64), (S,)).copy()
+        self.done[:] = limits <= 0
+
+        rows = np.flatnonzero(~self.done)
+        ticks = np.zeros(len(rows), dtype=np.int64)
+        while len(rows):
+            self._process_tick(rows, ticks)
+            self.current_tick[rows] = ticks
+
+            # 7. 모든 스레드 완료 확인
+            self.done[rows[self.terminated_count[rows] == self.n_threads[rows]]] = True
+
+            # 다음 이벤트 tick까지 조용한 tick 일괄 처리
+            rows = np.flatnonzero(~self.done)
+            now = self.current_tick[rows]
+            ticks = np.minimum(self._next_event_tick(rows, now), limits[rows])
+            self._fast_forward(rows, now + 1, ticks)
+
+            # max_ticks 도달
+            stop = ticks >= limits[rows]
+            self.current_tick[rows[stop]] = np.maximum(now[stop], limits[rows[stop]] - 1)
+            self.done[rows[stop]] = True
+            rows, ticks = rows[~stop], ticks[~stop]
+
+        self._finish()
+        return self.workloads
+
+    def _process_tick(self, rows: np.ndarray, ticks: np.ndarray):
+        """seed rows를 각자의 tick ticks에서 한 tick 처리 (Simulator 1~5단계)"""
+        stride = self._seq_stride
+        _, N = self._shape
+
+        # 1. 새로 도착한 스레드 (seed별 도착 순서를 따라 하나씩)
+        arriving = self.arrival_sorted[rows, self.next_arrival[rows]] == ticks
+        while arriving.any():
+            seeds, t = rows[arriving], ticks[arriving]
+            idxs = self.arrival_order[seeds, self.next_arrival[seeds]]
+            self._make_ready(seeds, idxs, t, t * stride + idxs)
+            self.arrived[seeds, idxs] = True
+            self.next_arrival[seeds] += 1
+            arriving = self.arrival_sorted[rows, self.next_arrival[rows]] == ticks
+
+        # 2. I/O 완료 (같은 tick이면 도착 다음, 리스트 순서)
+        waking = self.next_wake[rows] == ticks
+        if waking.any():
+            wake_rows, wake_ticks = rows[waking], ticks[waking]
+            ri, idxs = np.nonzero(self.wake_tick[wake_rows] == wake_ticks[:, None])
+            seeds, t = wake_rows[ri], wake_ticks[ri]
+            self.wake_tick[seeds, idxs] = _NEVER
+            self._make_ready(seeds, idxs, t, t * stride + N + idxs)
+            self.next_wake[wake_rows] = self.wake_tick[wake_rows].min(axis=1)
+
+        busy = self.running[rows] >= 0
+        run_rows, run_ticks = rows[busy], ticks[busy]
+        cols = self.running[run_rows]
+
+        # 3. 스케줄러 tick (CFS: vruntime 증가, min_vruntime 갱신)
+        # 조용한 구간에서 (비어 있지 않은 ready queue로) 이미 갱신했다면
+        # 새로 들어온 스레드는 vruntime >= min_vruntime 이므로 다시 갱신해도 값이 같음
+        if self.scheduler == "cfs" and len(run_rows):
+            self.vruntime[run_rows, cols] += self.delta_fair[run_rows, cols]
+            self._update_min_vruntime(run_rows[~self._forwarded[run_rows]])
+
+        # 4. 실행 중인 스레드
+        if len(run_rows):
+            self._handle_running(run_rows, cols, run_ticks)
+
+        # 5. 빈 CPU에 다음 스레드 선택
+        idle = self.running[rows] < 0
+        if idle.any():
+            self._schedule_next(rows[idle], ticks[idle])
+
+    def _next_event_tick(self, rows: np.ndarray, now: np.ndarray) -> np.ndarray:
+        """seed별 now 이후 첫 이벤트 tick (도착, I/O 완료, 종료/I/O 진입/slice 만료)"""
+        next_tick = np.minimum(self.arrival_sorted[rows, self.next_arrival[rows]],
+                               self.next_wake[rows])
+
+        busy = self.running[rows] >= 0
+        r, c = rows[busy], self.running[rows[busy]]
+        run_for = np.minimum(self.remaining[r, c], self.slice_remaining[r])
+        run_for = np.where(self.has_io[r, c],
+                           np.minimum(run_for, self.io_frequency[r, c] - self.cpu_since_io[r, c]),
+                           run_for)
+        next_tick[busy] = np.minimum(next_tick[busy], now[busy] + np.maximum(1, run_for))
+        return next_tick
+
+    def _fast_forward(self, rows: np.ndarray, start: np.ndarray, end: np.ndarray):
+        """실행 스레드를 [start, end) 동안 선점 없이 실행 (Simulator._fast_forward)"""
+        count = end - start
+        busy = (count > 0) & (self.running[rows] >= 0)
+        r, n, first = rows[busy], count[busy], start[busy]
+        self._forwarded[rows] = False
+        if not len(r):
+            return
+        c = self.running[r]
+
+        if self.scheduler == "cfs":
+            self.vruntime[r, c] += n * self.delta_fair[r, c]
+            self._forwarded[r] = self._update_min_vruntime(r)
+
+        self.remaining[r, c] -= n
+        self.slice_remaining[r] -= n
+        unstarted = self.start_time[r, c] == -1
+        self.start_time[r[unstarted], c[unstarted]] = first[unstarted]
+        io = self.has_io[r, c]
+        self.cpu_since_io[r[io], c[io]] += n[io]
+
+    def _update_min_vruntime(self, rows: np.ndarray) -> np.ndarray:
+        """
+        min_vruntime = max(min_vruntime, ready queue 최소 vruntime)
+
+        Returns:
+            rows별 ready queue가 비어 있지 않았는지
+        """
+        ready_vr = self.ready_key[rows].min(axis=1)
+        has_ready = ready_vr != _NEVER
+        self.min_vruntime[rows[has_ready]] = np.maximum(
+            self.min_vruntime[rows[has_ready]], ready_vr[has_ready]
+        )
+        return has_ready
+
+    def _make_ready(self, seeds: np.ndarray, idxs: np.ndarray, ticks: np.ndarray, seq: np.ndarray):
+        """BLOCKED → READY (add_thread)"""
+        self.status[seeds, idxs] = READY
+        self.state_since[seeds, idxs] = ticks
+        self.seq[seeds, idxs] = seq
+        if self.scheduler == "cfs":
+            self.weight[seeds, idxs] = self.new_weight[seeds, idxs]
+            self.vruntime[seeds, idxs] = np.maximum(self.vruntime[seeds, idxs],
+                                                    self.min_vruntime[seeds])
+            self.ready_key[seeds, idxs] = self.vruntime[seeds, idxs]
+        else:
+            self.ready_key[seeds, idxs] = -self.priority[seeds, idxs]
+
+    def _handle_running(self, rows: np.ndarray, cols: np.ndarray, ticks: np.ndarray):
+        """실행 중인 스레드 1 tick 실행 → 종료 / I/O 진입 / time slice 만료"""
+        self.remaining[rows, cols] -= 1
+        self.slice_remaining[rows] -= 1
+        first = self.start_time[rows, cols] == -1
+        self.start_time[rows[first], cols[first]] = ticks[first]
+
+        # 종료
+        exited = self.remaining[rows, cols] <= 0
+        # I/O 진입 (종료가 아닐 때만)
+        io = ~exited & self.has_io[rows, cols]
+        self.cpu_since_io[rows[io], cols[io]] += 1
+        io &= self.cpu_since_io[rows, cols] >= self.io_frequency[rows, cols]
+        # Time slice 만료
+        expired = ~exited & ~io & (self.slice_remaining[rows] <= 0)
+
+        leaving = exited | io | expired
+        r, c, t = rows[leaving], cols[leaving], ticks[leaving]
+        self.runnable_time[r, c] += t - self.state_since[r, c]
+        self.state_since[r, c] = t
+        self.prev_running_tid[r] = self.tid[r, c]
+        self.has_prev[r] = True
+        self.running[r] = -1
+
+        r, c, t = rows[exited], cols[exited], ticks[exited]
+        self.status[r, c] = TERMINATED
+        self.finish_time[r, c] = t
+        self.terminated_count[r] += 1
+
+        r, c, t = rows[io], cols[io], ticks[io]
+        self.cpu_since_io[r, c] = 0
+        self.status[r, c] = BLOCKED
+        self.wake_tick[r, c] = t + self.io_block[r, c]
+        self.next_wake[r] = np.minimum(self.next_wake[r], self.wake_tick[r, c])
+
+        r, c, t = rows[expired], cols[expired], ticks[expired]
+        self.status[r, c] = READY
+        self.seq[r, c] = t * self._seq_stride + 2 * self._shape[1]
+        if self.scheduler == "cfs":
+            self.ready_key[r, c] = self.vruntime[r, c]
+        else:
+            self.ready_key[r, c] = -self.priority[r, c]
+
+    def _schedule_next(self, rows: np.ndarray, ticks: np.ndarray):
+        """최소 vruntime (CFS) / 최고 우선순위 (Basic), 같으면 먼저 들어온 스레드"""
+        key = self.ready_key[rows]
+        best = key.min(axis=1, keepdims=True)
+        has_ready = best[:, 0] != _NEVER
+        cols = np.where(key == best, self.seq[rows], _NEVER).argmin(axis=1)
+
+        rows, cols, ticks = rows[has_ready], cols[has_ready], ticks[has_ready]
+        if not len(rows):
+            return
+
+        self.wait_time[rows, cols] += ticks - self.state_since[rows, cols]
+        self.runnable_time[rows, cols] += ticks - self.state_since[rows, cols]
+        self.state_since[rows, cols] = ticks
+        self.status[rows, cols] = RUNNING
+        self.ready_key[rows, cols] = _NEVER
+        self.last_scheduled[rows, cols] = ticks
+        self.running[rows] = cols
+        self.slice_remaining[rows] = self.time_slice
+
+        tids = self.tid[rows, cols]
+        switched = self.has_prev[rows] & (self.prev_running_tid[rows] != tids)
+        self.context_switches[rows[switched]] += 1
+        self.prev_running_tid[rows] = tids
+        self.has_prev[rows] = True
+
+    def _finish(self):
+        """마지막 tick까지 정산하고 스레드 객체에 결과 기록"""
+        now = self.current_tick[:, None]
+        active = self.arrived & (self.status != TERMINATED)
+        elapsed = np.where(active, now + 1 - self.state_since, 0)
+        self.wait_time += np.where(self.status == READY, elapsed, 0)
+        self.runnable_time += np.where((self.status == READY) | (self.status == RUNNING), elapsed, 0)
+        self.state_since = np.where(active, now + 1, self.state_since)
+        io_remaining = np.where(self.wake_tick != _NEVER, self.wake_tick - now, 0)
+
+        for s, threads in enumerate(self.workloads):
+            switches = int(self.context_switches[s])
+            for i, thread in enumerate(threads):
+                thread.status = _STATUS_BY_VALUE[int(self.status[s, i])]
+                thread.remaining_time = int(self.remaining[s, i])
+                thread.start_time = int(self.start_time[s, i])
+                thread.finish_time = int(self.finish_time[s, i])
+                thread.wait_time = int(self.wait_time[s, i])
+                thread.runnable_time = int(self.runnable_time[s, i])
+                thread.last_scheduled = int(self.last_scheduled[s, i])
+                thread.state_since = int(self.state_since[s, i])
+                thread.cpu_since_io = int(self.cpu_since_io[s, i])
+                thread.io_remaining = int(io_remaining[s, i])
+                thread.context_switches = switches
+                if self.scheduler == "cfs":
+                    thread.vruntime = int(self.vruntime[s, i])
+                    thread.weight = int(self.weight[s, i])
+                elif self.arrived[s, i] or self.priority_set[s, i]:
+                    thread.priority = int(self.priority[s, i])
@@ -0,0 +1,154 @@
+"""
+시뮬레이션 히스토리 기록기
+
+스레드 × tick 상태를 컬럼별 NumPy 배열에 기록.
+행마다 dict를 만드는 대신 미리 할당한 배열에 채우고, 부족하면 2배로 확장.
+이름은 tid → name 테이블에 한 번만 저장하고 DataFrame은 요청 시에만 생성.
+"""
+
+from typing import Dict, Iterable, List
+import numpy as np
+import pandas as pd
+from scheduler.thread import Thread, ThreadStatus
+from scheduler.thread_table import NO_PRIORITY
+
+# 컬럼 이름과 타입 (DataFrame 컬럼 순서와 동일, name 제외)
+COLUMNS = (
+    ('tick', np.int32),
+    ('tid', np.int32),
+    ('status', np.int8),
+    ('priority', np.int32),
+    ('nice', np.int8),
+    ('vruntime', np.int64),
+    ('remaining_time', np.int32),
+    ('wait_time', np.int32),
+)
+
+# 상태 코드 → 이름 (ThreadStatus 값 순서)
+STATUS_NAMES = np.array(
+    [s.name for s in sorted(ThreadStatus, key=lambda s: s.value)], dtype=object
+)
+
+
+class HistoryRecorder:
+    """컬럼형 히스토리 기록기"""
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: 초기 행 수 (부족하면 자동 확장)
+        """
+        self._capacity = max(1, capacity)
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(self._capacity, dtype=dtype) for name, dtype in COLUMNS
+        }
+        self._names: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def register_names(self, threads: Iterable[Thread]):
+        """tid → name 테이블 등록"""
+        for thread in threads:
+            self._names[thread.tid] = thread.name
+
+    def record(self, tick: int, threads: List[Thread]):
+        """한 tick의 스레드 상태 기록"""
+        count = len(threads)
+        if count == 0:
+            return
+
+        start = self._size
+        end = start + count
+        if end > self._capacity:
+            self._grow(end)
+
+        cols = self._columns
+        cols['tick'][start:end] = tick
+        cols['tid'][start:end] = [t.tid for t in threads]
+        cols['status'][start:end] = [t.status for t in threads]
+        cols['priority'][start:end] = [
+            NO_PRIORITY if t.priority is None else t.priority for t in threads
+        ]
+        cols['nice'][start:end] = [t.nice for t in threads]
+        cols['vruntime'][start:end] = [t.vruntime for t in threads]
+        cols['remaining_time'][start:end] = [t.remaining_time for t in threads]
+        cols['wait_time'][start:end] = [t.wait_time for t in threads]
+        self._size = end
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """기록된 히스토리를 DataFrame으로 변환"""
+        size = self._size
+        cols = {name: arr[:size] for name, arr in self._columns.items()}
+
+        # 기존 dict 기반 DataFrame과 같은 형식:
+        # 전부 None이면 object(None), 일부만 None이면 float(NaN)
+        priority = cols['priority']
+        missing = priority == NO_PRIORITY
+        if missing.all() and size > 0:
+            priority = np.full(size, None, dtype=object)
+        elif missing.any():
+            priority = priority.astype(np.float64)
+            priority[missing] = np.nan
+
+        return pd.DataFrame({
+            'tick': cols['tick'],
+            'tid': cols['tid'],
+            'name': pd.Series(cols['tid']).map(self._names).to_numpy(dtype=object),
+            'status': STATUS_NAMES[cols['status']],
+            'priority': priority,
+            'nice': cols['nice'],
+            'vruntime': cols['vruntime'],
+            'remaining_time': cols['remaining_time'],
+            'wait_time': cols['wait_time'],
+        })
+
+    def load_dataframe(self, df: pd.DataFrame):
+        """to_dataframe() 결과의 행을 이어서 기록 (히스토리 없이 저장한 스냅샷 복원용)"""
+        size = len(df)
+        if size == 0:
+            return
+        for tid, name in zip(df['tid'].tolist(), df['name'].tolist()):
+            self._names.setdefault(tid, name)
+        start = self._size
+        end = start + size
+        if end > self._capacity:
+            self._grow(end)
+
+        codes = {name: code for code, name in enumerate(STATUS_NAMES)}
+        priority = pd.to_numeric(df['priority'], errors='coerce').fillna(NO_PRIORITY)
+        cols = self._columns
+        for name, _ in COLUMNS:
+            if name == 'status':
+                values = df['status'].map(codes).to_numpy()
+            elif name == 'priority':
+                values = priority.to_numpy()
+            else:
+                values = df[name].to_numpy()
+            cols[name][start:end] = values
+        self._size = end
+
+    def __getstate__(self):
+        # 스냅샷에는 기록된 행만 저장 (미리 할당한 빈 용량 제외)
+        state = self.__dict__.copy()
+        state['_columns'] = {name: arr[:self._size].copy() for name, arr in self._columns.items()}
+        state['_capacity'] = max(1, self._size)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._size == 0:
+            self._columns = {name: np.empty(1, dtype=dtype) for name, dtype in COLUMNS}
+
+    def _grow(self, required: int):
+        """배열 용량을 2배씩 확장"""
+        capacity = self._capacity
+        while capacity < required:
+            capacity *= 2
+
+        for name, arr in self._columns.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self._size] = arr[:self._size]
+            self._columns[name] = grown
+        self._capacity = capacity
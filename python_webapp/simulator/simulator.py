@@ -5,106 +5,515 @@
 매 tick마다 스케줄링 결정을 수행하고 결과를 기록.
 """
 
-from typing import List, Optional, Any
+import heapq
+import pickle
+import time
+import zlib
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 import pandas as pd
-from scheduler.thread import Thread, ThreadStatus
+from scheduler.thread import Thread, ThreadStatus, RUNNING, READY, BLOCKED, TERMINATED
+from scheduler.thread_table import ThreadTable
+from simulator.history import HistoryRecorder
 
 MIN_IO_DURATION = 8   # ticks (2 time slices)
 MAX_IO_DURATION = 120 # ticks
 
+# 실행 엔진
+ENGINE_TICK = "tick"    # 매 tick마다 전체 단계 수행 (기준 구현)
+ENGINE_EVENT = "event"  # 이벤트 사이의 조용한 tick은 일괄 처리
+ENGINES = (ENGINE_TICK, ENGINE_EVENT)
+
+# 히스토리 기록 수준
+HISTORY_NONE = "none"        # 기록 안 함 (메트릭만 필요할 때)
+HISTORY_EVENTS = "events"    # 상태가 바뀐 스레드만 기록 (READY→RUNNING 등)
+HISTORY_SAMPLED = "sampled"  # history_interval tick마다 전체 기록
+HISTORY_FULL = "full"        # 매 tick 전체 기록
+HISTORY_LEVELS = (HISTORY_NONE, HISTORY_EVENTS, HISTORY_SAMPLED, HISTORY_FULL)
+
+# 진행 상황 콜백: (진행한 tick 수, max_ticks)
+ProgressCallback = Callable[[int, int], None]
+
+# 조기 종료 조건: (tick 직전까지 정산된 스레드, tick) → True면 tick 전에서 중단
+# (예: analysis.convergence.ConvergenceCriterion)
+StopCondition = Callable[[List[Thread], int], bool]
+
+
+class SimulationCancelled(Exception):
+    """취소 토큰이 설정되어 시뮬레이션을 중단함"""
+
+    def __init__(self, tick: int):
+        # args = (tick,) 이어야 워커 프로세스에서 pickle로 돌아올 때도 tick이 유지됨
+        super().__init__(tick)
+        self.tick = tick
+
+    def __str__(self):
+        return f"simulation cancelled at tick {self.tick}"
+
+
+class RunMonitor:
+    """
+    진행 상황 보고 / 취소 확인 / 조기 종료 확인 지점
+
+    progress_ticks tick마다 한 번 취소 토큰을 확인하고 콜백을 호출
+    (progress_ms가 있으면 직전 호출 후 그 시간이 지났을 때만 호출),
+    stop_ticks tick마다 한 번 조기 종료 조건을 확인.
+    콜백, 토큰, 조건이 모두 없으면 확인 지점이 max_ticks 뒤에 있어 실행 루프에 비용이 없음.
+    """
+
+    def __init__(self, max_ticks: int, progress: Optional[ProgressCallback] = None,
+                 cancel: Optional[Any] = None, progress_ticks: int = 1000,
+                 progress_ms: Optional[float] = None,
+                 stop: Optional[Callable[[int], bool]] = None, stop_ticks: int = 250):
+        """
+        Args:
+            max_ticks: 최대 시뮬레이션 시간
+            progress: 진행 상황 콜백 (진행한 tick 수, max_ticks)
+            cancel: 취소 토큰 (is_set()이 있는 객체: threading.Event, multiprocessing.Event)
+            progress_ticks: 확인 간격 (ticks)
+            progress_ms: 콜백 최소 간격 (밀리초, None이면 확인 지점마다 호출)
+            stop: 조기 종료 확인 (tick → True면 중단, 시뮬레이터가 정산 후 StopCondition 호출)
+            stop_ticks: 조기 종료 확인 간격 (ticks)
+        """
+        if progress_ticks < 1:
+            raise ValueError(f"progress_ticks must be >= 1: {progress_ticks}")
+        if stop_ticks < 1:
+            raise ValueError(f"stop_ticks must be >= 1: {stop_ticks}")
+        self.max_ticks = max_ticks
+        self.progress = progress
+        self.cancel = cancel
+        self.progress_ticks = progress_ticks
+        self.progress_interval = None if progress_ms is None else progress_ms / 1000.0
+        self.stop = stop
+        self.stop_ticks = stop_ticks
+        self.stopped = False
+        self._last_report = time.perf_counter()
+        self._next_progress = max_ticks
+        self._next_stop = max_ticks
+
+    def first_check(self, start: int = 0) -> int:
+        """start tick부터 실행할 때 첫 확인 지점 tick"""
+        if self.progress is not None or self.cancel is not None:
+            self._next_progress = min(start + self.progress_ticks, self.max_ticks)
+        if self.stop is not None:
+            self._next_stop = min(start + self.stop_ticks, self.max_ticks)
+        return min(self._next_progress, self._next_stop)
+
+    def check(self, tick: int) -> int:
+        """
+        확인 지점 도달 (tick 전까지 처리 완료): 취소 확인 후 진행 보고, 조기 종료 확인
+
+        조기 종료 조건이 참이면 stopped = True (호출한 쪽이 tick을 처리하지 않고 끝냄).
+
+        Returns:
+            다음 확인 지점 tick
+
+        Raises:
+            SimulationCancelled: 취소 토큰이 설정됨
+        """
+        if tick == self._next_progress:
+            if self.cancel is not None and self.cancel.is_set():
+                raise SimulationCancelled(tick)
+            if self.progress is not None:
+                now = time.perf_counter()
+                if (self.progress_interval is None
+                        or now - self._last_report >= self.progress_interval):
+                    self._last_report = now
+                    self.progress(tick, self.max_ticks)
+            self._next_progress = min(tick + self.progress_ticks, self.max_ticks)
+        if tick == self._next_stop:
+            if self.stop(tick):
+                self.stopped = True
+            self._next_stop = min(tick + self.stop_ticks, self.max_ticks)
+        return min(self._next_progress, self._next_stop)
+
+    def finish(self):
+        """실행 완료 보고 (조기 종료 포함, 항상 max_ticks로 보고)"""
+        if self.progress is not None:
+            self.progress(self.max_ticks, self.max_ticks)
+
 
 class Simulator:
     """스케줄러 시뮬레이터"""
 
-    def __init__(self, scheduler: Any, threads: List[Thread], time_slice: int = 4):
+    def __init__(self, scheduler: Any, threads: Union[List[Thread], ThreadTable], time_slice: int = 4,
+                 engine: str = ENGINE_TICK, history: str = HISTORY_FULL,
+                 history_interval: int = 100):
         """
         Args:
             scheduler: 스케줄러 인스턴스 (BasicPriorityScheduler, MLFQSScheduler, CFSScheduler)
-            threads: 시뮬레이션할 스레드 리스트
+            threads: 시뮬레이션할 스레드 리스트 또는 ThreadTable (행 뷰로 실행, 결과는 테이블에 기록)
             time_slice: 시간 조각 (ticks)
+            engine: 실행 엔진 ("tick": 매 tick 처리, "event": 다음 이벤트까지 건너뜀)
+            history: 히스토리 기록 수준 ("none", "events", "sampled", "full")
+            history_interval: "sampled"일 때 기록 간격 (ticks)
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if history not in HISTORY_LEVELS:
+            raise ValueError(f"Unknown history level: {history}")
+        if history_interval < 1:
+            raise ValueError(f"history_interval must be >= 1: {history_interval}")
+
+        if isinstance(threads, ThreadTable):
+            threads = threads.rows()
+
         self.scheduler = scheduler
         self.threads = threads
-        self.history = []
+        self.history_level = history
+        self.history_interval = history_interval
+        capacity = max(1, len(threads)) * 1024 if history == HISTORY_FULL else 1024
+        self.recorder = HistoryRecorder(capacity=capacity)
+        self.recorder.register_names(threads)
         self.current_tick = 0
         self.running: Optional[Thread] = None
         self.context_switches = 0
         self.time_slice = time_slice
         self.current_slice_remaining = 0
         self.prev_running_tid: Optional[int] = None
+        self.engine = engine
+        # 이어서 실행할 때 시작 tick / 모든 스레드 완료 여부 (run을 여러 번 호출해도 이어짐)
+        self._next_tick = 0
+        self._finished = False
+        # 조기 종료 조건으로 멈춘 tick (이 tick 전까지 실행, 멈추지 않았으면 None)
+        self.stopped_at: Optional[int] = None
 
         # 모든 스레드를 스케줄러에 추가
         for thread in threads:
             # 초기에는 모두 READY로 설정하지 않고 arrival_time에 추가
-            thread.status = ThreadStatus.BLOCKED  # 도착 전
+            thread.status = BLOCKED  # 도착 전
             thread.io_remaining = 0
             thread.cpu_since_io = 0
 
-    def run(self, max_ticks: int = 10000) -> pd.DataFrame:
+        # 도착 달력: arrival_time → 도착 스레드 (리스트 순서 유지)
+        self._arrivals: Dict[int, List[Thread]] = {}
+        for thread in threads:
+            self._arrivals.setdefault(thread.arrival_time, []).append(thread)
+        self._arrival_ticks = sorted(self._arrivals)
+
+        # I/O 대기 힙: (깨어날 tick, 리스트 순서, 스레드)
+        # 같은 tick에 깨어나는 스레드는 리스트 순서대로 READY
+        self._order = {id(thread): idx for idx, thread in enumerate(threads)}
+        self._io_heap: List[Tuple[int, int, Thread]] = []
+
+        # 스레드 집합 (리스트 순서 → 스레드): 도착 전 → 활성 → 종료
+        # tick마다 하는 작업은 활성 스레드만 순회
+        self._pending: Dict[int, Thread] = dict(enumerate(threads))
+        self._active: Dict[int, Thread] = {}
+        self._terminated: Dict[int, Thread] = {}
+        self._terminated_count = 0
+
+        # 기록 대상 (도착한 스레드, 리스트 순서)
+        # arrival_time < 0 인 스레드는 도착하지 않지만 처음부터 기록됨
+        self._visible_idx: List[int] = [
+            idx for idx, thread in enumerate(threads) if thread.arrival_time < 0
+        ]
+        self._visible: List[Thread] = [threads[idx] for idx in self._visible_idx]
+
+        # 스케줄러가 tick()에서 wait_time을 읽는 경우 (Basic aging)
+        # tick 호출 전에 READY 스레드의 대기 시간을 정산해야 함
+        self._settle_before_tick = getattr(scheduler, 'uses_wait_time', False)
+        # 조용한 tick을 스케줄러가 일괄 처리할 수 있는지 (tick_many)
+        self._batch_ticks = (hasattr(scheduler, 'tick_many')
+                             and not self._settle_before_tick)
+        # I/O 대기 진입을 스케줄러에 알려야 하는지 (MLFQS 실행 가능 스레드 수)
+        self._notify_block = hasattr(scheduler, 'thread_block')
+
+        # "events" 기록용: 이번 tick에 상태가 바뀌었을 수 있는 스레드
+        self._touched: List[Thread] = []
+        self._recorded_status: List[Optional[ThreadStatus]] = [None] * len(threads)
+
+    def run(self, max_ticks: int = 10000, progress: Optional[ProgressCallback] = None,
+            cancel: Optional[Any] = None, progress_ticks: int = 1000,
+            progress_ms: Optional[float] = None, stop: Optional[StopCondition] = None,
+            stop_ticks: int = 250) -> pd.DataFrame:
         """
         시뮬레이션 실행
 
+        이미 실행한 시뮬레이터(또는 restore()한 스냅샷)는 이전 실행이 끝난 tick부터 이어서
+        max_ticks까지 실행. run(T) 후 run(T')의 결과는 처음부터 run(T')한 결과와 같음.
+
+        stop이 있으면 stop_ticks마다 그 tick 직전까지 정산한 스레드로 호출하고,
+        참이면 그 tick에서 멈춤 (stopped_at, 결과는 run(max_ticks=stopped_at)과 같음).
+
         Args:
-            max_ticks: 최대 시뮬레이션 시간
+            max_ticks: 최대 시뮬레이션 시간 (처음부터 센 tick)
+            progress: 진행 상황 콜백 (진행한 tick 수, max_ticks), 끝나면 (max_ticks, max_ticks)
+            cancel: 취소 토큰 (is_set()이 참이 되면 다음 확인 지점에서 중단)
+            progress_ticks: 진행 보고/취소 확인 간격 (ticks)
+            progress_ms: 진행 보고 최소 간격 (밀리초)
+            stop: 조기 종료 조건 (스레드, tick) → bool
+            stop_ticks: 조기 종료 확인 간격 (ticks)
 
         Returns:
             시뮬레이션 히스토리 (DataFrame)
+
+        Raises:
+            SimulationCancelled: 취소됨 (스레드 상태는 중단 시점의 중간 상태)
+        """
+        check_stop = None
+        if stop is not None:
+            def check_stop(tick):
+                self._settle_threads()
+                return stop(self.threads, tick)
+        monitor = RunMonitor(max_ticks, progress, cancel, progress_ticks, progress_ms,
+                             check_stop, stop_ticks)
+        self.stopped_at = None
+        if not self._finished and self._next_tick < max_ticks:
+            if self.engine == ENGINE_EVENT:
+                self._run_event(self._next_tick, max_ticks, monitor)
+            else:
+                self._run_tick(self._next_tick, max_ticks, monitor)
+        monitor.finish()
+
+        self._settle_threads()
+        return self.recorder.to_dataframe()
+
+    def _settle_threads(self):
+        """현재 tick까지 스레드 필드 정산 (메트릭 계산용, 실행 중에 해도 결과는 같음)"""
+        self._sync_io_remaining()
+
+        # 마지막 tick까지의 대기/실행 가능 시간 정산
+        for thread in self._active.values():
+            self._settle(thread, thread.status, self.current_tick + 1)
+
+        # 메트릭 계산을 위해 모든 스레드에 컨텍스트 스위치 수를 기록
+        for thread in self.threads:
+            thread.context_switches = self.context_switches
+
+    def _run_tick(self, start: int, max_ticks: int, monitor: RunMonitor):
+        """Tick 엔진: start ~ max_ticks 모든 tick을 순서대로 처리"""
+        next_check = monitor.first_check(start)
+        for tick in range(start, max_ticks):
+            if tick == next_check:
+                self._next_tick = tick  # 취소/조기 종료되면 여기서부터 이어서 실행 가능
+                next_check = monitor.check(tick)
+                if monitor.stopped:
+                    self.stopped_at = tick
+                    return
+            self._process_tick(tick)
+
+            # 7. 모든 스레드 완료 확인
+            if self._all_threads_done():
+                self._finished = True
+                break
+        else:
+            self._next_tick = max_ticks
+
+    def _run_event(self, start: int, max_ticks: int, monitor: RunMonitor):
         """
-        for tick in range(max_ticks):
-            self.current_tick = tick
+        Event 엔진: 다음 이벤트 tick으로 바로 이동
+
+        이벤트(도착, I/O 완료, 스레드 종료, I/O 진입, time slice 만료)가 없는
+        tick에서는 상태 전이가 일어나지 않으므로 전체 스캔 없이 일괄 처리.
+        결과는 tick 엔진과 동일.
+        확인 지점에서도 끊어서 그 tick은 전체 처리 (전체 처리는 조용한 tick에서도 결과가 같음).
+        """
+        next_check = monitor.first_check(start)
+        tick = start
+        while tick < max_ticks:
+            if tick == next_check:
+                self._next_tick = tick  # 취소/조기 종료되면 여기서부터 이어서 실행 가능
+                next_check = monitor.check(tick)
+                if monitor.stopped:
+                    self.stopped_at = tick
+                    return
+            self._process_tick(tick)
 
-            # 1. 새로 도착한 스레드 처리
-            self._handle_arrivals()
+            if self._all_threads_done():
+                self._finished = True
+                return
 
-            # 2. I/O 완료 처리 (BLOCKED → READY)
-            self._handle_io_completion()
+            next_tick = min(self._next_event_tick(), max_ticks, next_check)
+            self._advance_quiet_ticks(tick + 1, next_tick)
+            tick = next_tick
+        self._next_tick = max_ticks
 
-            # 3. 스케줄러 tick 호출
-            self.scheduler.tick(tick, self.running)
+    # ========== 스냅샷 ==========
 
-            # 4. 실행 중인 스레드 처리
-            self._handle_running_thread()
+    def snapshot(self, with_history: bool = True) -> bytes:
+        """
+        현재 상태 전체 (스레드, 스케줄러 큐/load_avg/min_vruntime, 카운터, 히스토리)를
+        압축한 바이트로 저장
 
-            # 5. 다음 스레드 선택
-            if self.running is None:
-                self._schedule_next()
+        restore()로 되살린 뒤 run(T')하면 지금까지의 실행에서 이어서 T'까지 실행.
+        with_history=False면 기록된 히스토리는 빼고 저장
+        (복원 후 recorder.load_dataframe()으로 이전 히스토리를 채워야 run()의 히스토리가 온전함).
+        """
+        recorder = self.recorder
+        if not with_history:
+            self.recorder = HistoryRecorder(capacity=1)
+            self.recorder.register_names(self.threads)
+        try:
+            data = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            self.recorder = recorder
+        return zlib.compress(data, 1)
+
+    @classmethod
+    def restore(cls, data: bytes) -> 'Simulator':
+        """
+        snapshot() 결과 → 시뮬레이터 (스레드는 새 객체, sim.threads로 접근)
 
-            # 6. 대기 중인 스레드의 wait_time 증가
-            self._update_wait_times()
+        pickle을 풀므로 직접 만들었거나 검증한(ResultCache.get_snapshot) 바이트만 사용.
+        """
+        sim = pickle.loads(zlib.decompress(data))
+        if not isinstance(sim, cls):
+            raise ValueError(f"Not a {cls.__name__} snapshot: {type(sim).__name__}")
+        return sim
+
+    def __getstate__(self):
+        # id() 기반 조회표는 복원된 객체에서 의미가 없으므로 빼고 다시 만듦
+        state = self.__dict__.copy()
+        del state['_order']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._order = {id(thread): idx for idx, thread in enumerate(self.threads)}
+
+    def _process_tick(self, tick: int):
+        """
+        한 tick 전체 처리 (1~6단계)
 
-            # 7. 현재 상태 기록
+        wait_time/runnable_time은 상태 전이 시점에 정산하므로 (_settle)
+        매 tick 모든 스레드를 순회하지 않음.
+        """
+        self.current_tick = tick
+
+        # 1. 새로 도착한 스레드 처리
+        self._handle_arrivals()
+
+        # 2. I/O 완료 처리 (BLOCKED → READY)
+        self._handle_io_completion()
+
+        # 3. 스케줄러 tick 호출
+        if self._settle_before_tick:
+            self._settle_ready(tick)
+        self.scheduler.tick(tick, self.running)
+
+        # 4. 실행 중인 스레드 처리
+        self._handle_running_thread()
+
+        # 5. 다음 스레드 선택
+        if self.running is None:
+            self._schedule_next()
+
+        # 6. 현재 상태 기록
+        self._record_state()
+
+    def _next_event_tick(self) -> int:
+        """
+        현재 tick 이후 첫 이벤트 tick 계산
+
+        Returns:
+            다음 이벤트가 발생하는 tick (이벤트가 없으면 매우 큰 값)
+        """
+        now = self.current_tick
+        next_tick = float('inf')
+
+        # 다음 도착 (도착 달력에서 이진 탐색)
+        idx = bisect_right(self._arrival_ticks, now)
+        if idx < len(self._arrival_ticks):
+            next_tick = self._arrival_ticks[idx]
+
+        # 다음 I/O 완료
+        if self._io_heap:
+            next_tick = min(next_tick, self._io_heap[0][0])
+
+        running = self.running
+        if running is not None:
+            # 종료 / time slice 만료 / I/O 진입 중 가장 빠른 것
+            run_for = min(running.remaining_time, self.current_slice_remaining)
+            if running.io_frequency > 0 and running.io_duration > 0:
+                run_for = min(run_for, running.io_frequency - running.cpu_since_io)
+            next_tick = min(next_tick, now + max(1, run_for))
+
+        return next_tick
+
+    def _advance_quiet_ticks(self, start: int, end: int):
+        """
+        이벤트가 없는 tick [start, end) 일괄 처리
+
+        상태 전이가 없으므로 READY 집합과 실행 스레드가 고정되고,
+        대기 시간은 다음 전이 때 한 번에 정산됨.
+        기록이 필요한 tick에서만 끊어서 처리.
+        """
+        if start >= end:
+            return
+
+        # 조용한 tick에는 상태 전이가 없으므로 "events" 수준은 기록할 것이 없음
+        if self.history_level == HISTORY_FULL:
+            record_ticks = range(start, end)
+        elif self.history_level == HISTORY_SAMPLED:
+            interval = self.history_interval
+            record_ticks = range(start + (-start % interval), end, interval)
+        else:
+            record_ticks = range(0)
+
+        tick = start
+        for record_tick in record_ticks:
+            self._fast_forward(tick, record_tick + 1)
             self._record_state()
+            tick = record_tick + 1
+        self._fast_forward(tick, end)
 
-            # 8. 모든 스레드 완료 확인
-            if self._all_threads_done():
-                break
+    def _fast_forward(self, start: int, end: int):
+        """
+        실행 스레드를 [start, end) 동안 선점 없이 실행
 
-        # 메트릭 계산을 위해 모든 스레드에 컨텍스트 스위치 수를 기록
-        for thread in self.threads:
-            thread.context_switches = self.context_switches
+        스케줄러가 tick_many()를 제공하면 한 번에 처리하고,
+        아니면 tick()을 tick마다 호출.
+        """
+        count = end - start
+        if count <= 0:
+            return
 
-        return pd.DataFrame(self.history)
+        running = self.running
+        if self._batch_ticks:
+            self.scheduler.tick_many(start, count, running)
+        else:
+            for tick in range(start, end):
+                if self._settle_before_tick:
+                    self._settle_ready(tick)
+                self.scheduler.tick(tick, running)
+
+        if running is not None:
+            running.remaining_time -= count
+            self.current_slice_remaining -= count
+            if running.start_time == -1:
+                running.start_time = start
+            if running.io_frequency > 0 and running.io_duration > 0:
+                running.cpu_since_io += count
+
+        self.current_tick = end - 1
 
     def _handle_arrivals(self):
         """새로 도착한 스레드 추가"""
-        for thread in self.threads:
-            if thread.arrival_time == self.current_tick and thread.status == ThreadStatus.BLOCKED:
-                thread.status = ThreadStatus.READY
+        for thread in self._arrivals.get(self.current_tick, ()):
+            if thread.status == BLOCKED:
+                thread.state_since = self.current_tick
+                thread.status = READY
                 self.scheduler.add_thread(thread)
+                self._touched.append(thread)
+                self._activate(thread)
 
     def _handle_io_completion(self):
         """I/O 완료 처리 (BLOCKED → READY)"""
-        for thread in self.threads:
-            if thread.status == ThreadStatus.BLOCKED and thread.io_remaining > 0:
-                thread.io_remaining -= 1
-                if thread.io_remaining <= 0:
-                    thread.status = ThreadStatus.READY
-                    self.scheduler.add_thread(thread)
+        heap = self._io_heap
+        while heap and heap[0][0] <= self.current_tick:
+            _, _, thread = heapq.heappop(heap)
+            thread.io_remaining = 0
+            thread.state_since = self.current_tick
+            thread.status = READY
+            self.scheduler.add_thread(thread)
+            self._touched.append(thread)
 
     def _handle_running_thread(self):
         """실행 중인 스레드 처리"""
         if self.running is None:
             return
+        self._touched.append(self.running)
 
         # CPU 실행
         self.running.remaining_time -= 1
@@ -116,9 +525,13 @@ class Simulator:
 
         # 스레드 완료
         if self.running.remaining_time <= 0:
-            self.running.status = ThreadStatus.TERMINATED
+            self._settle(self.running, RUNNING, self.current_tick)
+            self.running.status = TERMINATED
             self.running.finish_time = self.current_tick
             self.scheduler.thread_exit(self.running)
+            idx = self._order[id(self.running)]
+            self._terminated[idx] = self._active.pop(idx)
+            self._terminated_count += 1
             self.prev_running_tid = self.running.tid
             self.running = None
             return
@@ -130,13 +543,22 @@ class Simulator:
                 self.running.cpu_since_io = 0
                 self.running.io_remaining = self._clamp_io_duration(self.running.io_duration)
                 if self.running.io_remaining > 0:
-                    self.running.status = ThreadStatus.BLOCKED
+                    self._settle(self.running, RUNNING, self.current_tick)
+                    self.running.status = BLOCKED
+                    if self._notify_block:
+                        self.scheduler.thread_block(self.running)
+                    heapq.heappush(self._io_heap, (
+                        self.current_tick + self.running.io_remaining,
+                        self._order[id(self.running)],
+                        self.running,
+                    ))
                     self.prev_running_tid = self.running.tid
                     self.running = None
                     return
 
         # Time slice 만료 - 스레드를 다시 ready queue에 넣기
         if self.current_slice_remaining <= 0:
+            self._settle(self.running, RUNNING, self.current_tick)
             self.scheduler.thread_yield(self.running)
             self.prev_running_tid = self.running.tid
             self.running = None
@@ -147,8 +569,11 @@ class Simulator:
         next_thread = self.scheduler.pick_next()
 
         if next_thread is not None:
+            # ready queue에서 나왔으므로 지금까지는 READY
+            self._settle(next_thread, READY, self.current_tick)
             self.running = next_thread
-            self.running.status = ThreadStatus.RUNNING
+            self.running.status = RUNNING
+            self._touched.append(next_thread)
             self.running.last_scheduled = self.current_tick
             self.current_slice_remaining = self.time_slice
 
@@ -157,36 +582,80 @@ class Simulator:
                 self.context_switches += 1
             self.prev_running_tid = next_thread.tid
 
-    def _update_wait_times(self):
-        """대기/실행 가능했던 시간 누적 (wait_time, runnable_time)"""
-        for thread in self.threads:
-            if thread.status in (ThreadStatus.READY, ThreadStatus.RUNNING):
-                thread.runnable_time += 1
-            if thread.status == ThreadStatus.READY:
-                thread.wait_time += 1
+    def _settle(self, thread: Thread, status: ThreadStatus, now: int):
+        """
+        state_since ~ now 동안 status였던 시간을 누적 (wait_time, runnable_time)
+
+        tick t에 들어온 상태는 t부터, tick t에 떠난 상태는 t-1까지 센다.
+        """
+        elapsed = now - thread.state_since
+        if status == READY:
+            thread.wait_time += elapsed
+            thread.runnable_time += elapsed
+        elif status == RUNNING:
+            thread.runnable_time += elapsed
+        thread.state_since = now
+
+    def _settle_ready(self, now: int):
+        """READY 스레드의 대기 시간을 now 직전까지 정산"""
+        for thread in self._active.values():
+            if thread.status == READY:
+                self._settle(thread, READY, now)
+
+    def _activate(self, thread: Thread):
+        """도착한 스레드를 활성 집합과 기록 대상에 추가"""
+        idx = self._order[id(thread)]
+        self._active[idx] = self._pending.pop(idx)
+
+        pos = bisect_left(self._visible_idx, idx)
+        self._visible_idx.insert(pos, idx)
+        self._visible.insert(pos, thread)
 
     def _record_state(self):
-        """현재 상태 기록"""
-        for thread in self.threads:
-            # 도착하지 않은 스레드는 기록하지 않음
-            if thread.status == ThreadStatus.BLOCKED and thread.arrival_time > self.current_tick:
-                continue
-
-            self.history.append({
-                'tick': self.current_tick,
-                'tid': thread.tid,
-                'name': thread.name,
-                'status': thread.status.name,
-                'priority': getattr(thread, 'priority', None),
-                'nice': thread.nice,
-                'vruntime': getattr(thread, 'vruntime', 0),
-                'remaining_time': thread.remaining_time,
-                'wait_time': thread.wait_time,
-            })
+        """현재 상태 기록 (history_level에 따라)"""
+        level = self.history_level
+        now = self.current_tick
+
+        if level == HISTORY_EVENTS:
+            self._record_transitions()
+            return
+        if level == HISTORY_NONE or (level == HISTORY_SAMPLED and now % self.history_interval != 0):
+            self._touched.clear()
+            return
+
+        self._touched.clear()
+        for thread in self._active.values():
+            self._settle(thread, thread.status, now + 1)
+        # 도착하지 않은 스레드는 기록하지 않음
+        self.recorder.record(now, self._visible)
+
+    def _record_transitions(self):
+        """이번 tick에 상태가 바뀐 스레드만 기록 (리스트 순서)"""
+        if not self._touched:
+            return
+
+        changed = {}
+        for thread in self._touched:
+            idx = self._order[id(thread)]
+            if self._recorded_status[idx] != thread.status:
+                self._recorded_status[idx] = thread.status
+                changed[idx] = thread
+        self._touched.clear()
+
+        if changed:
+            rows = [changed[idx] for idx in sorted(changed)]
+            for thread in rows:
+                self._settle(thread, thread.status, self.current_tick + 1)
+            self.recorder.record(self.current_tick, rows)
 
     def _all_threads_done(self) -> bool:
         """모든 스레드 완료 확인"""
-        return all(t.status == ThreadStatus.TERMINATED for t in self.threads)
+        return self._terminated_count == len(self.threads)
+
+    def _sync_io_remaining(self):
+        """I/O 대기 중인 스레드의 io_remaining을 현재 tick 기준으로 갱신"""
+        for wake_tick, _, thread in self._io_heap:
+            thread.io_remaining = wake_tick - self.current_tick
 
     def _clamp_io_duration(self, raw: int) -> int:
         """의미 있는 블로킹이 되도록 I/O 시간을 클램프"""
@@ -0,0 +1,402 @@
+"""
+멀티코어 (SMP) 시뮬레이션 엔진
+
+N개 CPU 스케줄러 시뮬레이터.
+  - CPU별 실행 슬롯, time slice, 컨텍스트 스위치 수
+  - CPU별 스케줄러 인스턴스 (기본) 또는 모든 CPU가 공유하는 전역 큐
+  - 결과 스레드는 단일 CPU 시뮬레이터와 같은 형식 (calculate_scheduler_metrics 호환)
+
+CPU별 큐 모드:
+  - 도착 시 가장 한가한 CPU(READY+RUNNING 수 최소)에 배치
+  - 이후 I/O에서 깨어나도 같은 CPU로 복귀 (affinity)
+  - idle steal: 큐가 빈 CPU는 실행 중이면서 대기 스레드가 가장 많은 CPU에서
+    다음 스레드 하나를 가져옴 (가져온 스레드는 이후 새 CPU에 배치)
+
+공유 큐 모드:
+  - 모든 실행 스레드의 CPU 사용량을 먼저 반영한 뒤 주기 작업(tick)을 한 번 수행
+    (MLFQS recent_cpu 감쇠/우선순위 재계산이 모든 CPU의 이번 tick 실행을 포함)
+"""
+
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pandas as pd
+from scheduler.thread import Thread, ThreadStatus, RUNNING, READY, BLOCKED, TERMINATED
+from simulator.history import HistoryRecorder
+from simulator.simulator import (
+    MIN_IO_DURATION, MAX_IO_DURATION, HISTORY_NONE, HISTORY_FULL,
+    ProgressCallback, RunMonitor, StopCondition,
+)
+
+
+@dataclass
+class CPU:
+    """시뮬레이션 CPU"""
+    cpu_id: int
+    scheduler: Any
+    running: Optional[Thread] = None
+    slice_remaining: int = 0
+    prev_running_tid: Optional[int] = None
+    context_switches: int = 0
+    nr_running: int = 0  # 배치된 READY/RUNNING 스레드 수
+    busy_ticks: int = 0  # 스레드를 실행한 tick 수
+
+
+class SMPSimulator:
+    """
+    멀티코어 스케줄러 시뮬레이터
+
+    CPU별 큐 모드의 부하 분산은 idle steal뿐 (주기적 재분배 없음):
+    모든 CPU가 바쁘면 큐 길이가 달라도 스레드를 옮기지 않음.
+    idle_steal=False면 처음 배치한 CPU에 고정 (큐가 남은 CPU가 있어도 다른 CPU가 놀 수 있음).
+    """
+
+    def __init__(self, scheduler_factory: Callable[[], Any], threads: List[Thread],
+                 num_cpus: int = 4, time_slice: int = 4, shared_queue: bool = False,
+                 history: str = HISTORY_NONE, idle_steal: bool = True):
+        """
+        Args:
+            scheduler_factory: 스케줄러 생성 함수 (예: CFSScheduler)
+            threads: 시뮬레이션할 스레드 리스트
+            num_cpus: CPU 수
+            time_slice: 시간 조각 (ticks)
+            shared_queue: True면 모든 CPU가 스케줄러 하나(전역 큐)를 공유
+            history: 히스토리 기록 수준 ("none", "full")
+            idle_steal: CPU별 큐 모드에서 큐가 빈 CPU가 다른 CPU의 대기 스레드를 가져옴
+        """
+        if num_cpus < 1:
+            raise ValueError(f"num_cpus must be >= 1: {num_cpus}")
+        if history not in (HISTORY_NONE, HISTORY_FULL):
+            raise ValueError(f"Unsupported history level for SMP: {history}")
+
+        self.threads = threads
+        self.num_cpus = num_cpus
+        self.time_slice = time_slice
+        self.shared_queue = shared_queue
+        self.history_level = history
+        self.idle_steal = idle_steal and not shared_queue
+        self.migrations = 0  # idle steal로 CPU를 옮긴 횟수
+        self.current_tick = 0
+        self.stopped_at: Optional[int] = None  # 조기 종료한 tick (Simulator와 동일)
+
+        if shared_queue:
+            scheduler = scheduler_factory()
+            self.schedulers = [scheduler]
+            self.cpus = [CPU(cpu_id, scheduler) for cpu_id in range(num_cpus)]
+        else:
+            self.schedulers = [scheduler_factory() for _ in range(num_cpus)]
+            self.cpus = [CPU(cpu_id, s) for cpu_id, s in enumerate(self.schedulers)]
+
+        capacity = max(1, len(threads)) * 1024 if history == HISTORY_FULL else 1
+        self.recorder = HistoryRecorder(capacity=capacity)
+        self.recorder.register_names(threads)
+
+        for thread in threads:
+            thread.status = BLOCKED  # 도착 전
+            thread.io_remaining = 0
+            thread.cpu_since_io = 0
+
+        # 도착 달력 / I/O 대기 힙 (Simulator와 동일)
+        self._arrivals: Dict[int, List[Thread]] = {}
+        for thread in threads:
+            self._arrivals.setdefault(thread.arrival_time, []).append(thread)
+        self._order = {id(thread): idx for idx, thread in enumerate(threads)}
+        self._io_heap: List[Tuple[int, int, Thread]] = []
+
+        # 스레드 → CPU 배치 (리스트 순서 → cpu_id)
+        self._thread_cpu: Dict[int, int] = {}
+        self._active: Dict[int, Thread] = {}
+        self._terminated_count = 0
+        self._visible_idx: List[int] = [
+            idx for idx, thread in enumerate(threads) if thread.arrival_time < 0
+        ]
+        self._visible: List[Thread] = [threads[idx] for idx in self._visible_idx]
+
+        self._settle_before_tick = any(
+            getattr(s, 'uses_wait_time', False) for s in self.schedulers
+        )
+        self._notify_block = hasattr(self.schedulers[0], 'thread_block')
+
+    @property
+    def context_switches(self) -> int:
+        """전체 컨텍스트 스위치 수"""
+        return sum(cpu.context_switches for cpu in self.cpus)
+
+    @property
+    def cpu_context_switches(self) -> List[int]:
+        """CPU별 컨텍스트 스위치 수"""
+        return [cpu.context_switches for cpu in self.cpus]
+
+    @property
+    def cpu_busy_ticks(self) -> List[int]:
+        """CPU별 실행 tick 수 (utilization 계산용)"""
+        return [cpu.busy_ticks for cpu in self.cpus]
+
+    def run(self, max_ticks: int = 10000, progress: Optional[ProgressCallback] = None,
+            cancel: Optional[Any] = None, progress_ticks: int = 1000,
+            progress_ms: Optional[float] = None, stop: Optional[StopCondition] = None,
+            stop_ticks: int = 250) -> pd.DataFrame:
+        """
+        시뮬레이션 실행
+
+        Args:
+            max_ticks: 최대 시뮬레이션 시간
+            progress, cancel, progress_ticks, progress_ms, stop, stop_ticks: Simulator.run과 동일
+
+        Returns:
+            시뮬레이션 히스토리 (DataFrame, history="none"이면 비어 있음)
+
+        Raises:
+            SimulationCancelled: 취소됨
+        """
+        check_stop = None
+        if stop is not None:
+            def check_stop(tick):
+                self._settle_threads()
+                return stop(self.threads, tick)
+        monitor = RunMonitor(max_ticks, progress, cancel, progress_ticks, progress_ms,
+                             check_stop, stop_ticks)
+        self.stopped_at = None
+        next_check = monitor.first_check()
+        for tick in range(max_ticks):
+            if tick == next_check:
+                next_check = monitor.check(tick)
+                if monitor.stopped:
+                    self.stopped_at = tick
+                    break
+            self.current_tick = tick
+
+            # 1. 새로 도착한 스레드 처리
+            self._handle_arrivals()
+
+            # 2. I/O 완료 처리 (BLOCKED → READY)
+            self._handle_io_completion()
+
+            # 3. 스케줄러 tick 호출
+            self._scheduler_tick()
+
+            # 4. CPU별 실행 중인 스레드 처리
+            for cpu in self.cpus:
+                self._handle_running_thread(cpu)
+
+            # 5. 빈 CPU에 다음 스레드 선택
+            for cpu in self.cpus:
+                if cpu.running is None:
+                    self._schedule_next(cpu)
+
+            # 6. 현재 상태 기록
+            if self.history_level == HISTORY_FULL:
+                self._record_state()
+
+            # 7. 모든 스레드 완료 확인
+            if self._terminated_count == len(self.threads):
+                break
+        monitor.finish()
+
+        self._settle_threads()
+        return self.recorder.to_dataframe()
+
+    def _settle_threads(self):
+        """현재 tick까지 스레드 필드 정산 (메트릭 계산용, 실행 중에 해도 결과는 같음)"""
+        for wake_tick, _, thread in self._io_heap:
+            thread.io_remaining = wake_tick - self.current_tick
+
+        # 마지막 tick까지의 대기/실행 가능 시간 정산
+        for thread in self._active.values():
+            self._settle(thread, thread.status, self.current_tick + 1)
+
+        # 메트릭 계산을 위해 모든 스레드에 (전체) 컨텍스트 스위치 수를 기록
+        total = self.context_switches
+        for thread in self.threads:
+            thread.context_switches = total
+
+    def _place(self, thread: Thread) -> CPU:
+        """스레드가 실행될 CPU (처음 도착 시 가장 한가한 CPU, 이후 고정)"""
+        idx = self._order[id(thread)]
+        cpu_id = self._thread_cpu.get(idx)
+        if cpu_id is None:
+            cpu_id = min(self.cpus, key=lambda c: (c.nr_running, c.cpu_id)).cpu_id
+            self._thread_cpu[idx] = cpu_id
+        return self.cpus[cpu_id]
+
+    def _make_ready(self, thread: Thread):
+        """BLOCKED → READY, 배치된 CPU의 스케줄러에 추가"""
+        cpu = self._place(thread)
+        cpu.nr_running += 1
+        thread.state_since = self.current_tick
+        thread.status = READY
+        cpu.scheduler.add_thread(thread)
+
+    def _handle_arrivals(self):
+        """새로 도착한 스레드 추가"""
+        for thread in self._arrivals.get(self.current_tick, ()):
+            if thread.status == BLOCKED:
+                self._make_ready(thread)
+
+                idx = self._order[id(thread)]
+                self._active[idx] = thread
+                pos = bisect_left(self._visible_idx, idx)
+                self._visible_idx.insert(pos, idx)
+                self._visible.insert(pos, thread)
+
+    def _handle_io_completion(self):
+        """I/O 완료 처리 (BLOCKED → READY)"""
+        heap = self._io_heap
+        while heap and heap[0][0] <= self.current_tick:
+            _, _, thread = heapq.heappop(heap)
+            thread.io_remaining = 0
+            self._make_ready(thread)
+
+    def _scheduler_tick(self):
+        """스케줄러 tick 호출"""
+        tick = self.current_tick
+        if self._settle_before_tick:
+            for thread in self._active.values():
+                if thread.status == READY:
+                    self._settle(thread, READY, tick)
+
+        if not self.shared_queue:
+            for cpu in self.cpus:
+                cpu.scheduler.tick(tick, cpu.running)
+            return
+
+        # 공유 큐: 주기 작업은 한 번만, 나머지 실행 스레드는 CPU 사용량만 반영
+        # (주기 작업 전에 반영해야 감쇠/재계산에 이번 tick 실행이 모두 들어감)
+        scheduler = self.schedulers[0]
+        running = [cpu.running for cpu in self.cpus if cpu.running is not None]
+        for thread in running[1:]:
+            scheduler.account_cpu(thread)
+        scheduler.tick(tick, running[0] if running else None)
+
+    def _handle_running_thread(self, cpu: CPU):
+        """CPU의 실행 중인 스레드 처리"""
+        thread = cpu.running
+        if thread is None:
+            return
+
+        # CPU 실행
+        thread.remaining_time -= 1
+        cpu.slice_remaining -= 1
+        cpu.busy_ticks += 1
+
+        # 첫 실행 시간 기록
+        if thread.start_time == -1:
+            thread.start_time = self.current_tick
+
+        # 스레드 완료
+        if thread.remaining_time <= 0:
+            self._settle(thread, RUNNING, self.current_tick)
+            thread.status = TERMINATED
+            thread.finish_time = self.current_tick
+            cpu.scheduler.thread_exit(thread)
+            self._active.pop(self._order[id(thread)])
+            self._terminated_count += 1
+            self._release(cpu)
+            return
+
+        # I/O 진입 여부 확인 (완료가 아닐 때만)
+        if thread.io_frequency > 0 and thread.io_duration > 0:
+            thread.cpu_since_io += 1
+            if thread.cpu_since_io >= thread.io_frequency:
+                thread.cpu_since_io = 0
+                thread.io_remaining = self._clamp_io_duration(thread.io_duration)
+                if thread.io_remaining > 0:
+                    self._settle(thread, RUNNING, self.current_tick)
+                    thread.status = BLOCKED
+                    if self._notify_block:
+                        cpu.scheduler.thread_block(thread)
+                    heapq.heappush(self._io_heap, (
+                        self.current_tick + thread.io_remaining,
+                        self._order[id(thread)],
+                        thread,
+                    ))
+                    self._release(cpu)
+                    return
+
+        # Time slice 만료 - 스레드를 다시 ready queue에 넣기
+        if cpu.slice_remaining <= 0:
+            self._settle(thread, RUNNING, self.current_tick)
+            cpu.scheduler.thread_yield(thread)
+            cpu.prev_running_tid = thread.tid
+            cpu.running = None
+
+    def _release(self, cpu: CPU):
+        """실행 스레드가 BLOCKED/TERMINATED로 CPU를 떠남"""
+        thread = cpu.running
+        self.cpus[self._thread_cpu[self._order[id(thread)]]].nr_running -= 1
+        cpu.prev_running_tid = thread.tid
+        cpu.running = None
+
+    def _schedule_next(self, cpu: CPU):
+        """CPU에 다음 스레드 선택"""
+        next_thread = cpu.scheduler.pick_next()
+        if next_thread is None and self.idle_steal:
+            next_thread = self._steal(cpu)
+        if next_thread is None:
+            return
+
+        self._settle(next_thread, READY, self.current_tick)
+        cpu.running = next_thread
+        next_thread.status = RUNNING
+        next_thread.last_scheduled = self.current_tick
+        cpu.slice_remaining = self.time_slice
+
+        # 컨텍스트 스위치 카운트 (CPU별)
+        if cpu.prev_running_tid is not None and cpu.prev_running_tid != next_thread.tid:
+            cpu.context_switches += 1
+        cpu.prev_running_tid = next_thread.tid
+
+    def _steal(self, cpu: CPU) -> Optional[Thread]:
+        """
+        대기 스레드가 가장 많은 바쁜 CPU에서 다음 스레드를 가져와 cpu에 배치
+
+        원래 CPU 스케줄러에서는 종료처럼 빼고 새 CPU 스케줄러에 READY로 추가
+        (CFS vruntime은 새 큐의 min_vruntime 이상으로,
+        MLFQS는 add_migrated_thread로 추가해 recent_cpu 유지).
+        """
+        source = max(
+            (c for c in self.cpus if c.running is not None and c.nr_running > 1),
+            key=lambda c: (c.nr_running, -c.cpu_id), default=None,
+        )
+        if source is None:
+            return None
+        thread = source.scheduler.pick_next()
+        if thread is None:
+            return None
+
+        source.scheduler.thread_exit(thread)
+        source.nr_running -= 1
+        cpu.nr_running += 1
+        self._thread_cpu[self._order[id(thread)]] = cpu.cpu_id
+        self.migrations += 1
+
+        thread.status = READY
+        if hasattr(cpu.scheduler, 'add_migrated_thread'):
+            cpu.scheduler.add_migrated_thread(thread)
+        else:
+            cpu.scheduler.add_thread(thread)
+        return cpu.scheduler.pick_next()
+
+    def _settle(self, thread: Thread, status: ThreadStatus, now: int):
+        """state_since ~ now 동안 status였던 시간을 누적 (Simulator._settle과 동일)"""
+        elapsed = now - thread.state_since
+        if status == READY:
+            thread.wait_time += elapsed
+            thread.runnable_time += elapsed
+        elif status == RUNNING:
+            thread.runnable_time += elapsed
+        thread.state_since = now
+
+    def _record_state(self):
+        """현재 상태 기록 (도착한 스레드 전체)"""
+        now = self.current_tick
+        for thread in self._active.values():
+            self._settle(thread, thread.status, now + 1)
+        self.recorder.record(now, self._visible)
+
+    def _clamp_io_duration(self, raw: int) -> int:
+        """의미 있는 블로킹이 되도록 I/O 시간을 클램프"""
+        if raw <= 0:
+            return 0
+        return max(MIN_IO_DURATION, min(MAX_IO_DURATION, raw))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+여러 seed 일괄 시뮬레이터 테스트
+
+1. BatchSimulator seed별 결과 == seed별 Simulator 결과
+2. 지원하지 않는 스케줄러는 ValueError
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator
+from simulator.batch import BatchSimulator
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "cfs": CFSScheduler,
+}
+
+WORKLOADS = ["mixed", "io_bound", "web_server", "batch", "extreme_nice_fairness"]
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_batch_matches_simulator():
+    """BatchSimulator seed별 결과 == seed별 Simulator 결과 (seed마다 max_ticks 다름)"""
+    seeds = [1, 2, 3, 4]
+    limits = [0, 40, 1500, 3000]
+    for workload_type in WORKLOADS:
+        for scheduler_name in SCHEDULERS:
+            workloads = [generate_workload(workload_type, 20, seed=seed) for seed in seeds]
+            BatchSimulator(scheduler_name, workloads).run(limits)
+
+            for seed, max_ticks, batch_threads in zip(seeds, limits, workloads):
+                threads = generate_workload(workload_type, 20, seed=seed)
+                Simulator(SCHEDULERS[scheduler_name](), threads, history="none").run(max_ticks=max_ticks)
+                assert _thread_state(threads) == _thread_state(batch_threads), \
+                    f"{workload_type}/{scheduler_name}/seed={seed}: 스레드 상태 불일치"
+
+
+def test_unknown_batch_scheduler():
+    """일괄 실행을 지원하지 않는 스케줄러는 ValueError"""
+    with pytest.raises(ValueError):
+        BatchSimulator("mlfqs", [])
+
+
+if __name__ == "__main__":
+    test_batch_matches_simulator()
+    test_unknown_batch_scheduler()
+    print("모든 일괄 시뮬레이터 테스트 통과")
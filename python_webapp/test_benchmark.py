@@ -12,65 +12,38 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from copy import deepcopy
-from scheduler.basic_priority import BasicPriorityScheduler
-from scheduler.mlfqs import MLFQSScheduler
-from scheduler.cfs import CFSScheduler
-from workload.generator import generate_workload
-from simulator.simulator import Simulator
+from workload.generator import generate_workload_spec
+from benchmark.runner import run_schedulers, run_suite, suggest_max_ticks, convergence_metric
+from benchmark.cache import ResultCache
 from analysis.insights import generate_comparison_report
 from benchmark.tests import ALL_TESTS, TEST_CATEGORIES
 
 
-def run_test(test, max_ticks=35000):
-    """단일 테스트 실행"""
-    print(f"\n{'='*60}")
-    print(f"테스트: {test.name} ({test.test_id})")
-    print(f"목표: {test.goal}")
-    print(f"워크로드: {test.workload_type}, 스레드: {test.thread_count}")
-    print(f"비교 대상: {', '.join(s.upper() for s in test.schedulers)}")
-    print(f"주요 메트릭: {test.primary_metric}")
-    print(f"{'='*60}")
+def run_test(test, max_ticks=35000, num_cpus=1, parallel=True, converge=False):
+    """
+    단일 테스트 실행
 
+    Args:
+        test: BenchmarkTest
+        max_ticks: 최대 시뮬레이션 시간
+        num_cpus: CPU 수 (2 이상이면 SMPSimulator 사용)
+        parallel: True면 스케줄러별로 별도 프로세스에서 실행
+        converge: True면 주요 메트릭(fairness, cpu_time_ratio, cv_wait)이 안정될 때
+                  조정된 시뮬레이션 시간 전에 멈춤
+    """
     # 워크로드 생성
-    base_threads = generate_workload(test.workload_type, test.thread_count, seed=42)
+    workload = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
 
     # 시뮬레이션 시간 조정
-    actual_max_ticks = max_ticks
-    if test.test_id == "nice_effect":
-        total_work = sum(t.burst_time for t in base_threads)
-        suggested_ticks = int(total_work * 0.2)
-        actual_max_ticks = min(max_ticks, suggested_ticks)
-    elif test.test_id == "fairness_extreme_nice":
-        total_work = sum(t.burst_time for t in base_threads)
-        suggested_ticks = int(total_work * 0.3)
-        actual_max_ticks = min(max_ticks, suggested_ticks)
-    elif test.test_id in ["fairness_cpu", "fairness_mixed"]:
-        total_work = sum(t.burst_time for t in base_threads)
-        suggested_ticks = int(total_work * 0.5)
-        actual_max_ticks = min(max_ticks, suggested_ticks)
-
-    print(f"시뮬레이션 ticks: {actual_max_ticks}")
-
-    # 스케줄러 실행
-    scheduler_results = {}
-
-    for scheduler_name in test.schedulers:
-        threads = deepcopy(base_threads)
-
-        if scheduler_name == "basic":
-            scheduler = BasicPriorityScheduler(enable_aging=False)
-        elif scheduler_name == "mlfqs":
-            scheduler = MLFQSScheduler()
-        elif scheduler_name == "cfs":
-            scheduler = CFSScheduler()
-        else:
-            print(f"Unknown scheduler: {scheduler_name}")
-            continue
-
-        sim = Simulator(scheduler, threads)
-        df = sim.run(max_ticks=actual_max_ticks)
-        scheduler_results[scheduler_name] = threads
+    actual_max_ticks = suggest_max_ticks(test, workload, max_ticks)
+    print_test_header(test, actual_max_ticks, num_cpus)
+
+    # 스케줄러 실행 (스케줄러별 병렬)
+    scheduler_results, _ = run_schedulers(
+        test.schedulers, workload, actual_max_ticks,
+        num_cpus=num_cpus, parallel=parallel,
+        converge=convergence_metric(test) if converge else None,
+    )
 
     # 결과 분석
     report = generate_comparison_report(scheduler_results, primary_metric=test.primary_metric)
@@ -78,6 +51,20 @@ def run_test(test, max_ticks=35000):
     return report, scheduler_results
 
 
+def print_test_header(test, max_ticks, num_cpus=1):
+    """테스트 정보 출력"""
+    print(f"\n{'='*60}")
+    print(f"테스트: {test.name} ({test.test_id})")
+    print(f"목표: {test.goal}")
+    print(f"워크로드: {test.workload_type}, 스레드: {test.thread_count}")
+    print(f"비교 대상: {', '.join(s.upper() for s in test.schedulers)}")
+    print(f"주요 메트릭: {test.primary_metric}")
+    if num_cpus > 1:
+        print(f"CPU 수: {num_cpus}")
+    print(f"{'='*60}")
+    print(f"시뮬레이션 ticks: {max_ticks}")
+
+
 def analyze_results(test, report, scheduler_results):
     """결과 분석 및 버그 의심 사항 검출"""
     issues = []
@@ -171,13 +158,28 @@ def analyze_results(test, report, scheduler_results):
     return issues
 
 
-def main():
-    """모든 테스트 실행"""
+def main(max_workers=None, job_timeout=None, use_cache=True, converge=False):
+    """
+    모든 테스트 실행
+
+    (테스트, 스케줄러) 작업 전체를 run_suite로 프로세스 풀에서 실행한 뒤
+    카테고리 순서대로 결과 출력.
+
+    Args:
+        max_workers: 프로세스 수 (None이면 CPU 코어 수)
+        job_timeout: 작업 하나의 제한 시간 (초)
+        use_cache: True면 디스크 결과 캐시 사용 (코드/입력이 같은 작업은 재실행하지 않음)
+        converge: True면 공정성/nice 테스트는 주요 메트릭이 안정될 때 일찍 멈춤
+    """
     print("="*70)
     print("스케줄러 벤치마크 테스트 실행")
     print("="*70)
 
     all_issues = []
+    tests = [test for category_info in TEST_CATEGORIES.values() for test in category_info['tests']]
+    cache = ResultCache() if use_cache else None
+    suite = run_suite(tests, max_workers=max_workers, job_timeout=job_timeout, cache=cache,
+                      converge=converge)
 
     for category_name, category_info in TEST_CATEGORIES.items():
         print(f"\n\n{'#'*70}")
@@ -186,9 +188,18 @@ def main():
         print(f"{'#'*70}")
 
         for test in category_info['tests']:
+            result = suite[test.test_id]
+            print_test_header(test, result.max_ticks)
+            if result.errors:
+                print(f"\n[오류 발생] {test.test_id}:")
+                errors = [f"[오류] {name}: {error}" for name, error in result.errors.items()]
+                for error in errors:
+                    print(f"  {error}")
+                all_issues.append((test.test_id, errors))
+                continue
+
             try:
-                report, scheduler_results = run_test(test)
-                issues = analyze_results(test, report, scheduler_results)
+                issues = analyze_results(test, result.report, result.scheduler_results)
 
                 if issues:
                     print(f"\n[!!! 발견된 문제점 !!!]")
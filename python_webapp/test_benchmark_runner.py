@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+벤치마크 실행기 테스트
+
+병렬 실행 결과는 순차 실행 결과와 같아야 함:
+1. 스케줄러별 스레드 최종 상태
+2. 비교 리포트 (승자, 메트릭)
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+import numpy as np
+import pandas as pd
+from benchmark.runner import (
+    run_schedulers, run_suite, suggest_max_ticks, run_replicates, warm_cache, SCHEDULER_FACTORIES,
+    MP_START_METHOD,
+)
+from benchmark.cache import ResultCache
+import benchmark.cache as cache_module
+from analysis.replicates import generate_replicate_report
+from benchmark.tests import get_test_by_id
+from workload.generator import generate_workload, generate_workload_spec
+from analysis.insights import generate_comparison_report, calculate_scheduler_metrics
+from scheduler.basic_priority import BasicPriorityScheduler
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "start_time", "finish_time", "wait_time", "runnable_time", "context_switches",
+]
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_parallel_matches_sequential():
+    """ProcessPoolExecutor 실행 == 순차 실행, 원본 워크로드는 그대로"""
+    test = get_test_by_id("general_io")
+    base_threads = generate_workload(test.workload_type, test.thread_count, seed=42)
+    original = _thread_state(base_threads)
+
+    completed = []
+    parallel, _ = run_schedulers(test.schedulers, base_threads, 5000,
+                                 max_workers=len(test.schedulers),
+                                 on_complete=completed.append)
+    sequential, _ = run_schedulers(test.schedulers, base_threads, 5000, parallel=False)
+
+    assert list(parallel) == test.schedulers
+    assert sorted(completed) == sorted(test.schedulers)
+    assert _thread_state(base_threads) == original
+    for scheduler_name in test.schedulers:
+        assert _thread_state(parallel[scheduler_name]) == _thread_state(sequential[scheduler_name])
+
+    # 병렬 실행에서도 진행 상황은 워커에서 부모로 전달됨 (스케줄러별 마지막 보고 = 완료)
+    progress = {}
+    reported, _ = run_schedulers(test.schedulers, base_threads, 5000,
+                                 max_workers=len(test.schedulers),
+                                 on_progress=lambda name, tick, total: progress.update({name: tick}))
+    assert progress == {name: 5000 for name in test.schedulers}
+    for scheduler_name in test.schedulers:
+        assert _thread_state(reported[scheduler_name]) == _thread_state(sequential[scheduler_name])
+
+    report_parallel = generate_comparison_report(parallel, primary_metric=test.primary_metric)
+    report_sequential = generate_comparison_report(sequential, primary_metric=test.primary_metric)
+    assert report_parallel['winner'] == report_sequential['winner']
+    assert report_parallel['metrics'] == report_sequential['metrics']
+
+
+def test_workload_spec():
+    """WorkloadSpec.instantiate() == generate_workload, 실행마다 독립, 명세로 실행해도 같은 결과"""
+    test = get_test_by_id("general_io")
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+    base_threads = generate_workload(test.workload_type, test.thread_count, seed=42)
+
+    first, second = spec.instantiate(), spec.instantiate()
+    assert first == base_threads and second == base_threads
+    assert all(a is not b for a, b in zip(first, second))
+    assert suggest_max_ticks(test, spec, 35000) == suggest_max_ticks(test, base_threads, 35000)
+
+    from_spec, _ = run_schedulers(test.schedulers, spec, 3000, parallel=False)
+    from_list, _ = run_schedulers(test.schedulers, base_threads, 3000, parallel=False)
+    for scheduler_name in test.schedulers:
+        assert _thread_state(from_spec[scheduler_name]) == _thread_state(from_list[scheduler_name])
+    assert spec.instantiate() == base_threads
+
+
+def test_unknown_scheduler():
+    """알 수 없는 스케줄러는 ValueError"""
+    with pytest.raises(ValueError):
+        run_schedulers(["fifo"], [], 100)
+
+
+def test_suite_matches_single_test():
+    """run_suite 결과 == 테스트별 run_schedulers 결과, 작업 실패는 errors에 기록"""
+    tests = [get_test_by_id("general_io"), get_test_by_id("nice_effect")]
+    completed = []
+    suite = run_suite(tests, max_ticks=4000, max_workers=2,
+                      on_complete=lambda test_id, name: completed.append((test_id, name)))
+
+    assert list(suite) == [test.test_id for test in tests]
+    assert len(completed) == sum(len(test.schedulers) for test in tests)
+    for test in tests:
+        result = suite[test.test_id]
+        base_threads = generate_workload(test.workload_type, test.thread_count, seed=42)
+        assert result.max_ticks == suggest_max_ticks(test, base_threads, 4000)
+        assert not result.errors
+        assert list(result.scheduler_results) == test.schedulers
+
+        expected, _ = run_schedulers(test.schedulers, base_threads, result.max_ticks, parallel=False)
+        for scheduler_name in test.schedulers:
+            assert (_thread_state(result.scheduler_results[scheduler_name])
+                    == _thread_state(expected[scheduler_name]))
+        report = generate_comparison_report(expected, primary_metric=test.primary_metric)
+        assert result.report['winner'] == report['winner']
+
+    # 제한 시간 초과 작업은 해당 테스트만 오류 처리
+    suite = run_suite([get_test_by_id("scalability_500")], max_workers=1, job_timeout=0.01)
+    result = suite["scalability_500"]
+    assert result.report is None
+    assert all("JobTimeoutError" in error for error in result.errors.values())
+
+
+def test_parallel_from_thread():
+    """스레드에서 병렬 실행 (Streamlit 스크립트 스레드처럼): fork 없이 워커 시작, 결과 동일"""
+    assert MP_START_METHOD != "fork"
+    test = get_test_by_id("general_io")
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+    outcome = {}
+
+    def run():
+        outcome["parallel"], _ = run_schedulers(test.schedulers, spec, 3000,
+                                                max_workers=len(test.schedulers))
+
+    # 백그라운드 스레드가 돌고 있는 상태에서 다른 스레드가 풀을 시작
+    busy = threading.Event()
+    background = threading.Thread(target=busy.wait, daemon=True)
+    background.start()
+    worker = threading.Thread(target=run)
+    worker.start()
+    worker.join()
+    busy.set()
+
+    sequential, _ = run_schedulers(test.schedulers, spec, 3000, parallel=False)
+    for scheduler_name in test.schedulers:
+        assert (_thread_state(outcome["parallel"][scheduler_name])
+                == _thread_state(sequential[scheduler_name]))
+
+
+def test_converge(tmp_path):
+    """수렴 조기 종료: 병렬 == 순차, 수렴한 스케줄러는 시뮬레이션 시간 전에 멈춤, 캐시 키 분리"""
+    test = get_test_by_id("fairness_mixed")
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+    max_ticks = suggest_max_ticks(test, spec, 35000)
+
+    sequential, _ = run_schedulers(test.schedulers, spec, max_ticks, parallel=False,
+                                   converge="fairness")
+    parallel, _ = run_schedulers(test.schedulers, spec, max_ticks, max_workers=2,
+                                 converge="fairness")
+    full, _ = run_schedulers(test.schedulers, spec, max_ticks, parallel=False)
+    for scheduler_name in test.schedulers:
+        assert _thread_state(sequential[scheduler_name]) == _thread_state(parallel[scheduler_name])
+    # CFS 공정성 지수는 예산 절반쯤에서 안정됨 → CPU 사용량이 전체 실행보다 적음
+    used = lambda threads: sum(t.burst_time - t.remaining_time for t in threads)
+    assert used(sequential["cfs"]) < used(full["cfs"])
+
+    suite = run_suite([test], max_workers=1, converge=True, cache=ResultCache(str(tmp_path)))
+    for scheduler_name in test.schedulers:
+        assert (_thread_state(suite[test.test_id].scheduler_results[scheduler_name])
+                == _thread_state(sequential[scheduler_name]))
+
+    with pytest.raises(ValueError):
+        run_schedulers(test.schedulers, spec, max_ticks, converge="avg_wait")
+
+    # 캐시 키는 수렴 기준(tolerance/window/min_ticks)과 판정 코드까지 구분
+    factory = SCHEDULER_FACTORIES["cfs"]
+    key = ResultCache.key(spec, "cfs", factory, max_ticks, converge="fairness")
+    assert key != ResultCache.key(spec, "cfs", factory, max_ticks)
+    assert key != ResultCache.key(spec, "cfs", factory, max_ticks, converge="cv_wait")
+    original = cache_module.ConvergenceCriterion
+    try:
+        cache_module.ConvergenceCriterion = partial(original, tolerance=0.05)
+        assert key != ResultCache.key(spec, "cfs", factory, max_ticks, converge="fairness")
+    finally:
+        cache_module.ConvergenceCriterion = original
+    assert "analysis/convergence.py" in cache_module.SOURCE_PATTERNS
+    assert "benchmark/runner.py" in cache_module.SOURCE_PATTERNS
+
+
+def test_result_cache(tmp_path):
+    """캐시된 결과 == 새 실행 결과, 입력이 바뀌면 다른 키, 크기 제한 초과 시 오래된 항목 삭제"""
+    cache = ResultCache(str(tmp_path))
+    test = get_test_by_id("general_io")
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+
+    fresh, fresh_df = run_schedulers(test.schedulers, spec, 3000, history="full",
+                                     parallel=False, cache=cache)
+    cached, cached_df = run_schedulers(test.schedulers, spec, 3000, history="full",
+                                       parallel=False, cache=cache)
+    for scheduler_name in test.schedulers:
+        assert cached[scheduler_name] == fresh[scheduler_name]
+        pd.testing.assert_frame_equal(cached_df[scheduler_name], fresh_df[scheduler_name])
+        key = ResultCache.key(spec, scheduler_name, SCHEDULER_FACTORIES[scheduler_name],
+                              3000, history="full")
+        metrics = calculate_scheduler_metrics(fresh[scheduler_name])
+        stored = cache.get(key).metrics
+        assert stored == metrics
+        assert {k: type(v) for k, v in stored.items()} == {k: type(v) for k, v in metrics.items()}
+
+    # 캐시 파일에는 pickle이 필요한 배열이 없음 (None 메트릭 포함)
+    cache.put("none_metric", fresh["cfs"], {"avg_turnaround": None, "cv_wait": np.float64(0.5)})
+    assert cache.get("none_metric").metrics == {"avg_turnaround": None, "cv_wait": 0.5}
+    with np.load(cache._path("none_metric"), allow_pickle=False) as data:
+        assert all(data[name].dtype != object for name in data.files)
+
+    key = ResultCache.key(spec, "cfs", SCHEDULER_FACTORIES["cfs"], 3000)
+    assert key != ResultCache.key(spec, "cfs", SCHEDULER_FACTORIES["cfs"], 3001)
+    assert (ResultCache.key(spec, "basic", SCHEDULER_FACTORIES["basic"], 3000)
+            != ResultCache.key(spec, "basic", BasicPriorityScheduler, 3000))
+
+    # max_ticks만 늘린 실행은 스냅샷에서 이어서 실행, 결과는 처음부터 실행한 것과 같음
+    extended, extended_df = run_schedulers(test.schedulers, spec, 4500, history="full",
+                                           parallel=False, cache=cache)
+    expected, expected_df = run_schedulers(test.schedulers, spec, 4500, history="full",
+                                           parallel=False)
+    for scheduler_name in test.schedulers:
+        assert extended[scheduler_name] == expected[scheduler_name]
+        pd.testing.assert_frame_equal(extended_df[scheduler_name], expected_df[scheduler_name])
+        snapshot_key = ResultCache.key(spec, scheduler_name, SCHEDULER_FACTORIES[scheduler_name],
+                                       None, history="full")
+        assert cache.get_snapshot(snapshot_key)[0] == 4500
+
+    # 스냅샷에는 히스토리가 없음 (이전 히스토리는 결과 항목에서), 실제로 이어서 실행함
+    snapshot_key = ResultCache.key(spec, "cfs", SCHEDULER_FACTORIES["cfs"], None, history="full")
+    result_key = ResultCache.key(spec, "cfs", SCHEDULER_FACTORIES["cfs"], 4500, history="full")
+    assert (os.path.getsize(cache._snapshot_path(snapshot_key))
+            < os.path.getsize(cache._path(result_key)) / 4)
+    first_tick = {}
+    resumed, resumed_df = run_schedulers(
+        ["cfs"], spec, 6000, history="full", parallel=False, cache=cache,
+        on_progress=lambda name, tick, total: first_tick.setdefault(name, tick))
+    expected, expected_df = run_schedulers(["cfs"], spec, 6000, history="full", parallel=False)
+    assert first_tick["cfs"] > 4500
+    assert resumed["cfs"] == expected["cfs"]
+    pd.testing.assert_frame_equal(resumed_df["cfs"], expected_df["cfs"])
+
+    # 서명이 맞지 않는 스냅샷은 읽지 않음 (다른 키, 바뀐 바이트, 다른 항목으로 복사)
+    assert ResultCache(str(tmp_path), snapshot_key=b"other").get_snapshot(snapshot_key) is None
+    tick, snapshot = cache.get_snapshot(snapshot_key)
+    with np.load(cache._snapshot_path(snapshot_key), allow_pickle=False) as data:
+        mac = data["mac"].copy()
+    tampered = bytearray(snapshot)
+    tampered[-1] ^= 1
+    with open(cache._snapshot_path(snapshot_key), "wb") as f:
+        np.savez(f, tick=np.array(tick), snapshot=np.frombuffer(bytes(tampered), dtype=np.uint8),
+                 mac=mac)
+    assert cache.get_snapshot(snapshot_key) is None
+    other_key = ResultCache.key(spec, "basic", SCHEDULER_FACTORIES["basic"], None, history="full")
+    with open(cache._snapshot_path(snapshot_key), "wb") as f:
+        np.savez(f, tick=np.array(tick), snapshot=np.frombuffer(snapshot, dtype=np.uint8), mac=mac)
+    assert cache.get_snapshot(snapshot_key) is not None
+    os.replace(cache._snapshot_path(snapshot_key), cache._snapshot_path(other_key))
+    assert cache.get_snapshot(other_key) is None
+
+    suite = run_suite([test], max_ticks=3000, max_workers=1, cache=cache)
+    again = run_suite([test], max_ticks=3000, max_workers=1, cache=cache)
+    assert again[test.test_id].report['winner'] == suite[test.test_id].report['winner']
+
+    # 항목 3개 크기 제한: 넘으면 2개(EVICT_RATIO)까지 줄이고, 최근에 읽은 a는 남음
+    cache.clear()
+    cache.put("a", fresh["cfs"], {})
+    cache.max_bytes = 3 * cache.size()
+    cache.put("b", fresh["cfs"], {})
+    cache.put("c", fresh["cfs"], {})
+    assert cache.get("a") is not None
+    cache.put("d", fresh["cfs"], {})
+    assert "a" in cache and "d" in cache and "b" not in cache and "c" not in cache
+
+
+def test_cache_size_bound(tmp_path):
+    """전체 크기가 max_bytes를 넘지 않고, 디렉토리는 처음과 상한을 넘을 때만 훑음"""
+    spec = generate_workload_spec("cpu_bound", 3, seed=1)
+    fresh, _ = run_schedulers(["basic"], spec, 200, parallel=False)
+    cache = ResultCache(str(tmp_path), snapshot_key=b"k" * 32)
+    cache.put("first", fresh["basic"], {})
+    entry_size = cache.size()
+    cache.max_bytes = 10 * entry_size + entry_size // 2
+
+    scans = []
+    entries = cache._entries
+    cache._entries = lambda: scans.append(1) or entries()
+    for i in range(9):
+        cache.put(f"k{i}", fresh["basic"], {})
+    assert not scans and cache.size() <= cache.max_bytes
+    # 가득 찬 뒤에도 쓰기 몇 번에 한 번만 디렉토리를 훑음
+    del scans[:]
+    for i in range(9, 39):
+        cache.put(f"k{i}", fresh["basic"], {})
+        assert cache._known_bytes <= cache.max_bytes
+    assert 0 < len(scans) <= 30 // 2
+    assert cache.size() <= cache.max_bytes
+    assert "k38" in cache and "first" not in cache
+
+
+def test_snapshot_key_location(tmp_path):
+    """서명 키는 프로젝트/캐시 디렉토리 밖 0600 파일만 사용, 아니면 스냅샷 사용 안 함"""
+    cache_dir = tmp_path / "results"
+    key_file = tmp_path / "config" / "snapshot.key"
+    key = cache_module._load_snapshot_key(str(key_file), str(cache_dir))
+    assert key is not None and len(key) == 32
+    assert os.stat(key_file).st_mode & 0o777 == 0o600
+    assert cache_module._load_snapshot_key(str(key_file), str(cache_dir)) == key
+
+    # 캐시 디렉토리/프로젝트 안, 위치 없음, 다른 사용자도 쓸 수 있는 키 → 거부
+    assert cache_module._load_snapshot_key(str(cache_dir / "snapshot.key"), str(cache_dir)) is None
+    assert cache_module._load_snapshot_key(
+        os.path.join(cache_module._ROOT, ".cache", "snapshot.key"), str(cache_dir)) is None
+    assert cache_module._load_snapshot_key(None, str(cache_dir)) is None
+    os.chmod(key_file, 0o666)
+    assert cache_module._load_snapshot_key(str(key_file), str(cache_dir)) is None
+
+    # 키가 없는 캐시: 스냅샷을 저장하지도 읽지도 않고 결과는 그대로
+    original = cache_module.DEFAULT_SNAPSHOT_KEY_FILE
+    try:
+        cache_module.DEFAULT_SNAPSHOT_KEY_FILE = None
+        cache = ResultCache(str(cache_dir))
+    finally:
+        cache_module.DEFAULT_SNAPSHOT_KEY_FILE = original
+    assert not cache.snapshots_enabled
+    assert not cache.put_snapshot("k", 10, b"data") and cache.get_snapshot("k") is None
+    test = get_test_by_id("general_io")
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+    cached, _ = run_schedulers(["cfs"], spec, 2000, parallel=False, cache=cache)
+    fresh, _ = run_schedulers(["cfs"], spec, 2000, parallel=False)
+    assert cached["cfs"] == fresh["cfs"]
+    assert not list(cache_dir.glob("*.snapshot.npz"))
+
+
+def test_warm_cache(tmp_path):
+    """예열 후 기본 설정 실행은 모두 캐시에서 읽고 결과는 새 실행과 같음"""
+    cache = ResultCache(str(tmp_path))
+    test = replace(get_test_by_id("general_io"), max_ticks=3000)
+    assert warm_cache([test], cache, max_workers=1) == len(test.schedulers)
+    assert warm_cache([test], cache, max_workers=1) == 0
+
+    spec = generate_workload_spec(test.workload_type, test.thread_count, seed=42)
+    cached, _ = run_schedulers(test.schedulers, spec, test.max_ticks, history="full",
+                               parallel=False, cache=cache)
+    fresh, _ = run_schedulers(test.schedulers, spec, test.max_ticks, history="full",
+                              parallel=False)
+    for scheduler_name in test.schedulers:
+        assert cached[scheduler_name] == fresh[scheduler_name]
+
+    # 앱과 같은 방식: 스레드에서 낮은 우선순위 워커 프로세스로 예열
+    cache.clear()
+    completed = []
+    warmup = threading.Thread(target=warm_cache, args=([test], cache),
+                              kwargs={"max_workers": 2, "low_priority": True,
+                                      "on_complete": lambda *job: completed.append(job)})
+    warmup.start()
+    warmup.join()
+    assert len(completed) == len(test.schedulers)
+    assert warm_cache([test], cache, max_workers=1) == 0
+
+
+def test_replicate_report():
+    """유의한 차이가 있을 때만 승자, 아니면 tie"""
+    def runs(values):
+        return [{'avg_wait': v, 'starvation_pct': 0} for v in values]
+
+    report = generate_replicate_report({
+        'basic': runs([100, 102, 98, 101]),
+        'cfs': runs([50, 52, 49, 51]),
+    }, primary_metric='avg_wait')
+    assert report['winner'] == 'cfs'
+    assert report['comparisons']['cfs_vs_basic']['significant']
+    stats = report['statistics']['cfs']
+    assert stats['ci_lower'] < stats['mean'] < stats['ci_upper']
+
+    report = generate_replicate_report({
+        'basic': runs([100, 60, 80, 90]),
+        'cfs': runs([95, 70, 75, 85]),
+    }, primary_metric='avg_wait')
+    assert report['best'] == 'cfs'
+    assert report['winner'] == 'tie'
+
+
+def test_run_replicates():
+    """seed별 결과 == 해당 seed 단일 실행 결과"""
+    test = get_test_by_id("general_io")
+    seeds = [1, 2, 3]
+    result = run_replicates(test, seeds=seeds, max_ticks=3000, max_workers=2)
+
+    assert result.seeds == seeds
+    for scheduler_name in test.schedulers:
+        assert len(result.metrics[scheduler_name]) == len(seeds)
+    base_threads = generate_workload(test.workload_type, test.thread_count, seed=2)
+    single, _ = run_schedulers(test.schedulers, base_threads, 3000, parallel=False)
+    report = generate_comparison_report(single, primary_metric=test.primary_metric)
+    for scheduler_name in test.schedulers:
+        assert result.metrics[scheduler_name][1] == report['metrics'][scheduler_name]
+    assert result.report['winner'] in test.schedulers + ["tie"]
+
+    with pytest.raises(ValueError):
+        run_replicates(test, seeds=[42])
+
+
+if __name__ == "__main__":
+    test_parallel_matches_sequential()
+    test_parallel_from_thread()
+    test_workload_spec()
+    test_unknown_scheduler()
+    test_suite_matches_single_test()
+    test_converge(Path(tempfile.mkdtemp()))
+    test_result_cache(Path(tempfile.mkdtemp()))
+    test_cache_size_bound(Path(tempfile.mkdtemp()))
+    test_snapshot_key_location(Path(tempfile.mkdtemp()))
+    test_warm_cache(Path(tempfile.mkdtemp()))
+    test_replicate_report()
+    test_run_replicates()
+    print("모든 실행기 테스트 통과")
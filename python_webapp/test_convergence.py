@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+수렴 조기 종료 테스트
+
+1. 멈춘 결과 == 그 tick까지 실행한 결과, 추세가 있는 메트릭은 끝까지 실행
+2. 추적 메트릭 값 == calculate_scheduler_metrics의 같은 메트릭
+3. 확인 비용: 메트릭 하나만 계산 (전체 메트릭보다 싸고, 실행 시간의 작은 일부)
+"""
+
+import sys
+import os
+import time
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator
+from simulator.smp import SMPSimulator
+from analysis.convergence import ConvergenceCriterion, CONVERGENCE_METRICS
+from analysis.insights import calculate_metric, calculate_scheduler_metrics
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "start_time", "finish_time", "wait_time", "runnable_time", "context_switches",
+]
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_convergence_stop():
+    """수렴 조기 종료: 멈춘 결과 == run(max_ticks=stopped_at), 추세가 있는 메트릭은 끝까지 실행"""
+    for engine in ("tick", "event"):
+        for workload_type, scheduler_name in (("cpu_bound", "cfs"), ("cpu_bound", "mlfqs"),
+                                              ("extreme_nice", "cfs")):
+            criterion = ConvergenceCriterion("fairness", window=1500)
+            sim = Simulator(SCHEDULERS[scheduler_name](),
+                            generate_workload(workload_type, 20, seed=7), engine=engine)
+            df = sim.run(max_ticks=8000, stop=criterion, stop_ticks=200)
+            if workload_type == "extreme_nice":
+                # CFS의 공정성 지수가 계속 조금씩 오르므로 멈추지 않음
+                assert sim.stopped_at is None and criterion.converged_at is None
+                continue
+            assert sim.stopped_at is not None
+            assert sim.stopped_at == criterion.converged_at < 8000
+
+            threads = generate_workload(workload_type, 20, seed=7)
+            expected_df = Simulator(SCHEDULERS[scheduler_name](), threads,
+                                    engine=engine).run(max_ticks=sim.stopped_at)
+            assert _thread_state(threads) == _thread_state(sim.threads)
+            pd.testing.assert_frame_equal(expected_df, df)
+
+    # nice 그룹간 CPU 시간 비율은 계속 커지므로 멈추지 않음
+    sim = SMPSimulator(CFSScheduler, generate_workload("extreme_nice", 20, seed=7), num_cpus=2)
+    sim.run(max_ticks=3000, stop=ConvergenceCriterion("cpu_time_ratio"))
+    assert sim.stopped_at is None
+
+    with pytest.raises(ValueError):
+        ConvergenceCriterion("avg_wait")
+
+
+def test_tracked_metric_matches_full_metrics():
+    """calculate_metric(threads, m) == calculate_scheduler_metrics(threads)[m] (실행 중간 포함)"""
+    for workload_type in ("mixed", "io_bound", "extreme_nice", "cpu_bound"):
+        for scheduler_name in SCHEDULERS:
+            threads = generate_workload(workload_type, 50, seed=3)
+            sim = Simulator(SCHEDULERS[scheduler_name](), threads, engine="event")
+            for max_ticks in (0, 700, 2500):
+                sim.run(max_ticks=max_ticks)
+                metrics = calculate_scheduler_metrics(threads)
+                for metric in CONVERGENCE_METRICS:
+                    assert calculate_metric(threads, metric) == metrics.get(metric), \
+                        f"{workload_type}/{scheduler_name}/{max_ticks}: {metric}"
+    with pytest.raises(ValueError):
+        calculate_metric(threads, "avg_wait")
+
+
+def test_convergence_check_cost():
+    """확인 한 번 < 전체 메트릭 계산, 멈추지 않는 조건의 확인 비용 < 실행 시간의 10%"""
+    threads = generate_workload("mixed", 1000, seed=42)
+    Simulator(CFSScheduler(), threads, engine="event").run(max_ticks=3000)
+    full = min(timeit.repeat(lambda: calculate_scheduler_metrics(threads), number=20, repeat=5))
+    for metric in CONVERGENCE_METRICS:
+        criterion = ConvergenceCriterion(metric, tolerance=0)
+        check = min(timeit.repeat(lambda: criterion(threads, 10 ** 6), number=20, repeat=5))
+        assert check < full, metric
+
+    spent = []
+    criterion = ConvergenceCriterion("fairness", tolerance=0)
+
+    def stop(threads, tick):
+        start = time.perf_counter()
+        stopped = criterion(threads, tick)
+        spent.append(time.perf_counter() - start)
+        return stopped
+
+    sim = Simulator(CFSScheduler(), generate_workload("cpu_bound", 300, seed=42), engine="event")
+    start = time.perf_counter()
+    sim.run(max_ticks=3000, stop=stop, stop_ticks=250)
+    total = time.perf_counter() - start
+    assert sim.stopped_at is None and len(spent) == 3000 // 250 - 1
+    assert sum(spent) < 0.1 * total
+
+
+if __name__ == "__main__":
+    test_convergence_stop()
+    test_tracked_metric_matches_full_metrics()
+    test_convergence_check_cost()
+    print("모든 수렴 조기 종료 테스트 통과")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 히스토리 기록 테스트
+
+1. 컬럼형 기록기가 기존과 같은 DataFrame 형식을 반환
+2. 기록 수준(events/sampled/none)은 full 히스토리의 부분집합, 스레드 결과는 동일
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, scheduler_name, max_ticks=3000, **sim_kwargs):
+    """워크로드 1회 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(SCHEDULERS[scheduler_name](), threads, **sim_kwargs)
+    return threads, sim.run(max_ticks=max_ticks)
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_history_format():
+    """컬럼형 기록기도 기존과 같은 히스토리 형식을 반환"""
+    threads, df = _run("mixed", "cfs", max_ticks=200, engine="event")
+
+    assert list(df.columns) == [
+        'tick', 'tid', 'name', 'status', 'priority',
+        'nice', 'vruntime', 'remaining_time', 'wait_time',
+    ]
+    names = {t.tid: t.name for t in threads}
+    assert (df['name'] == df['tid'].map(names)).all()
+    assert set(df['status']) <= {'RUNNING', 'READY', 'BLOCKED', 'TERMINATED'}
+    # CFS는 priority를 쓰지 않음
+    assert df['priority'].isna().all()
+
+    _, df = _run("mixed", "basic", max_ticks=200)
+    assert df['priority'].notna().all()
+
+
+def test_history_levels():
+    """events/sampled/none 수준은 full 히스토리의 부분집합"""
+    for engine in ("tick", "event"):
+        full_threads, full = _run("io_bound", "mlfqs", engine=engine, history="full")
+
+        # events: 직전 기록과 상태가 달라진 행만
+        _, events = _run("io_bound", "mlfqs", engine=engine, history="events")
+        changed = full['status'] != full.groupby('tid')['status'].shift()
+        pd.testing.assert_frame_equal(events, full[changed].reset_index(drop=True))
+
+        # sampled: history_interval tick마다
+        _, sampled = _run("io_bound", "mlfqs", engine=engine,
+                          history="sampled", history_interval=50)
+        expected = full[full['tick'] % 50 == 0].reset_index(drop=True)
+        pd.testing.assert_frame_equal(sampled, expected)
+
+        # none: 기록 없음, 스레드 결과는 동일
+        none_threads, none = _run("io_bound", "mlfqs", engine=engine, history="none")
+        assert none.empty
+        assert _thread_state(none_threads) == _thread_state(full_threads)
+
+
+def test_unknown_history_level():
+    """알 수 없는 기록 수준은 ValueError"""
+    with pytest.raises(ValueError):
+        Simulator(CFSScheduler(), [], history="verbose")
+
+
+if __name__ == "__main__":
+    test_history_format()
+    test_history_levels()
+    test_unknown_history_level()
+    print("모든 히스토리 테스트 통과")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+MLFQS 스케줄러 최적화 테스트
+
+1. 증분 우선순위 재계산 == 4 tick마다 전체 재계산, 재계산 대상은 recent_cpu가 바뀐 스레드뿐
+2. 큐 비트맵 == 실제 비어 있지 않은 큐
+3. 실행 가능 스레드 수 == all_threads 상태 스캔 (단일 CPU, SMP, 스냅샷 복원)
+4. 배열 연산 MLFQS == MLFQSScheduler, 배열 값 == Thread 필드
+"""
+
+import sys
+import os
+from functools import partial
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from scheduler.mlfqs import MLFQSScheduler, TIMER_FREQ
+from scheduler.mlfqs_vectorized import VectorizedMLFQSScheduler
+from simulator.simulator import Simulator
+from simulator.smp import SMPSimulator
+from workload.generator import generate_workload
+
+WORKLOADS = ["mixed", "io_bound", "web_server", "batch", "extreme_nice_fairness"]
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, max_ticks=3000, **sim_kwargs):
+    """워크로드 1회 MLFQS 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(MLFQSScheduler(), threads, **sim_kwargs)
+    return threads, sim.run(max_ticks=max_ticks)
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_mlfqs_incremental_matches_full():
+    """MLFQS 증분 재계산 == 4 tick마다 전체 재계산 (큐 순서까지 같아 결과 동일, SMP 공유 큐 포함)"""
+    for workload_type in WORKLOADS:
+        for engine in ("tick", "event"):
+            threads, df = _run(workload_type, engine=engine)
+            full_threads = generate_workload(workload_type, 20, seed=7)
+            full_df = Simulator(MLFQSScheduler(incremental=False), full_threads,
+                                engine=engine).run(max_ticks=3000)
+            assert _thread_state(threads) == _thread_state(full_threads), \
+                f"{workload_type}/{engine}"
+            pd.testing.assert_frame_equal(df, full_df)
+
+        results = []
+        for incremental in (True, False):
+            smp_threads = generate_workload(workload_type, 20, seed=7)
+            smp = SMPSimulator(partial(MLFQSScheduler, incremental=incremental), smp_threads,
+                               num_cpus=3, shared_queue=True, history="full")
+            results.append((_thread_state(smp_threads), smp.run(max_ticks=3000)))
+        assert results[0][0] == results[1][0], f"{workload_type}/smp"
+        pd.testing.assert_frame_equal(results[0][1], results[1][1])
+
+
+def test_mlfqs_incremental_recalculates_changed_only():
+    """recent_cpu 감쇠 사이의 재계산은 실행한 스레드만 (전체 재계산은 모든 스레드)"""
+    calls = {}
+    for incremental in (True, False):
+        class Counting(MLFQSScheduler):
+            def calculate_priority(self, thread):
+                calls[incremental] = calls.get(incremental, 0) + 1
+                super().calculate_priority(thread)
+
+        scheduler = Counting(incremental=incremental)
+        threads = generate_workload("cpu_bound", 50, seed=7)
+        for thread in threads:
+            scheduler.add_thread(thread)
+        running = scheduler.pick_next()
+        calls[incremental] = 0
+        for tick in range(1, TIMER_FREQ):
+            scheduler.tick(tick, running)
+
+    recalculations = (TIMER_FREQ - 1) // 4
+    assert calls[True] == recalculations
+    assert calls[False] == recalculations * len(threads)
+
+
+def test_mlfqs_occupancy_bitmap():
+    """MLFQS 큐 비트맵 == 실제 비어 있지 않은 큐 (매 tick 확인)"""
+    for workload_type in WORKLOADS:
+        scheduler = MLFQSScheduler()
+        sim = Simulator(scheduler, generate_workload(workload_type, 20, seed=7), engine="event")
+        checked = []
+
+        def check(tick, total):
+            levels = [pri for pri in range(63, -1, -1) if scheduler.ready_queues[pri]]
+            assert scheduler.occupied_levels() == levels, f"{workload_type}: tick {tick}"
+            assert scheduler.occupancy == sum(1 << pri for pri in levels)
+            assert scheduler.occupied_count == len(levels)
+            checked.append(bool(levels))
+
+        sim.run(max_ticks=3000, progress=check, progress_ticks=1)
+        assert any(checked)
+
+
+def test_mlfqs_runnable_count():
+    """MLFQS 실행 가능 스레드 수 == all_threads 상태 스캔 (매 tick, SMP CPU별 큐/공유 큐 포함)"""
+    def scan(scheduler):
+        return sum(1 for t in scheduler.all_threads
+                   if t.status.name not in ("BLOCKED", "TERMINATED"))
+
+    for workload_type in WORKLOADS:
+        sim = Simulator(MLFQSScheduler(), generate_workload(workload_type, 20, seed=7),
+                        engine="event")
+        counts = []
+
+        def check(tick, total):
+            assert sim.scheduler.nr_runnable == scan(sim.scheduler), f"{workload_type}: {tick}"
+            counts.append(sim.scheduler.nr_runnable)
+
+        sim.run(max_ticks=1500, progress=check, progress_ticks=1)
+        restored = Simulator.restore(sim.snapshot())
+        assert restored.scheduler.nr_runnable == sim.scheduler.nr_runnable
+        assert max(counts) > 0
+
+        for shared_queue in (False, True):
+            smp = SMPSimulator(MLFQSScheduler, generate_workload(workload_type, 20, seed=7),
+                               num_cpus=3, shared_queue=shared_queue)
+
+            def check_smp(tick, total):
+                for scheduler in smp.schedulers:
+                    assert scheduler.nr_runnable == scan(scheduler), f"{workload_type}: {tick}"
+
+            smp.run(max_ticks=1500, progress=check_smp, progress_ticks=1)
+
+
+def test_vectorized_mlfqs_matches_mlfqs():
+    """배열 연산 MLFQS == MLFQSScheduler (엔진, 전체/증분 재계산, SMP 공유 큐, 스냅샷 이어서 실행)"""
+    for workload_type in WORKLOADS:
+        for engine in ("tick", "event"):
+            for incremental in (True, False):
+                threads, df = _run(workload_type, engine=engine)
+                vector_threads = generate_workload(workload_type, 20, seed=7)
+                vector_df = Simulator(VectorizedMLFQSScheduler(incremental=incremental),
+                                      vector_threads, engine=engine).run(max_ticks=3000)
+                assert _thread_state(threads) == _thread_state(vector_threads), \
+                    f"{workload_type}/{engine}/incremental={incremental}"
+                pd.testing.assert_frame_equal(df, vector_df)
+
+        results = []
+        for scheduler_class in (MLFQSScheduler, VectorizedMLFQSScheduler):
+            smp_threads = generate_workload(workload_type, 20, seed=7)
+            smp = SMPSimulator(scheduler_class, smp_threads, num_cpus=3,
+                               shared_queue=True, history="full")
+            results.append((_thread_state(smp_threads), smp.run(max_ticks=3000)))
+        assert results[0][0] == results[1][0], f"{workload_type}/smp"
+        pd.testing.assert_frame_equal(results[0][1], results[1][1])
+
+    # 많은 스레드 (배열 확장) + 스냅샷에서 이어서 실행
+    threads = generate_workload("cpu_bound", 300, seed=7)
+    Simulator(MLFQSScheduler(), threads, engine="event", history="none").run(max_ticks=5000)
+    sim = Simulator(VectorizedMLFQSScheduler(), generate_workload("cpu_bound", 300, seed=7),
+                    engine="event", history="none")
+    sim.run(max_ticks=2345)
+    resumed = Simulator.restore(sim.snapshot())
+    resumed.run(max_ticks=5000)
+    assert _thread_state(threads) == _thread_state(resumed.threads)
+
+    # 배열은 살아 있는 스레드의 Thread 필드와 같은 값을 유지
+    scheduler = resumed.scheduler
+    for thread in scheduler._threads:
+        slot = scheduler._slot.get(id(thread))
+        if slot is not None:
+            assert scheduler._recent_cpu[slot] == thread.recent_cpu
+            assert scheduler._priority[slot] == thread.priority
+
+
+if __name__ == "__main__":
+    test_mlfqs_incremental_matches_full()
+    test_mlfqs_incremental_recalculates_changed_only()
+    test_mlfqs_occupancy_bitmap()
+    test_mlfqs_runnable_count()
+    test_vectorized_mlfqs_matches_mlfqs()
+    print("모든 MLFQS 테스트 통과")
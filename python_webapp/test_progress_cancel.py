@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+진행 콜백/취소 테스트
+
+1. 진행 콜백/취소 확인 지점이 있어도 결과 동일
+2. 취소 토큰이 설정되면 다음 확인 지점에서 SimulationCancelled
+3. 잘못된 확인 간격은 ValueError
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator, SimulationCancelled
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, scheduler_name, max_ticks=3000, run_kwargs=None, **sim_kwargs):
+    """워크로드 1회 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(SCHEDULERS[scheduler_name](), threads, **sim_kwargs)
+    df = sim.run(max_ticks=max_ticks, **(run_kwargs or {}))
+    return threads, df
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_progress_and_cancel():
+    """진행 콜백/취소 확인 지점이 있어도 결과 동일, 취소 토큰이 설정되면 중단"""
+    for engine in ("tick", "event"):
+        for scheduler_name in SCHEDULERS:
+            threads, df = _run("io_bound", scheduler_name, engine=engine)
+            calls = []
+            checked_threads, checked_df = _run(
+                "io_bound", scheduler_name, engine=engine,
+                run_kwargs=dict(progress=lambda tick, total: calls.append((tick, total)),
+                                progress_ticks=37),
+            )
+            assert _thread_state(threads) == _thread_state(checked_threads)
+            pd.testing.assert_frame_equal(df, checked_df)
+            assert calls[0] == (37, 3000) and calls[-1] == (3000, 3000)
+
+    cancel = threading.Event()
+
+    def progress(tick, total):
+        if tick >= 500:
+            cancel.set()
+
+    sim = Simulator(CFSScheduler(), generate_workload("extreme_nice", 20, seed=7), engine="event")
+    with pytest.raises(SimulationCancelled) as info:
+        sim.run(max_ticks=100000, progress=progress, cancel=cancel, progress_ticks=100)
+    assert info.value.tick == 600
+
+
+def test_bad_progress_ticks():
+    """확인 간격이 1 미만이면 ValueError"""
+    with pytest.raises(ValueError):
+        Simulator(CFSScheduler(), generate_workload("mixed", 5, seed=7)).run(
+            max_ticks=100, progress_ticks=0)
+
+
+if __name__ == "__main__":
+    test_progress_and_cancel()
+    test_bad_progress_ticks()
+    print("모든 진행/취소 테스트 통과")
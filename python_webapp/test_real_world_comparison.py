@@ -13,12 +13,12 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from copy import deepcopy
 import numpy as np
 from scheduler.mlfqs import MLFQSScheduler
 from scheduler.cfs import CFSScheduler
 from simulator.simulator import Simulator
 from workload.generator import generate_mixed, generate_extreme_nice
+from workload.spec import WorkloadSpec
 from scheduler.thread import Thread, ThreadStatus
 
 
@@ -34,13 +34,13 @@ def test_response_time_consistency():
     print("=" * 70)
     print("좋은 스케줄러 = 표준편차가 작음 (예측 가능)")
 
-    threads_base = generate_mixed(100, seed=42)
+    workload = WorkloadSpec.from_threads(generate_mixed(100, seed=42))
     max_ticks = 50000
 
     for name, SchedulerClass in [("MLFQS", MLFQSScheduler), ("CFS", CFSScheduler)]:
-        threads = deepcopy(threads_base)
+        threads = workload.instantiate()
         scheduler = SchedulerClass()
-        sim = Simulator(scheduler, threads)
+        sim = Simulator(scheduler, threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         wait_times = [t.wait_time for t in threads]
@@ -67,13 +67,13 @@ def test_starvation_resistance():
     print("=" * 70)
     print("좋은 스케줄러 = 모든 스레드가 어느 정도 실행됨")
 
-    threads_base = generate_extreme_nice(50, seed=42)
+    workload = WorkloadSpec.from_threads(generate_extreme_nice(50, seed=42))
     max_ticks = 50000
 
     for name, SchedulerClass in [("MLFQS", MLFQSScheduler), ("CFS", CFSScheduler)]:
-        threads = deepcopy(threads_base)
+        threads = workload.instantiate()
         scheduler = SchedulerClass()
-        sim = Simulator(scheduler, threads)
+        sim = Simulator(scheduler, threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         nice_19_threads = [t for t in threads if t.nice == 19]
@@ -104,7 +104,7 @@ def test_long_term_fairness():
     print("=" * 70)
     print("좋은 스케줄러 = 시간이 지나면 공정성이 1.0에 수렴")
 
-    threads_base = generate_mixed(30, seed=42)
+    workload = WorkloadSpec.from_threads(generate_mixed(30, seed=42))
 
     checkpoints = [5000, 10000, 20000, 50000, 100000]
 
@@ -112,9 +112,9 @@ def test_long_term_fairness():
         print(f"\n[{name}]")
 
         for max_ticks in checkpoints:
-            threads = deepcopy(threads_base)
+            threads = workload.instantiate()
             scheduler = SchedulerClass()
-            sim = Simulator(scheduler, threads)
+            sim = Simulator(scheduler, threads, engine="event", history="none")
             sim.run(max_ticks=max_ticks)
 
             # Jain's Index 계산
@@ -167,12 +167,13 @@ def test_burst_arrival():
         )
         new_threads.append(t)
 
+    workload = WorkloadSpec.from_threads(existing_threads + new_threads)
     max_ticks = 10000
 
     for name, SchedulerClass in [("MLFQS", MLFQSScheduler), ("CFS", CFSScheduler)]:
-        threads = deepcopy(existing_threads + new_threads)
+        threads = workload.instantiate()
         scheduler = SchedulerClass()
-        sim = Simulator(scheduler, threads)
+        sim = Simulator(scheduler, threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         # 기존 스레드의 CPU 시간 (1000 tick 이전 vs 이후)
@@ -235,12 +236,13 @@ def test_interactive_responsiveness():
         )
         threads.append(t)
 
+    workload = WorkloadSpec.from_threads(threads)
     max_ticks = 50000
 
     for name, SchedulerClass in [("MLFQS", MLFQSScheduler), ("CFS", CFSScheduler)]:
-        test_threads = deepcopy(threads)
+        test_threads = workload.instantiate()
         scheduler = SchedulerClass()
-        sim = Simulator(scheduler, test_threads)
+        sim = Simulator(scheduler, test_threads, engine="event", history="none")
         sim.run(max_ticks=max_ticks)
 
         interactive = [t for t in test_threads if t.tid > 100]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+시뮬레이터 엔진 동등성 테스트
+
+Event 엔진은 tick 엔진과 완전히 같은 결과를 내야 함:
+1. 스레드 최종 상태 (대기/반환/응답 시간, vruntime, recent_cpu 등)
+2. 컨텍스트 스위치 수
+3. 시뮬레이션 히스토리
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+WORKLOADS = ["mixed", "io_bound", "web_server", "batch", "extreme_nice_fairness"]
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, scheduler_name, max_ticks=3000, **sim_kwargs):
+    """워크로드 1회 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(SCHEDULERS[scheduler_name](), threads, **sim_kwargs)
+    return threads, sim.run(max_ticks=max_ticks)
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_event_engine_matches_tick_engine():
+    """Event 엔진 결과 == tick 엔진 결과"""
+    for workload_type in WORKLOADS:
+        for scheduler_name in SCHEDULERS:
+            tick_threads, tick_df = _run(workload_type, scheduler_name, engine="tick")
+            event_threads, event_df = _run(workload_type, scheduler_name, engine="event")
+
+            assert _thread_state(tick_threads) == _thread_state(event_threads), \
+                f"{workload_type}/{scheduler_name}: 스레드 상태 불일치"
+            pd.testing.assert_frame_equal(tick_df, event_df)
+
+
+def test_event_engine_respects_max_ticks():
+    """이벤트가 max_ticks 이후에 있어도 정확히 max_ticks에서 멈춤"""
+    for max_ticks in (1, 37, 500):
+        tick_threads, tick_df = _run("extreme_nice", "cfs", max_ticks=max_ticks, engine="tick")
+        event_threads, event_df = _run("extreme_nice", "cfs", max_ticks=max_ticks, engine="event")
+
+        assert _thread_state(tick_threads) == _thread_state(event_threads)
+        pd.testing.assert_frame_equal(tick_df, event_df)
+
+
+def _scheduler_with_running(scheduler_name):
+    """스레드를 추가하고 하나를 실행 상태로 만든 스케줄러"""
+    scheduler = SCHEDULERS[scheduler_name]()
+    threads = generate_workload("mixed", 10, seed=3)
+    for thread in threads:
+        scheduler.add_thread(thread)
+    return scheduler, threads, scheduler.pick_next()
+
+
+def test_tick_many_matches_tick():
+    """tick_many(start, n) == tick()을 n번 호출"""
+    for scheduler_name in SCHEDULERS:
+        for start, n in [(0, 1), (1, 3), (97, 10), (250, 333)]:
+            one, one_threads, one_running = _scheduler_with_running(scheduler_name)
+            many, many_threads, many_running = _scheduler_with_running(scheduler_name)
+
+            for tick in range(start, start + n):
+                one.tick(tick, one_running)
+            many.tick_many(start, n, many_running)
+
+            assert _thread_state(one_threads) == _thread_state(many_threads), \
+                f"{scheduler_name}: start={start}, n={n}"
+            assert getattr(one, 'load_avg', None) == getattr(many, 'load_avg', None)
+            assert getattr(one, 'min_vruntime', None) == getattr(many, 'min_vruntime', None)
+
+
+def test_unknown_engine():
+    """알 수 없는 엔진은 ValueError"""
+    with pytest.raises(ValueError):
+        Simulator(CFSScheduler(), [], engine="warp")
+
+
+if __name__ == "__main__":
+    test_event_engine_matches_tick_engine()
+    test_event_engine_respects_max_ticks()
+    test_tick_many_matches_tick()
+    test_unknown_engine()
+    print("모든 엔진 동등성 테스트 통과")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+멀티코어 SMP 시뮬레이터 테스트
+
+1. CPU 1개 SMP == 단일 CPU Simulator (CPU별 큐/공유 큐)
+2. CPU 수에 따른 완료 시간, CPU별 통계 합계
+3. 공유 큐 MLFQS: 모든 실행 스레드가 tick 작업 전에 반영됨
+4. idle steal: 큐가 빈 CPU가 다른 CPU의 대기 스레드를 가져옴 (MLFQS recent_cpu 유지)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler, TIMER_FREQ, LOAD_AVG_DECAY, LOAD_AVG_READY
+from scheduler.mlfqs_vectorized import VectorizedMLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from scheduler.fixed_point import FP
+from scheduler.thread import Thread, ThreadStatus
+from simulator.simulator import Simulator
+from simulator.smp import SMPSimulator
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+WORKLOADS = ["mixed", "io_bound", "web_server", "batch", "extreme_nice_fairness"]
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, scheduler_name, max_ticks=3000, **sim_kwargs):
+    """워크로드 1회 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(SCHEDULERS[scheduler_name](), threads, **sim_kwargs)
+    return threads, sim.run(max_ticks=max_ticks)
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_smp_single_cpu_matches_simulator():
+    """CPU 1개 SMP 시뮬레이터 == 단일 CPU 시뮬레이터 (CPU별 큐/공유 큐 모두)"""
+    for workload_type in WORKLOADS:
+        for scheduler_name, scheduler_class in SCHEDULERS.items():
+            threads, df = _run(workload_type, scheduler_name)
+            for shared_queue in (False, True):
+                smp_threads = generate_workload(workload_type, 20, seed=7)
+                smp = SMPSimulator(scheduler_class, smp_threads, num_cpus=1,
+                                   shared_queue=shared_queue, history="full")
+                smp_df = smp.run(max_ticks=3000)
+
+                assert _thread_state(threads) == _thread_state(smp_threads), \
+                    f"{workload_type}/{scheduler_name}/shared={shared_queue}"
+                pd.testing.assert_frame_equal(df, smp_df)
+
+
+def test_smp_multi_cpu():
+    """CPU가 늘면 같은 작업을 더 빨리 끝내고, CPU별 통계가 합계와 일치"""
+    finish = {}
+    for num_cpus in (1, 4, 16):
+        for shared_queue in (False, True):
+            threads = generate_workload("mixed", 50, seed=42)
+            smp = SMPSimulator(CFSScheduler, threads, num_cpus=num_cpus,
+                               shared_queue=shared_queue)
+            smp.run(max_ticks=50000)
+
+            assert all(t.status.name == "TERMINATED" for t in threads)
+            assert sum(smp.cpu_busy_ticks) == sum(t.burst_time for t in threads)
+            assert sum(smp.cpu_context_switches) == threads[0].context_switches
+            finish[(num_cpus, shared_queue)] = max(t.finish_time for t in threads)
+
+    for shared_queue in (False, True):
+        assert finish[(1, shared_queue)] > finish[(4, shared_queue)] > finish[(16, shared_queue)]
+
+
+def _cpu_bound(tid: int, burst: int) -> Thread:
+    """I/O 없는 nice 0 스레드 (tick 0 도착)"""
+    return Thread(tid=tid, name=f"T{tid}", arrival_time=0, burst_time=burst,
+                  remaining_time=burst, nice=0, status=ThreadStatus.READY)
+
+
+def test_smp_shared_queue_mlfqs_accounting():
+    """CPU 2개 공유 큐 MLFQS: 모든 실행 스레드가 매 tick recent_cpu/load_avg에 반영됨"""
+    threads = [_cpu_bound(1, 5000), _cpu_bound(2, 5000)]
+    smp = SMPSimulator(MLFQSScheduler, threads, num_cpus=2, shared_queue=True)
+    scheduler = smp.schedulers[0]
+
+    before_decay = []
+
+    def check(tick, total):
+        if tick > 0:
+            # 두 스레드 모두 실행 중이고 실행 가능 수에 포함
+            assert all(cpu.running is not None for cpu in smp.cpus), tick
+            assert scheduler.nr_runnable == 2, tick
+        if tick == TIMER_FREQ:
+            before_decay.extend(t.recent_cpu for t in threads)
+
+    # tick 0: 도착 직후 감쇠 (실행 중 스레드 없음), tick 1~99: 두 CPU 모두 실행,
+    # tick 100: 두 스레드 모두 +1 한 뒤 감쇠 (CPU 순서와 무관하게 같은 값)
+    smp.run(max_ticks=TIMER_FREQ + 1, progress=check, progress_ticks=1)
+    assert before_decay == [FP.int_to_fp(TIMER_FREQ - 1)] * 2
+
+    load_avg = FP.fp_mul_int(LOAD_AVG_READY, 2)
+    load_avg = FP.fp_add(FP.fp_mul(LOAD_AVG_DECAY, load_avg), FP.fp_mul_int(LOAD_AVG_READY, 3))
+    assert scheduler.load_avg == load_avg
+    expected = FP.fp_add_int(FP.fp_mul(scheduler.recent_cpu_coef(), FP.int_to_fp(TIMER_FREQ)), 0)
+    assert [t.recent_cpu for t in threads] == [expected] * 2
+    assert threads[0].priority == threads[1].priority
+
+
+def test_smp_idle_steal():
+    """CPU별 큐: 큐가 빈 CPU가 다른 CPU의 대기 스레드를 가져와 더 빨리 끝냄"""
+    finish = {}
+    for idle_steal in (False, True):
+        for scheduler_class in SCHEDULERS.values():
+            # 배치: T1 → CPU0, T2 → CPU1, T3 → CPU0 (T2가 끝나면 CPU1이 빔)
+            threads = [_cpu_bound(1, 400), _cpu_bound(2, 20), _cpu_bound(3, 400)]
+            smp = SMPSimulator(scheduler_class, threads, num_cpus=2, idle_steal=idle_steal)
+            smp.run(max_ticks=5000)
+
+            assert all(t.status.name == "TERMINATED" for t in threads)
+            assert sum(smp.cpu_busy_ticks) == sum(t.burst_time for t in threads)
+            assert (smp.migrations > 0) == idle_steal
+            finish[(scheduler_class, idle_steal)] = max(t.finish_time for t in threads)
+
+    for scheduler_class in SCHEDULERS.values():
+        assert finish[(scheduler_class, True)] < finish[(scheduler_class, False)]
+
+
+def test_mlfqs_migrated_recent_cpu():
+    """새로 추가한 스레드는 recent_cpu 0부터, idle steal로 옮겨 온 스레드만 이전 값 유지"""
+    for scheduler_class in (MLFQSScheduler, VectorizedMLFQSScheduler):
+        stale, migrated = _cpu_bound(1, 100), _cpu_bound(2, 100)
+        stale.recent_cpu = migrated.recent_cpu = FP.int_to_fp(40)
+        scheduler = scheduler_class()
+        scheduler.add_thread(stale)
+        scheduler.add_migrated_thread(migrated)
+        assert stale.recent_cpu == 0 and migrated.recent_cpu == FP.int_to_fp(40)
+        assert migrated.priority < stale.priority
+        scheduler.tick(TIMER_FREQ, None)
+        assert migrated.recent_cpu > stale.recent_cpu
+
+        carried = []
+
+        class Recording(scheduler_class):
+            def add_migrated_thread(self, thread):
+                before = thread.recent_cpu
+                super().add_migrated_thread(thread)
+                carried.append((before, thread.recent_cpu))
+
+        threads = [_cpu_bound(1, 400), _cpu_bound(2, 20), _cpu_bound(3, 400)]
+        SMPSimulator(Recording, threads, num_cpus=2).run(max_ticks=5000)
+        assert carried and all(before == after > 0 for before, after in carried)
+
+
+def test_unknown_cpu_count():
+    """CPU 수가 1 미만이면 ValueError"""
+    with pytest.raises(ValueError):
+        SMPSimulator(CFSScheduler, [], num_cpus=0)
+
+
+if __name__ == "__main__":
+    test_smp_single_cpu_matches_simulator()
+    test_smp_multi_cpu()
+    test_smp_shared_queue_mlfqs_accounting()
+    test_smp_idle_steal()
+    test_mlfqs_migrated_recent_cpu()
+    test_unknown_cpu_count()
+    print("모든 SMP 테스트 통과")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+시뮬레이터 스냅샷/복원 테스트
+
+1. run(T) → snapshot → restore → run(T') == 처음부터 run(T')
+2. 히스토리 없이 저장한 스냅샷 + 이전 히스토리 다시 채우기 == 전체 히스토리
+3. 취소 후 이어서 실행도 동일, 잘못된 스냅샷은 ValueError
+"""
+
+import sys
+import os
+import pickle
+import threading
+import zlib
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from simulator.simulator import Simulator, SimulationCancelled
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+THREAD_FIELDS = [
+    "status", "priority", "recent_cpu", "vruntime", "remaining_time",
+    "io_remaining", "cpu_since_io", "start_time", "finish_time",
+    "wait_time", "runnable_time", "last_scheduled", "context_switches",
+]
+
+
+def _run(workload_type, scheduler_name, max_ticks=3000, **sim_kwargs):
+    """워크로드 1회 시뮬레이션"""
+    threads = generate_workload(workload_type, 20, seed=7)
+    sim = Simulator(SCHEDULERS[scheduler_name](), threads, **sim_kwargs)
+    return threads, sim.run(max_ticks=max_ticks)
+
+
+def _thread_state(threads):
+    return [tuple(getattr(t, f) for f in THREAD_FIELDS) for t in threads]
+
+
+def test_snapshot_resume():
+    """run(T) → snapshot → restore → run(T') == 처음부터 run(T'), 취소 후 이어서 실행도 동일"""
+    for workload_type in ("mixed", "io_bound", "web_server"):
+        for scheduler_name in SCHEDULERS:
+            for engine in ("tick", "event"):
+                threads, df = _run(workload_type, scheduler_name, engine=engine)
+
+                sim = Simulator(SCHEDULERS[scheduler_name](),
+                                generate_workload(workload_type, 20, seed=7), engine=engine)
+                sim.run(max_ticks=1234)
+                resumed = Simulator.restore(sim.snapshot())
+                resumed_df = resumed.run(max_ticks=3000)
+
+                assert _thread_state(threads) == _thread_state(resumed.threads), \
+                    f"{workload_type}/{scheduler_name}/{engine}: 스레드 상태 불일치"
+                pd.testing.assert_frame_equal(df, resumed_df)
+
+    # 히스토리 없이 저장한 스냅샷 + 이전 히스토리 다시 채우기 (기록 수준별)
+    for history in ("events", "sampled", "full"):
+        for scheduler_name in SCHEDULERS:
+            workload = generate_workload("mixed", 20, seed=7)
+            full_df = Simulator(SCHEDULERS[scheduler_name](), workload, engine="event",
+                                history=history).run(max_ticks=3000)
+            sim = Simulator(SCHEDULERS[scheduler_name](), generate_workload("mixed", 20, seed=7),
+                            engine="event", history=history)
+            prior_df = sim.run(max_ticks=1234)
+            resumed = Simulator.restore(sim.snapshot(with_history=False))
+            assert len(resumed.recorder) == 0
+            resumed.recorder.load_dataframe(prior_df)
+            pd.testing.assert_frame_equal(full_df, resumed.run(max_ticks=3000))
+
+    threads, df = _run("extreme_nice", "cfs", engine="event")
+    cancel = threading.Event()
+    cancel.set()
+    sim = Simulator(CFSScheduler(), generate_workload("extreme_nice", 20, seed=7), engine="event")
+    sim.run(max_ticks=700)
+    with pytest.raises(SimulationCancelled):
+        sim.run(max_ticks=3000, cancel=cancel, progress_ticks=100)
+    pd.testing.assert_frame_equal(df, sim.run(max_ticks=3000))
+    assert _thread_state(threads) == _thread_state(sim.threads)
+
+    with pytest.raises(ValueError):
+        Simulator.restore(zlib.compress(pickle.dumps([])))
+
+
+if __name__ == "__main__":
+    test_snapshot_resume()
+    print("모든 스냅샷 테스트 통과")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ThreadTable (struct-of-arrays) 테스트
+
+1. 테이블 위 시뮬레이션/메트릭 == Thread 리스트
+2. Thread 리스트 메트릭은 필요한 열만 읽음 (테이블 전체 변환보다 빠름)
+"""
+
+import sys
+import os
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from scheduler.basic_priority import BasicPriorityScheduler
+from scheduler.mlfqs import MLFQSScheduler
+from scheduler.cfs import CFSScheduler
+from scheduler.thread_table import ThreadTable, TABLE_FIELDS, thread_columns
+from simulator.simulator import Simulator
+from analysis.insights import calculate_scheduler_metrics, METRIC_FIELDS
+from workload.generator import generate_workload
+
+SCHEDULERS = {
+    "basic": BasicPriorityScheduler,
+    "mlfqs": MLFQSScheduler,
+    "cfs": CFSScheduler,
+}
+
+
+class CountingThread:
+    """속성 읽기 횟수를 세는 Thread 래퍼"""
+
+    def __init__(self, thread, reads):
+        object.__setattr__(self, '_thread', thread)
+        object.__setattr__(self, '_reads', reads)
+
+    def __getattr__(self, name):
+        self._reads[name] = self._reads.get(name, 0) + 1
+        return getattr(self._thread, name)
+
+
+def test_thread_table_matches_threads():
+    """ThreadTable 위 시뮬레이션/메트릭 == Thread 리스트, 테이블 왕복"""
+    for workload_type in ("mixed", "io_bound", "extreme_nice_fairness"):
+        for scheduler_name in SCHEDULERS:
+            threads = generate_workload(workload_type, 20, seed=7)
+            df = Simulator(SCHEDULERS[scheduler_name](), threads).run(max_ticks=2000)
+            table = ThreadTable.from_threads(generate_workload(workload_type, 20, seed=7))
+            table_df = Simulator(SCHEDULERS[scheduler_name](), table).run(max_ticks=2000)
+
+            state = lambda ts: [tuple(getattr(t, f) for f in TABLE_FIELDS) for t in ts]
+            assert state(threads) == state(table.to_threads()), \
+                f"{workload_type}/{scheduler_name}: 스레드 상태 불일치"
+            pd.testing.assert_frame_equal(df, table_df)
+            assert calculate_scheduler_metrics(threads) == calculate_scheduler_metrics(table)
+            assert state(ThreadTable.from_threads(threads).to_threads()) == state(threads)
+
+
+def test_metrics_read_only_needed_fields():
+    """Thread 리스트 메트릭: 스레드마다 METRIC_FIELDS만 한 번씩 읽음, 전체 변환보다 빠름"""
+    threads = generate_workload("mixed", 1000, seed=42)
+    Simulator(CFSScheduler(), threads, engine="event").run(max_ticks=5000)
+
+    reads = {}
+    counted = [CountingThread(t, reads) for t in threads]
+    assert calculate_scheduler_metrics(counted) == calculate_scheduler_metrics(threads)
+    assert set(reads) == set(METRIC_FIELDS) | {'context_switches'}
+    assert all(reads[name] == len(threads) for name in METRIC_FIELDS)
+    assert reads['context_switches'] == 1
+
+    columns = thread_columns(threads, ('wait_time', 'priority'))
+    assert columns['wait_time'].tolist() == [t.wait_time for t in threads]
+
+    # 필요한 열만 읽는 경로 < 테이블 전체 변환 후 계산
+    list_path = min(timeit.repeat(lambda: calculate_scheduler_metrics(threads),
+                                  number=20, repeat=5))
+    table_path = min(timeit.repeat(
+        lambda: calculate_scheduler_metrics(ThreadTable.from_threads(threads)),
+        number=20, repeat=5))
+    assert list_path < table_path
+
+
+if __name__ == "__main__":
+    test_thread_table_matches_threads()
+    test_metrics_read_only_needed_fields()
+    print("모든 ThreadTable 테스트 통과")
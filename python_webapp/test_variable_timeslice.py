@@ -13,12 +13,12 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from copy import deepcopy
 from typing import List, Optional, Any
 import pandas as pd
 from scheduler.cfs import CFSScheduler, PRIO_TO_WEIGHT
 from scheduler.thread import Thread, ThreadStatus
 from workload.generator import generate_extreme_nice, generate_cpu_bound, generate_mixed
+from workload.spec import WorkloadSpec
 
 # ============================================================
 # 가변 Time Slice를 지원하는 시뮬레이터
@@ -230,14 +230,14 @@ def compare_nice_effect():
     theoretical_ratio = weight_minus20 / weight_19
     print(f"\n이론적 CPU 비율: {theoretical_ratio:.1f}:1")
 
-    threads_base = generate_extreme_nice(50, seed=42)
+    workload = WorkloadSpec.from_threads(generate_extreme_nice(50, seed=42))
     max_ticks = 100000
 
     results = {}
 
     for name, SimClass in [("고정 Time Slice (4 tick)", FixedSliceSimulator),
                             ("가변 Time Slice", VariableSliceSimulator)]:
-        threads = deepcopy(threads_base)
+        threads = workload.instantiate()
         scheduler = CFSScheduler()
         sim = SimClass(scheduler, threads)
         sim.run(max_ticks=max_ticks)
@@ -279,12 +279,12 @@ def compare_fairness():
     print("공정성 테스트: CPU-bound 50 스레드 (Nice 0)")
     print("=" * 70)
 
-    threads_base = generate_cpu_bound(50, seed=42)
+    workload = WorkloadSpec.from_threads(generate_cpu_bound(50, seed=42))
     max_ticks = 30000
 
     for name, SimClass in [("고정 Time Slice", FixedSliceSimulator),
                             ("가변 Time Slice", VariableSliceSimulator)]:
-        threads = deepcopy(threads_base)
+        threads = workload.instantiate()
         scheduler = CFSScheduler()
         sim = SimClass(scheduler, threads)
         sim.run(max_ticks=max_ticks)
@@ -314,12 +314,12 @@ def compare_mixed_workload():
     print("혼합 워크로드 테스트: Mixed 50 스레드")
     print("=" * 70)
 
-    threads_base = generate_mixed(50, seed=42)
+    workload = WorkloadSpec.from_threads(generate_mixed(50, seed=42))
     max_ticks = 35000
 
     for name, SimClass in [("고정 Time Slice", FixedSliceSimulator),
                             ("가변 Time Slice", VariableSliceSimulator)]:
-        threads = deepcopy(threads_base)
+        threads = workload.instantiate()
         scheduler = CFSScheduler()
         sim = SimClass(scheduler, threads)
         sim.run(max_ticks=max_ticks)
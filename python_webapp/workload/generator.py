@@ -10,6 +10,7 @@ Level 2 특징:
 import random
 from typing import List, Optional
 from scheduler.thread import Thread, ThreadStatus
+from workload.spec import WorkloadSpec
 
 # 기본 설정
 DEFAULT_WORKLOAD = "mixed"
@@ -449,3 +450,13 @@ def generate_workload(workload_type: str, count: int, seed: Optional[int] = None
         raise ValueError(f"Unknown workload: {workload_type}")
 
     return generator(count, seed)
+
+
+def generate_workload_spec(workload_type: str, count: int, seed: Optional[int] = None) -> WorkloadSpec:
+    """
+    워크로드 명세 생성 (generate_workload와 같은 스레드, 불변)
+
+    여러 스케줄러/반복 실행에 같은 워크로드를 쓸 때 사용.
+    실행마다 spec.instantiate()로 새 스레드 리스트를 만듦.
+    """
+    return WorkloadSpec.from_threads(generate_workload(workload_type, count, seed))
@@ -0,0 +1,69 @@
+"""
+워크로드 명세 (불변)
+
+스레드별 입력값(도착, burst, I/O 주기/길이, nice)만 튜플로 보관.
+스케줄러 실행마다 instantiate()로 새 Thread 리스트를 만들어
+deepcopy(base_threads) 없이 깨끗한 초기 상태에서 시작.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+from scheduler.thread import Thread, ThreadStatus
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """스레드별 워크로드 입력값 (같은 인덱스 = 같은 스레드)"""
+    tids: Tuple[int, ...]
+    names: Tuple[str, ...]
+    arrival_times: Tuple[int, ...]
+    burst_times: Tuple[int, ...]
+    io_frequencies: Tuple[int, ...]
+    io_durations: Tuple[int, ...]
+    nices: Tuple[int, ...]
+
+    @classmethod
+    def from_threads(cls, threads: Iterable[Thread]) -> 'WorkloadSpec':
+        """
+        초기 상태 스레드 리스트 → 명세
+
+        입력값 필드만 가져옴 (remaining_time은 instantiate()에서 burst_time으로 초기화).
+        """
+        threads = list(threads)
+        return cls(
+            tids=tuple(t.tid for t in threads),
+            names=tuple(t.name for t in threads),
+            arrival_times=tuple(t.arrival_time for t in threads),
+            burst_times=tuple(t.burst_time for t in threads),
+            io_frequencies=tuple(t.io_frequency for t in threads),
+            io_durations=tuple(t.io_duration for t in threads),
+            nices=tuple(t.nice for t in threads),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    @property
+    def total_burst(self) -> int:
+        """총 CPU 작업량"""
+        return sum(self.burst_times)
+
+    def instantiate(self) -> List[Thread]:
+        """실행용 새 Thread 리스트 (매번 독립, 모든 런타임 상태가 초기값)"""
+        return [
+            Thread(
+                tid=tid,
+                name=name,
+                arrival_time=arrival,
+                burst_time=burst,
+                remaining_time=burst,
+                io_frequency=io_frequency,
+                io_duration=io_duration,
+                nice=nice,
+                status=ThreadStatus.READY,
+            )
+            for tid, name, arrival, burst, io_frequency, io_duration, nice in zip(
+                self.tids, self.names, self.arrival_times, self.burst_times,
+                self.io_frequencies, self.io_durations, self.nices,
+            )
+        ]